@@ -0,0 +1,153 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .SingleFlight import CallKey, SingleFlight, call_key
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "get_self_info": 300.0,
+    "get_user_info": 300.0,
+    "get_friend_list": 60.0,
+    "get_group_info": 300.0,
+    "get_group_member_info": 120.0,
+}
+
+GROUP_MEMBER_NOTICES = frozenset(
+    (
+        "group_member_increase",
+        "group_member_decrease",
+        "group_admin_set",
+        "group_admin_unset",
+    )
+)
+FRIEND_NOTICES = frozenset(("friend_increase", "friend_decrease"))
+
+
+def parse_ttls(spec: str) -> Dict[str, float]:
+    """解析 "get_group_info=60,get_user_info=0" 形式的覆盖配置，0 表示该接口不缓存"""
+    ttls = dict(DEFAULT_TTLS)
+    for item in (spec or "").split(","):
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        ttl = float(value)
+        if ttl > 0:
+            ttls[name] = ttl
+        else:
+            ttls.pop(name, None)
+    return ttls
+
+
+class ResultCache:
+    """
+    单账户的只读接口结果缓存
+
+    按接口设定有效期，条目数超出上限时按 LRU 淘汰；未命中的并发相同请求经 SingleFlight 合并为一次。
+    只缓存 status 为 ok 的响应，命中时返回的是缓存中的同一个对象，调用方不应修改。
+    请求进行中该键（或整个接口）被失效时，本次结果不写入缓存，避免把旧数据写回；其他键的请求不受影响。
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_size: int = 4096):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_size = max(1, int(max_size))
+        self._entries: "OrderedDict[CallKey, Tuple[float, dict]]" = OrderedDict()
+        self._flight = SingleFlight()
+        # 进行中的加载，值为加载期间是否被失效
+        self._loading: Dict[CallKey, bool] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, endpoint: str) -> bool:
+        return endpoint in self.ttls
+
+    def get(self, key: CallKey) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: CallKey, resp: dict):
+        self._entries[key] = (time.monotonic() + self.ttls[key[0]], resp)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def fetch(
+        self, endpoint: str, params: Dict[str, Any], call: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        key = call_key(endpoint, params)
+        resp = self.get(key)
+        if resp is not None:
+            self.hits += 1
+            return resp
+        self.misses += 1
+
+        async def load() -> dict:
+            try:
+                resp = await call()
+            finally:
+                stale = self._loading.pop(key, False)
+            if resp.get("status") == "ok" and not stale:
+                self.put(key, resp)
+            return resp
+
+        # 在发起加载的同一步登记，加载任务尚未开始运行时到来的失效也能被记下
+        if key not in self._flight:
+            self._loading[key] = False
+        return await self._flight.do(key, load)
+
+    def invalidate(self, endpoint: str, **params: Any) -> int:
+        if params:
+            key = call_key(endpoint, params)
+            if key in self._loading:
+                self._loading[key] = True
+            removed = 1 if self._entries.pop(key, None) else 0
+        else:
+            for key in self._loading:
+                if key[0] == endpoint:
+                    self._loading[key] = True
+            keys = [key for key in self._entries if key[0] == endpoint]
+            for key in keys:
+                del self._entries[key]
+            removed = len(keys)
+        self.invalidations += removed
+        return removed
+
+    def on_notice(self, event: Dict[str, Any]) -> int:
+        detail_type = event.get("detail_type", "")
+        group_id = event.get("group_id")
+        user_id = event.get("user_id")
+        removed = 0
+        if group_id and detail_type != "group_message_delete":
+            removed += self.invalidate("get_group_info", group_id=group_id)
+            if detail_type in GROUP_MEMBER_NOTICES and user_id:
+                removed += self.invalidate(
+                    "get_group_member_info", group_id=group_id, user_id=user_id
+                )
+        elif detail_type in FRIEND_NOTICES:
+            removed += self.invalidate("get_friend_list")
+            if user_id:
+                removed += self.invalidate("get_user_info", user_id=user_id)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "collapsed": self._flight.collapsed,
+            "in_flight": len(self._flight),
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,140 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .RateLimit import TokenBucket
+
+TRANSIENT_RETCODE_CLASSES = (33, 36)
+
+
+def is_transient(resp: Dict[str, Any]) -> bool:
+    retcode = resp.get("retcode")
+    return isinstance(retcode, int) and retcode // 1000 in TRANSIENT_RETCODE_CLASSES
+
+
+@dataclass
+class BatchTargetResult:
+    target_id: str
+    status: str = "pending"
+    retcode: int = 0
+    message_id: str = ""
+    message: str = ""
+    attempts: int = 0
+    response: Optional[Dict[str, Any]] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass
+class BatchResult:
+    total: int
+    results: Dict[str, BatchTargetResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results.values() if r.ok)
+
+    @property
+    def failed(self) -> List[BatchTargetResult]:
+        return [r for r in self.results.values() if not r.ok]
+
+    @property
+    def ok(self) -> bool:
+        return self.succeeded == self.total
+
+    def __getitem__(self, target_id: str) -> BatchTargetResult:
+        return self.results[target_id]
+
+    def __iter__(self):
+        return iter(self.results.values())
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+class BatchJob:
+    """
+    批量发送任务
+
+    最多 max_in_flight 个请求同时等待响应，每次发送（含重试）先从令牌桶取令牌；
+    超时(33xxx)、平台疲劳(36xxx)与连接异常视为可重试，按 retry_delay 指数退避。
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Dict[str, Any]]],
+        target_ids: Iterable[Any],
+        max_in_flight: int = 8,
+        bucket: Optional[TokenBucket] = None,
+        retries: int = 2,
+        retry_delay: float = 1.0,
+        on_progress: Optional[Callable[..., Any]] = None,
+        logger=None,
+    ):
+        self._send = send
+        self.target_ids = list(dict.fromkeys(str(t) for t in target_ids))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.bucket = bucket
+        self.retries = max(0, int(retries))
+        self.retry_delay = max(0.0, float(retry_delay))
+        self.on_progress = on_progress
+        self.logger = logger
+        self.result = BatchResult(total=len(self.target_ids))
+        self._done = 0
+
+    async def run(self) -> BatchResult:
+        start = time.monotonic()
+        targets = iter(self.target_ids)
+        workers = min(self.max_in_flight, len(self.target_ids))
+        try:
+            await asyncio.gather(*(self._worker(targets) for _ in range(workers)))
+        finally:
+            self.result.elapsed = time.monotonic() - start
+        return self.result
+
+    async def _worker(self, targets):
+        for target_id in targets:
+            item = self.result.results[target_id] = BatchTargetResult(target_id)
+            await self._deliver(item)
+            self._done += 1
+            await self._report(item)
+
+    async def _deliver(self, item: BatchTargetResult):
+        while True:
+            if self.bucket is not None:
+                await self.bucket.acquire()
+            item.attempts += 1
+            try:
+                resp = await self._send(item.target_id)
+                transient = is_transient(resp)
+            except (ConnectionError, OSError) as e:
+                resp = {"status": "failed", "retcode": 33000, "message": str(e)}
+                transient = True
+
+            item.response = resp
+            item.retcode = resp.get("retcode", 0)
+            item.message = resp.get("message", "")
+            item.message_id = str(resp.get("message_id", "") or "")
+            if resp.get("status") == "ok":
+                item.status = "ok"
+                return
+            item.status = "failed"
+            if not transient or item.attempts > self.retries:
+                return
+            await asyncio.sleep(self.retry_delay * 2 ** (item.attempts - 1))
+
+    async def _report(self, item: BatchTargetResult):
+        if self.on_progress is None:
+            return
+        try:
+            ret = self.on_progress(item, self._done, self.result.total)
+            if inspect.isawaitable(ret):
+                await ret
+        except Exception as e:
+            if self.logger is not None:
+                self.logger.warning(f"批量发送进度回调异常: {str(e)}")
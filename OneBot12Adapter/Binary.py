@@ -0,0 +1,104 @@
+import zlib
+from typing import Any, Dict, Tuple
+
+from .Codec import JsonCodec, PreEncoded, encode_action, encode_default
+
+BINARY_FORMATS = ("msgpack", "zlib", "gzip")
+WS_FRAME_FORMATS = ("auto", "text") + BINARY_FORMATS
+
+_BOM = b"\xef\xbb\xbf"
+
+_msgpack = None
+
+
+def _get_msgpack():
+    global _msgpack
+    if _msgpack is None:
+        import msgpack
+
+        _msgpack = msgpack
+    return _msgpack
+
+
+def _strip_json(data: bytes) -> bytes:
+    # UTF-8 BOM 与前导空白都不可能是 MessagePack 映射的开头，可放心去掉后再判断是否为 JSON
+    if data[:3] == _BOM:
+        data = data[3:]
+    return data.lstrip(b" \t\r\n")
+
+
+def sniff_format(data: bytes) -> str:
+    if _strip_json(data)[:1] in (b"{", b"["):
+        return "json"
+    if data[:2] == b"\x1f\x8b":
+        return "gzip"
+    if data[:1] == b"\x78":
+        return "zlib"
+    return "msgpack"
+
+
+def decode_binary(data: bytes, codec: JsonCodec) -> Tuple[str, Any]:
+    fmt = sniff_format(data)
+    if fmt == "json":
+        return fmt, codec.loads(_strip_json(data))
+    if fmt == "msgpack":
+        msgpack = _get_msgpack()
+        try:
+            return fmt, msgpack.unpackb(data, raw=False)
+        except (msgpack.UnpackException, ValueError, TypeError) as e:
+            raise ValueError(f"MessagePack 解码失败: {str(e)}") from e
+    try:
+        text = zlib.decompress(data, 47)
+    except zlib.error as e:
+        raise ValueError(f"{fmt} 解压失败: {str(e)}") from e
+    return fmt, codec.loads(_strip_json(text))
+
+
+def _map_header(size: int) -> bytes:
+    if size < 16:
+        return bytes((0x80 | size,))
+    if size < 0x10000:
+        return b"\xde" + size.to_bytes(2, "big")
+    return b"\xdf" + size.to_bytes(4, "big")
+
+
+def _packed(value: PreEncoded, codec: JsonCodec) -> bytes:
+    if value.packed is None:
+        value.packed = _get_msgpack().packb(codec.loads(value.text), use_bin_type=True)
+    return value.packed
+
+
+def _pack_action(codec: JsonCodec, payload: Dict[str, Any]) -> bytes:
+    packb = _get_msgpack().packb
+    params = payload.get("params")
+    if not isinstance(params, dict) or not any(
+        isinstance(value, PreEncoded) for value in params.values()
+    ):
+        return packb(payload, use_bin_type=True, default=encode_default)
+
+    parts = [_map_header(len(payload))]
+    for key, value in payload.items():
+        parts.append(packb(key))
+        if key != "params":
+            parts.append(packb(value, use_bin_type=True, default=encode_default))
+            continue
+        parts.append(_map_header(len(value)))
+        for name, item in value.items():
+            parts.append(packb(name))
+            parts.append(
+                _packed(item, codec)
+                if isinstance(item, PreEncoded)
+                else packb(item, use_bin_type=True, default=encode_default)
+            )
+    return b"".join(parts)
+
+
+def encode_binary_action(fmt: str, codec: JsonCodec, payload: Dict[str, Any]) -> bytes:
+    if fmt == "msgpack":
+        return _pack_action(codec, payload)
+    text = encode_action(codec, payload).encode("utf-8")
+    if fmt == "gzip":
+        import gzip
+
+        return gzip.compress(text, mtime=0)
+    return zlib.compress(text)
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple, Union
+
+CAPTURE_IN = 0
+CAPTURE_OUT = 1
+DIRECTIONS = ("in", "out")
+
+_MAGIC = b"OB12CAP1"
+# 时间戳、方向、是否二进制帧、账户名长度、帧长度
+_HEADER = struct.Struct("<dBBHI")
+# 写入线程积压的批次上限，超过后丢弃新帧，避免录制拖慢或撑爆适配器
+_MAX_PENDING = 64
+_FLUSH_RECORDS = 1024
+
+
+class CaptureRecord:
+    __slots__ = ("time", "direction", "account", "binary", "frame")
+
+    def __init__(
+        self, time: float, direction: str, account: str, binary: bool, frame: Union[str, bytes]
+    ):
+        self.time = time
+        self.direction = direction
+        self.account = account
+        self.binary = binary
+        self.frame = frame
+
+
+def capture_files(path: str) -> List[str]:
+    """按时间先后列出录制文件：最旧的轮转文件在前，当前文件在最后"""
+    files = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        files.append(f"{path}.{index}")
+        index += 1
+    files.reverse()
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_capture(path: str) -> Iterator[CaptureRecord]:
+    """依次读取 path 及其轮转文件中的帧；进程异常退出导致的文件末尾残缺记录会被忽略"""
+    import gzip
+
+    for name in capture_files(path):
+        with gzip.open(name, "rb") as f:
+            try:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    raise ValueError(f"{name} 不是流量录制文件")
+                while True:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    ts, direction, binary, name_len, frame_len = _HEADER.unpack(header)
+                    account = f.read(name_len).decode("utf-8")
+                    payload = f.read(frame_len)
+                    if len(payload) < frame_len:
+                        break
+                    yield CaptureRecord(
+                        ts,
+                        DIRECTIONS[direction],
+                        account,
+                        bool(binary),
+                        payload if binary else payload.decode("utf-8"),
+                    )
+            except (EOFError, OSError):
+                continue
+
+
+class Capture:
+    """
+    流量录制
+
+    按收发顺序记录原始帧与时间戳，写入 gzip 压缩的二进制日志；压缩后超过 max_bytes 时轮转，保留 backups 个旧文件。
+    编码、压缩与写盘都在专用线程中进行，事件循环只把帧追加到缓冲区；写入线程积压过多时丢弃新帧并计数。
+    """
+
+    __slots__ = (
+        "path",
+        "max_bytes",
+        "backups",
+        "interval",
+        "records",
+        "bytes",
+        "dropped",
+        "rotations",
+        "_buffer",
+        "_scheduled",
+        "_pending",
+        "_executor",
+        "_raw",
+        "_file",
+        "_closed",
+    )
+
+    def __init__(
+        self, path: str, max_bytes: int = 64 * 2**20, backups: int = 5, interval: float = 0.5
+    ):
+        self.path = path
+        self.max_bytes = max(1, int(max_bytes))
+        self.backups = max(0, int(backups))
+        self.interval = max(0.0, float(interval))
+        self.records = 0
+        self.bytes = 0
+        self.dropped = 0
+        self.rotations = 0
+        self._buffer: List[Tuple[float, int, str, Any, bool]] = []
+        self._scheduled = False
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="onebot12-capture")
+        self._raw = None
+        self._file = None
+        self._closed = False
+
+    def record(self, direction: int, account: str, frame: Union[str, bytes], binary: bool = False):
+        if self._closed:
+            return
+        if self._pending >= _MAX_PENDING:
+            self.dropped += 1
+            return
+        self._buffer.append((time.time(), direction, account, frame, binary))
+        if len(self._buffer) >= _FLUSH_RECORDS:
+            self._flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_later(self.interval, self._flush)
+
+    def _flush(self):
+        self._scheduled = False
+        if not self._buffer or self._closed:
+            return
+        batch, self._buffer = self._buffer, []
+        self._pending += 1
+        future = self._executor.submit(self._write, batch)
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._written))
+
+    def _written(self):
+        self._pending -= 1
+
+    def _open(self):
+        import gzip
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._raw = open(self.path, "ab")
+        # 续写已有文件时追加新的 gzip 成员，读取时各成员首尾相连，文件头只写一次
+        empty = self._raw.tell() == 0
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="ab", compresslevel=3)
+        if empty:
+            self._file.write(_MAGIC)
+
+    def _rotate(self):
+        self._file.close()
+        self._raw.close()
+        self._file = self._raw = None
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                if os.path.exists(f"{self.path}.{index}"):
+                    os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.rotations += 1
+
+    def _write(self, batch: List[Tuple[float, int, str, Any, bool]]):
+        if self._file is None:
+            self._open()
+        pack = _HEADER.pack
+        parts = []
+        size = 0
+        for ts, direction, account, frame, binary in batch:
+            name = account.encode("utf-8")
+            data = frame.encode("utf-8") if isinstance(frame, str) else frame
+            parts.append(pack(ts, direction, 1 if binary else 0, len(name), len(data)))
+            parts.append(name)
+            parts.append(data)
+            size += len(data)
+        # 整批一次压缩，zlib 处理大块数据时释放 GIL，减少与事件循环争抢；
+        # 同步刷新，进程异常退出时已写入的批次仍可读取
+        self._file.write(b"".join(parts))
+        self._file.flush()
+        self.records += len(batch)
+        self.bytes += size
+        if self._raw.tell() >= self.max_bytes:
+            self._rotate()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "records": self.records,
+            "bytes": self.bytes,
+            "buffered": len(self._buffer),
+            "dropped": self.dropped,
+            "rotations": self.rotations,
+        }
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        batch, self._buffer = self._buffer, []
+        if batch:
+            self._executor.submit(self._write, batch)
+        self._executor.shutdown(wait=True)
+        if self._file is not None:
+            self._file.close()
+            self._raw.close()
+            self._file = self._raw = None
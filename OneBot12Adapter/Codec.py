@@ -0,0 +1,139 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+CODEC_NAMES = ("auto", "orjson", "msgspec", "ujson", "json")
+
+
+class JsonCodec:
+    """帧编解码器，loads 接受 str/bytes，解析失败统一抛出 ValueError"""
+
+    __slots__ = ("name", "loads", "dumps")
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[str, bytes]], Any],
+        dumps: Callable[[Any], str],
+    ):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+class PreEncoded:
+    """
+    已序列化的 JSON 片段，编码请求时原样拼入 params，供批量发送共享同一份内容
+
+    packed 缓存同一内容的 MessagePack 编码，由二进制帧首次发送时填充。
+    """
+
+    __slots__ = ("text", "packed")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.packed: Optional[bytes] = None
+
+    def __repr__(self) -> str:
+        return f"PreEncoded({self.text!r})"
+
+
+def encode_default(obj: Any) -> Any:
+    """编解码器无法直接编码的对象（如 Message / Segment）按 to_wire() 转换后编码"""
+    to_wire = getattr(obj, "to_wire", None)
+    if to_wire is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_wire()
+
+
+def _make_orjson() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=encode_default).decode("utf-8")
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _make_msgspec() -> JsonCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder(enc_hook=encode_default)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(obj: Any) -> str:
+        return encoder.encode(obj).decode("utf-8")
+
+    return JsonCodec("msgspec", loads, dumps)
+
+
+def _make_ujson() -> JsonCodec:
+    import ujson
+
+    def dumps(obj: Any) -> str:
+        return ujson.dumps(obj, ensure_ascii=False, default=encode_default)
+
+    return JsonCodec("ujson", ujson.loads, dumps)
+
+
+def _make_json() -> JsonCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=encode_default)
+    return JsonCodec("json", json.loads, encoder.encode)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _make_orjson,
+    "msgspec": _make_msgspec,
+    "ujson": _make_ujson,
+    "json": _make_json,
+}
+_cache: Dict[str, JsonCodec] = {}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    name = (name or "auto").lower()
+    codec = _cache.get(name)
+    if codec is not None:
+        return codec
+
+    if name == "auto":
+        candidates = ("orjson", "msgspec", "ujson", "json")
+    elif name in _FACTORIES:
+        candidates = (name,)
+    else:
+        raise ValueError(f"未知的JSON编解码器: {name}")
+
+    for candidate in candidates:
+        try:
+            codec = _FACTORIES[candidate]()
+            break
+        except ImportError:
+            if name != "auto":
+                raise
+    _cache[name] = codec
+    return codec
+
+
+def encode_action(codec: JsonCodec, payload: Dict[str, Any]) -> str:
+    params = payload.get("params")
+    if not isinstance(params, dict) or not any(
+        isinstance(value, PreEncoded) for value in params.values()
+    ):
+        return codec.dumps(payload)
+
+    dumps = codec.dumps
+    body = ",".join(
+        f"{dumps(key)}:{value.text if isinstance(value, PreEncoded) else dumps(value)}"
+        for key, value in params.items()
+    )
+    head = dumps({key: value for key, value in payload.items() if key != "params"})
+    separator = "," if len(head) > 2 else ""
+    return f'{head[:-1]}{separator}"params":{{{body}}}}}'
@@ -1,20 +1,74 @@
 import asyncio
-import json
+import base64
+import contextlib
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from ErisPulse.Core import client, router
 from ErisPulse.Core.Bases.adapter import BaseAdapter
 from ErisPulse.Core.Bases.websocket import WSMessage
 from ErisPulse.runtime.config_schema import BotAccountConfig
 
+from .ApiCache import ResultCache, parse_ttls
+from .Batch import BatchJob, BatchResult, is_transient
+from .Binary import BINARY_FORMATS, WS_FRAME_FORMATS, decode_binary, encode_binary_action
+from .Capture import CAPTURE_IN, CAPTURE_OUT, Capture
+from .Codec import CODEC_NAMES, JsonCodec, PreEncoded, encode_action, get_codec
+from .Dedup import RecentIds
+from .Dispatcher import (
+    FRAME_HEARTBEAT,
+    FRAME_RESPONSE,
+    OVERFLOW_POLICIES,
+    EventDispatcher,
+    classify_data,
+    classify_frame,
+)
+from .FileCache import FileIdCache
+from .Filter import EventFilter
+from .Http import HTTP_MODES, HttpConnection, bearer_token
+from .Liveness import LivenessTracker
+from .Message import Message, Segment
+from .Metrics import AccountMetrics, render_prometheus
+from .Offload import (
+    OFFLOAD_EXECUTORS,
+    LoopLagMonitor,
+    Offloader,
+    b64encode_text,
+    decode_frame,
+    encode_frame,
+    exceeds,
+    make_executor,
+)
+from .Outbox import Outbox, OutboxEntry
+from .Pending import ConnectionLost
+from .Pool import ConnectionPool, PooledConnection
+from .RateLimit import TokenBucket
+from .RawEvent import RAW_EVENT_MODES, RawEventView
+from .Reconnect import Backoff, is_idempotent
+from .Scheduler import OutboundScheduler, action_priority, target_key
+from .SingleFlight import CallCoalescer, parse_endpoints
+from .Upload import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_INLINE_LIMIT,
+    FileUploader,
+    MediaSource,
+    is_upload_source,
+    read_source,
+    source_sha256,
+    source_size,
+    spooled,
+)
+
+DETAIL_TYPES = {"user": "private", "group": "group"}
+
 
 @dataclass
 class OneBot12AccountConfig(BotAccountConfig):
     mode: str = field(
         default="server",
         metadata={
-            "description": "连接模式: server(被动) 或 client(主动)",
+            "description": "连接模式: server(被动WS) / client(主动WS) / http(动作经HTTP POST发送) / webhook(事件由实现端POST推送，动作经HTTP发送)",
             "required": False,
             "ui": {
                 "widget": "select",
@@ -23,6 +77,8 @@ class OneBot12AccountConfig(BotAccountConfig):
                 "options": [
                     {"label": "Server", "value": "server"},
                     {"label": "Client", "value": "client"},
+                    {"label": "HTTP", "value": "http"},
+                    {"label": "Webhook", "value": "webhook"},
                 ],
             },
         },
@@ -30,7 +86,7 @@ class OneBot12AccountConfig(BotAccountConfig):
     server_path: Optional[str] = field(
         default="/onebot12",
         metadata={
-            "description": "Server模式 WebSocket 路径",
+            "description": "Server模式 WebSocket 路径 / Webhook模式事件推送路径",
             "required": False,
             "ui": {"widget": "text", "group": "server", "order": 3},
         },
@@ -38,7 +94,7 @@ class OneBot12AccountConfig(BotAccountConfig):
     server_token: Optional[str] = field(
         default="",
         metadata={
-            "description": "Server模式认证Token",
+            "description": "Server/Webhook模式认证Token",
             "required": False,
             "secret": True,
             "ui": {"widget": "password", "group": "server", "order": 4},
@@ -55,7 +111,7 @@ class OneBot12AccountConfig(BotAccountConfig):
     client_token: Optional[str] = field(
         default="",
         metadata={
-            "description": "Client模式认证Token",
+            "description": "Client/HTTP模式认证Token",
             "required": False,
             "secret": True,
             "ui": {"widget": "password", "group": "client", "order": 6},
@@ -69,6 +125,503 @@ class OneBot12AccountConfig(BotAccountConfig):
             "ui": {"widget": "text", "group": "advanced", "order": 7},
         },
     )
+    json_codec: str = field(
+        default="auto",
+        metadata={
+            "description": "JSON编解码器，auto 时按 orjson > msgspec > ujson > json 自动选择已安装的实现",
+            "required": False,
+            "ui": {
+                "widget": "select",
+                "group": "performance",
+                "order": 8,
+                "options": [{"label": name, "value": name} for name in CODEC_NAMES],
+            },
+        },
+    )
+    raw_event: str = field(
+        default="copy",
+        metadata={
+            "description": "事件 onebot12_raw 字段: copy(完整拷贝，普通 dict) / view(只读视图，不拷贝，非 dict) / off(不附带)",
+            "required": False,
+            "ui": {
+                "widget": "select",
+                "group": "performance",
+                "order": 9,
+                "options": [
+                    {"label": "Copy", "value": "copy"},
+                    {"label": "View", "value": "view"},
+                    {"label": "Off", "value": "off"},
+                ],
+            },
+        },
+    )
+    upload_chunk_size: int = field(
+        default=DEFAULT_CHUNK_SIZE,
+        metadata={
+            "description": "分片上传 (upload_file_fragmented) 的单片大小，单位字节",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 10},
+        },
+    )
+    upload_inline_limit: int = field(
+        default=DEFAULT_INLINE_LIMIT,
+        metadata={
+            "description": "媒体不超过该大小（字节）时以 file_base64 内联发送，超过则先分片上传再以 file_id 发送",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 11},
+        },
+    )
+    upload_cache: bool = field(
+        default=False,
+        metadata={
+            "description": "按内容哈希缓存上传得到的 file_id，重复发送同一媒体时直接引用 file_id",
+            "required": False,
+            "ui": {"widget": "switch", "group": "performance", "order": 12},
+        },
+    )
+    upload_cache_size: int = field(
+        default=1024,
+        metadata={
+            "description": "file_id 缓存最大条目数（LRU 淘汰）",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 13},
+        },
+    )
+    upload_cache_ttl: int = field(
+        default=86400,
+        metadata={
+            "description": "file_id 缓存有效期（秒），0 表示不过期",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 14},
+        },
+    )
+    upload_cache_file: str = field(
+        default="",
+        metadata={
+            "description": "file_id 缓存持久化文件路径，留空则仅保存在内存",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 15},
+        },
+    )
+    dispatch_workers: int = field(
+        default=4,
+        metadata={
+            "description": "事件分发并发数（同一会话内保持顺序）",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 16},
+        },
+    )
+    dispatch_queue_size: int = field(
+        default=1000,
+        metadata={
+            "description": "事件分发队列容量",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 17},
+        },
+    )
+    dispatch_overflow: str = field(
+        default="drop_oldest",
+        metadata={
+            "description": "队列满时的策略: drop_oldest(优先丢弃元事件) / drop_new(丢弃新事件) / block(阻塞读取，处理器内等待API响应时可能卡至超时)",
+            "required": False,
+            "ui": {
+                "widget": "select",
+                "group": "performance",
+                "order": 18,
+                "options": [
+                    {"label": "Drop Oldest", "value": "drop_oldest"},
+                    {"label": "Drop New", "value": "drop_new"},
+                    {"label": "Block", "value": "block"},
+                ],
+            },
+        },
+    )
+    batch_max_in_flight: int = field(
+        default=8,
+        metadata={
+            "description": "Batch 批量发送时同时等待响应的最大请求数",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 19},
+        },
+    )
+    batch_rate: float = field(
+        default=0.0,
+        metadata={
+            "description": "Batch 批量发送速率（条/秒，令牌桶，同一账户的所有批量任务共享），0 表示不限速",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 20},
+        },
+    )
+    batch_retries: int = field(
+        default=2,
+        metadata={
+            "description": "Batch 中单个目标遇到超时/网络类错误时的最大重试次数",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 21},
+        },
+    )
+    batch_retry_delay: float = field(
+        default=1.0,
+        metadata={
+            "description": "Batch 重试的初始退避时间（秒），每次重试翻倍",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 22},
+        },
+    )
+    send_rate: float = field(
+        default=0.0,
+        metadata={
+            "description": "账户全局 API 调用速率（次/秒，令牌桶），超出时按 回复 > 管理 > 批量 的优先级排队，0 表示不限速",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 23},
+        },
+    )
+    send_burst: int = field(
+        default=0,
+        metadata={
+            "description": "全局令牌桶容量（允许的瞬时突发数），0 表示与 send_rate 相同",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 24},
+        },
+    )
+    send_target_rate: float = field(
+        default=0.0,
+        metadata={
+            "description": "单个群/用户的发消息速率（条/秒），0 表示不限速",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 25},
+        },
+    )
+    send_target_burst: int = field(
+        default=0,
+        metadata={
+            "description": "单目标令牌桶容量，0 表示与 send_target_rate 相同",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 26},
+        },
+    )
+    metrics: bool = field(
+        default=False,
+        metadata={
+            "description": "统计收发帧数/字节数、解码耗时、事件速率、各 API 调用延迟与超时、重连次数",
+            "required": False,
+            "ui": {"widget": "switch", "group": "advanced", "order": 27},
+        },
+    )
+    metrics_path: str = field(
+        default="",
+        metadata={
+            "description": "Prometheus 指标 HTTP 路径（GET，包含所有开启 metrics 的账户），留空则不注册",
+            "required": False,
+            "ui": {"widget": "text", "group": "advanced", "order": 28},
+        },
+    )
+    reconnect_initial_delay: float = field(
+        default=0.5,
+        metadata={
+            "description": "Client模式断线后首次重连等待时间（秒）",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 29},
+        },
+    )
+    reconnect_max_delay: float = field(
+        default=30.0,
+        metadata={
+            "description": "重连等待时间上限（秒）；连接保持超过该时长后断开，退避从头开始",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 30},
+        },
+    )
+    reconnect_multiplier: float = field(
+        default=2.0,
+        metadata={
+            "description": "每次重连失败后等待时间的增长倍数",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 31},
+        },
+    )
+    reconnect_jitter: float = field(
+        default=0.2,
+        metadata={
+            "description": "重连等待时间的随机抖动比例（0~1），避免多个账户同时重连",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 32},
+        },
+    )
+    replay_idempotent: bool = field(
+        default=False,
+        metadata={
+            "description": "连接断开时，get_* 等幂等请求在 replay_window 内等待重连后自动重发",
+            "required": False,
+            "ui": {"widget": "switch", "group": "advanced", "order": 33},
+        },
+    )
+    replay_window: float = field(
+        default=10.0,
+        metadata={
+            "description": "幂等请求等待重连的最长时间（秒）",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 34},
+        },
+    )
+    heartbeat_miss_limit: int = field(
+        default=3,
+        metadata={
+            "description": "连续多少个心跳间隔（取自 meta.heartbeat 的 interval）未收到任何数据即判定连接失效并重连/断开，0 表示不检测",
+            "required": False,
+            "ui": {"widget": "number", "group": "connection", "order": 35},
+        },
+    )
+    heartbeat_timeout: float = field(
+        default=0.0,
+        metadata={
+            "description": "实现端未发送心跳时，连续多少秒未收到任何数据即判定连接失效，0 表示仅依据心跳判断",
+            "required": False,
+            "ui": {"widget": "number", "group": "connection", "order": 36},
+        },
+    )
+    ws_ping_interval: float = field(
+        default=30.0,
+        metadata={
+            "description": "Client模式 WebSocket ping 间隔（秒），超时未收到 pong 时断开并重连，0 表示不发送",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 37},
+        },
+    )
+    pool_size: int = field(
+        default=1,
+        metadata={
+            "description": "每个账户的连接数：Client模式同时建立的连接数 / Server模式允许同时接入的连接数（超出时关闭最早的连接）；大于 1 时 API 调用分摊到未完成请求最少的连接",
+            "required": False,
+            "ui": {"widget": "number", "group": "connection", "order": 38},
+        },
+    )
+    http_url: Optional[str] = field(
+        default="http://127.0.0.1:5700",
+        metadata={
+            "description": "HTTP/Webhook模式动作请求地址（实现端的 HTTP 服务），Webhook模式留空则只接收事件",
+            "required": False,
+            "ui": {"widget": "text", "group": "http", "order": 39},
+        },
+    )
+    http_poll_timeout: int = field(
+        default=0,
+        metadata={
+            "description": "HTTP模式通过 get_latest_events 长轮询拉取事件时单次等待的秒数（应小于 API 超时 30 秒），0 表示不拉取事件",
+            "required": False,
+            "ui": {"widget": "number", "group": "http", "order": 40},
+        },
+    )
+    ws_frame_format: str = field(
+        default="auto",
+        metadata={
+            "description": "WebSocket 动作帧格式: auto(收到二进制帧后改用相同格式) / text(始终文本 JSON) / msgpack / zlib / gzip(压缩 JSON)；无论如何设置都接收任意格式的二进制帧",
+            "required": False,
+            "ui": {
+                "widget": "select",
+                "group": "performance",
+                "order": 41,
+                "options": [{"label": name, "value": name} for name in WS_FRAME_FORMATS],
+            },
+        },
+    )
+    api_cache: bool = field(
+        default=False,
+        metadata={
+            "description": "缓存 get_self_info / get_user_info / get_friend_list / get_group_info / get_group_member_info 的成功结果，并合并并发的相同请求；收到成员变动等通知事件时自动失效",
+            "required": False,
+            "ui": {"widget": "switch", "group": "performance", "order": 42},
+        },
+    )
+    api_cache_size: int = field(
+        default=4096,
+        metadata={
+            "description": "接口结果缓存最大条目数（LRU 淘汰）",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 43},
+        },
+    )
+    api_cache_ttl: str = field(
+        default="",
+        metadata={
+            "description": "按接口覆盖缓存有效期（秒），如 get_group_info=60,get_user_info=0；0 表示该接口不缓存，也可加入其他只读接口",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 44},
+        },
+    )
+    coalesce_calls: bool = field(
+        default=False,
+        metadata={
+            "description": "参数相同的并发只读请求（get_*_info / get_*_list 等白名单接口）只发送一次，共享同一响应",
+            "required": False,
+            "ui": {"widget": "switch", "group": "performance", "order": 45},
+        },
+    )
+    coalesce_endpoints: str = field(
+        default="",
+        metadata={
+            "description": "调整请求合并白名单，逗号分隔，如 get_file,-get_status；以 - 开头表示从默认白名单移除",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 46},
+        },
+    )
+    filter_types: str = field(
+        default="",
+        metadata={
+            "description": "在标准化与分发之前丢弃的事件类型，逗号分隔，如 meta.heartbeat,notice.group_member_increase；只写 type 表示丢弃整类（心跳仍用于连接保活检测）",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 47},
+        },
+    )
+    filter_groups: str = field(
+        default="",
+        metadata={
+            "description": "群名单，逗号分隔，如 20001,20002,-20003；填写普通项后只处理名单内群的事件，以 - 开头的群始终丢弃",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 48},
+        },
+    )
+    filter_users: str = field(
+        default="",
+        metadata={
+            "description": "用户名单，格式同 filter_groups，作用于所有带 user_id 的事件",
+            "required": False,
+            "ui": {"widget": "text", "group": "performance", "order": 49},
+        },
+    )
+    filter_self: bool = field(
+        default=False,
+        metadata={
+            "description": "丢弃机器人自身发送的消息事件",
+            "required": False,
+            "ui": {"widget": "switch", "group": "performance", "order": 50},
+        },
+    )
+    message_model: bool = field(
+        default=False,
+        metadata={
+            "description": "为消息事件附加 onebot12_message（Message 对象），首次访问时才解析消息段，纯文本与 @ 列表按需计算并缓存",
+            "required": False,
+            "ui": {"widget": "switch", "group": "performance", "order": 51},
+        },
+    )
+    dedup_size: int = field(
+        default=4096,
+        metadata={
+            "description": "事件去重窗口容量：记住最近多少个事件 id，重连后或多个连接重复推送的事件只处理一次；0 表示不去重",
+            "required": False,
+            "ui": {"widget": "number", "group": "connection", "order": 52},
+        },
+    )
+    dedup_window: float = field(
+        default=300.0,
+        metadata={
+            "description": "事件去重时间窗口（秒），超过该时间的 id 不再视为重复；0 表示只按容量淘汰",
+            "required": False,
+            "ui": {"widget": "number", "group": "connection", "order": 53},
+        },
+    )
+    outbox_file: str = field(
+        default="",
+        metadata={
+            "description": "持久化出站队列（SQLite）文件路径：以 Send.Durable()、idempotency_key 或 call_api(_durable=True) 发送的消息先落盘再在连接可用时发送，断线或重启后不丢消息（至少一次）；留空则不启用",
+            "required": False,
+            "ui": {"widget": "text", "group": "advanced", "order": 54},
+        },
+    )
+    outbox_batch: int = field(
+        default=32,
+        metadata={
+            "description": "出站队列每批取出的条数，不同目标并发发送，同一目标按入队顺序逐条发送",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 55},
+        },
+    )
+    outbox_max_attempts: int = field(
+        default=10,
+        metadata={
+            "description": "出站队列单条消息最多尝试次数，超过后标记为失败（dead）不再重试",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 56},
+        },
+    )
+    outbox_retry_initial: float = field(
+        default=1.0,
+        metadata={
+            "description": "出站队列重试的初始间隔（秒），每次失败后翻倍",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 57},
+        },
+    )
+    outbox_retry_max: float = field(
+        default=300.0,
+        metadata={
+            "description": "出站队列重试的最大间隔（秒）",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 58},
+        },
+    )
+    offload_threshold: int = field(
+        default=0,
+        metadata={
+            "description": "不小于该大小（字节）的入站帧解码、动作编码与媒体 base64 编码交给工作池执行，避免阻塞事件循环；0 表示不卸载",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 59},
+        },
+    )
+    offload_executor: str = field(
+        default="thread",
+        metadata={
+            "description": "卸载使用的工作池：thread（线程池）或 process（进程池，JSON 编解码不受 GIL 限制）",
+            "required": False,
+            "ui": {
+                "widget": "select",
+                "group": "performance",
+                "order": 60,
+                "options": [{"label": name, "value": name} for name in OFFLOAD_EXECUTORS],
+            },
+        },
+    )
+    offload_workers: int = field(
+        default=2,
+        metadata={
+            "description": "卸载工作池的线程/进程数，相同类型与数量的账户共享同一个工作池",
+            "required": False,
+            "ui": {"widget": "number", "group": "performance", "order": 61},
+        },
+    )
+    capture_file: str = field(
+        default="",
+        metadata={
+            "description": "流量录制文件路径：收发的原始帧连同时间戳写入 gzip 压缩日志，可用 benchmarks/replay.py 离线回放；留空则不启用",
+            "required": False,
+            "ui": {"widget": "text", "group": "advanced", "order": 62},
+        },
+    )
+    capture_max_bytes: int = field(
+        default=64 * 2**20,
+        metadata={
+            "description": "录制文件压缩后达到该字节数时轮转（按批写入，文件可能略超该大小）",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 63},
+        },
+    )
+    capture_backups: int = field(
+        default=5,
+        metadata={
+            "description": "保留的轮转录制文件数，超出的最旧文件被删除",
+            "required": False,
+            "ui": {"widget": "number", "group": "advanced", "order": 64},
+        },
+    )
+    connect_concurrency: int = field(
+        default=16,
+        metadata={
+            "description": "启动时 Client模式连接同时进行的握手数上限，所有 Client 账户共用一个上限，取各账户中最小的值；0 表示不限",
+            "required": False,
+            "ui": {"widget": "number", "group": "client", "order": 65},
+        },
+    )
 
 
 class OneBot12Adapter(BaseAdapter):
@@ -77,45 +630,33 @@ class OneBot12Adapter(BaseAdapter):
     class Send(BaseAdapter.Send):
         def __init__(self, adapter, target_type=None, target_id=None, account_id=None):
             super().__init__(adapter, target_type, target_id, account_id)
+            self._durable = False
 
-        def Text(self, text: str):
-            return self.Raw_ob12([{"type": "text", "data": {"text": text}}])
+        def _reset_modifiers(self):
+            self._at_user_ids = []
+            self._reply_message_id = None
+            self._at_all = False
+            self._durable = False
 
-        def Image(self, file: Union[str, bytes], filename: str = "image.png"):
-            data = {}
-            if isinstance(file, bytes):
-                import base64
+        def Durable(self):
+            """经持久化出站队列发送（需配置 outbox_file），返回 outbox_id 而不是 message_id"""
+            self._durable = True
+            return self
 
-                data["file_base64"] = base64.b64encode(file).decode("utf-8")
-                data["file_name"] = filename
-            else:
-                data["file_id"] = file
-            return self.Raw_ob12([{"type": "image", "data": data}])
+        def Text(self, text: str):
+            return self.Raw_ob12([{"type": "text", "data": {"text": text}}])
 
-        def Audio(self, file: Union[str, bytes], filename: str = "audio.ogg"):
-            data = {}
-            if isinstance(file, bytes):
-                import base64
+        def Image(self, file: MediaSource, filename: str = "image.png"):
+            return self._media("image", file, filename)
 
-                data["file_base64"] = base64.b64encode(file).decode("utf-8")
-                data["file_name"] = filename
-            else:
-                data["file_id"] = file
-            return self.Raw_ob12([{"type": "audio", "data": data}])
+        def Audio(self, file: MediaSource, filename: str = "audio.ogg"):
+            return self._media("audio", file, filename)
 
-        def Voice(self, file: Union[str, bytes], filename: str = "voice.ogg"):
+        def Voice(self, file: MediaSource, filename: str = "voice.ogg"):
             return self.Audio(file, filename)
 
-        def Video(self, file: Union[str, bytes], filename: str = "video.mp4"):
-            data = {}
-            if isinstance(file, bytes):
-                import base64
-
-                data["file_base64"] = base64.b64encode(file).decode("utf-8")
-                data["file_name"] = filename
-            else:
-                data["file_id"] = file
-            return self.Raw_ob12([{"type": "video", "data": data}])
+        def Video(self, file: MediaSource, filename: str = "video.mp4"):
+            return self._media("video", file, filename)
 
         def Location(
             self, latitude: float, longitude: float, title: str = "", content: str = ""
@@ -130,9 +671,32 @@ class OneBot12Adapter(BaseAdapter):
         def Sticker(self, file_id: str):
             return self.Raw_ob12([{"type": "sticker", "data": {"file_id": file_id}}])
 
-        def Raw_ob12(self, message: Union[Dict, List[Dict]], **kwargs):
-            if isinstance(message, dict):
+        def Raw_ob12(
+            self,
+            message: Union[Dict, Segment, Message, List[Union[Dict, Segment]]],
+            idempotency_key: Optional[str] = None,
+            **kwargs,
+        ):
+            # 幂等键只对出站队列有意义，传入即视为要求持久化发送
+            durable = self._durable or idempotency_key is not None
+            account_id, params = self._build_send_message(message, **kwargs)
+            return asyncio.create_task(
+                self._adapter.call_api(
+                    endpoint="send_message",
+                    _account_id=account_id,
+                    _durable=durable,
+                    _idempotency_key=idempotency_key,
+                    **params,
+                )
+            )
+
+        def _build_send_message(
+            self, message: Union[Dict, Segment, Message, List[Union[Dict, Segment]]], **kwargs
+        ):
+            if isinstance(message, (dict, Segment)):
                 message = [message]
+            elif isinstance(message, Message):
+                message = message.segments
 
             segments = self._apply_modifiers(message)
             self._reset_modifiers()
@@ -141,13 +705,7 @@ class OneBot12Adapter(BaseAdapter):
             target_type = kwargs.get("target_type") or ctx["target_type"]
             target_id = kwargs.get("target_id") or ctx["target_id"]
             account_id = kwargs.get("account_id") or ctx.get("account_id")
-            detail_type = (
-                "private"
-                if target_type == "user"
-                else "group"
-                if target_type == "group"
-                else kwargs.get("detail_type")
-            )
+            detail_type = DETAIL_TYPES.get(target_type) or kwargs.get("detail_type")
 
             extra_kwargs = {
                 k: v
@@ -155,17 +713,61 @@ class OneBot12Adapter(BaseAdapter):
                 if k not in ("target_type", "target_id", "account_id", "detail_type")
             }
 
-            return asyncio.create_task(
-                self._adapter.call_api(
-                    endpoint="send_message",
-                    _account_id=account_id,
-                    detail_type=detail_type,
-                    user_id=target_id if target_type == "user" else None,
-                    group_id=target_id if target_type == "group" else None,
-                    content=segments,
-                    **extra_kwargs,
-                )
+            return account_id, {
+                "detail_type": detail_type,
+                "user_id": target_id if target_type == "user" else None,
+                "group_id": target_id if target_type == "group" else None,
+                "content": segments,
+                **extra_kwargs,
+            }
+
+        def _media(self, seg_type: str, file: MediaSource, filename: str):
+            if not is_upload_source(file):
+                return self.Raw_ob12([{"type": seg_type, "data": {"file_id": file}}])
+
+            account_name, account = self._adapter._resolve_account(
+                self.send_context.get("account_id")
             )
+            inline_limit = -1 if account.upload_cache else account.upload_inline_limit
+            offloader = self._adapter._get_offloader(account_name, account)
+            if (
+                isinstance(file, (bytes, bytearray, memoryview))
+                and len(file) <= inline_limit
+                and (offloader is None or len(file) < offloader.threshold)
+            ):
+                data = {
+                    "file_base64": base64.b64encode(file).decode("utf-8"),
+                    "file_name": filename,
+                }
+                return self.Raw_ob12([{"type": seg_type, "data": data}])
+
+            data: Dict[str, Any] = {}
+            durable = self._durable
+            account_id, params = self._build_send_message([{"type": seg_type, "data": data}])
+
+            async def _upload_and_send():
+                size = await source_size(file)
+                if size is not None and size <= inline_limit:
+                    content = await read_source(file)
+                    if offloader is not None:
+                        data["file_base64"] = await offloader.run(
+                            "base64", b64encode_text, content
+                        )
+                    else:
+                        data["file_base64"] = await asyncio.to_thread(
+                            lambda: base64.b64encode(content).decode("utf-8")
+                        )
+                    data["file_name"] = filename
+                else:
+                    resp = await self._adapter.upload_file(file, filename, _account_id=account_id)
+                    if resp.get("status") != "ok":
+                        return resp
+                    data["file_id"] = resp["data"]["file_id"]
+                return await self._adapter.call_api(
+                    endpoint="send_message", _account_id=account_id, _durable=durable, **params
+                )
+
+            return asyncio.create_task(_upload_and_send())
 
         def Recall(self, message_id: Union[str, int]):
             ctx = self.send_context
@@ -193,53 +795,544 @@ class OneBot12Adapter(BaseAdapter):
         def Batch(
             self,
             target_ids: List[str],
-            message: Union[str, List[Dict]],
+            message: Union[str, Dict, Segment, Message, List[Union[Dict, Segment]]],
             target_type: str = "user",
-        ):
-            ctx = self.send_context
-            tasks = []
-            for target_id in target_ids:
-                if isinstance(message, str):
-                    task = self._adapter.call_api(
-                        endpoint="send_message",
-                        _account_id=ctx.get("account_id"),
-                        detail_type=target_type,
-                        user_id=target_id if target_type == "user" else None,
-                        group_id=target_id if target_type == "group" else None,
-                        content=[{"type": "text", "data": {"text": message}}],
-                    )
-                else:
-                    task = self._adapter.call_api(
-                        endpoint="send_message",
-                        _account_id=ctx.get("account_id"),
-                        detail_type=target_type,
-                        user_id=target_id if target_type == "user" else None,
-                        group_id=target_id if target_type == "group" else None,
-                        content=message,
-                    )
-                tasks.append(task)
-            return tasks
+            on_progress: Optional[Callable[..., Any]] = None,
+            max_in_flight: Optional[int] = None,
+            rate: Optional[float] = None,
+            idempotency_key: Optional[str] = None,
+        ) -> "asyncio.Task[BatchResult]":
+            if isinstance(message, str):
+                message = [{"type": "text", "data": {"text": message}}]
+            elif isinstance(message, (dict, Segment)):
+                message = [message]
+            elif isinstance(message, Message):
+                message = message.segments
+            durable = self._durable or idempotency_key is not None
+            segments = self._apply_modifiers(message)
+            self._reset_modifiers()
+
+            account_name, account = self._adapter._resolve_account(
+                self.send_context.get("account_id")
+            )
+            codec = self._adapter._get_codec(account_name)
+            content = PreEncoded(codec.dumps(segments))
+            detail_type = DETAIL_TYPES.get(target_type, target_type)
+            id_field = f"{target_type}_id"
+
+            async def send(target_id: str) -> dict:
+                return await self._adapter.call_api(
+                    endpoint="send_message",
+                    _account_id=account_name,
+                    _priority="bulk",
+                    _durable=durable,
+                    _idempotency_key=f"{idempotency_key}:{target_id}" if idempotency_key else None,
+                    detail_type=detail_type,
+                    **{id_field: target_id},
+                    content=content,
+                )
+
+            job = BatchJob(
+                send,
+                target_ids,
+                max_in_flight=max_in_flight or account.batch_max_in_flight,
+                bucket=self._adapter._get_batch_bucket(account_name, account, rate),
+                retries=account.batch_retries,
+                retry_delay=account.batch_retry_delay,
+                on_progress=on_progress,
+                logger=self._adapter.logger,
+            )
+            return asyncio.create_task(job.run())
 
     def __init__(self, sdk_ref=None):
         super().__init__(sdk_ref)
         self.connections: Dict[str, Any] = {}
-        self._api_response_futures: Dict[str, Dict[str, asyncio.Future]] = {}
+        self._pools: Dict[str, ConnectionPool] = {}
+        self._event_dedup: Dict[str, RecentIds] = {}
+        self._event_filters: Dict[str, EventFilter] = {}
+        self._dispatchers: Dict[str, EventDispatcher] = {}
+        self._codecs: Dict[str, JsonCodec] = {}
+        self._raw_event_modes: Dict[str, str] = {}
+        self._message_models: set = set()
+        self._initialized_accounts: set = set()
+        self._upload_caches: Dict[str, FileIdCache] = {}
+        self._batch_buckets: Dict[str, TokenBucket] = {}
+        self._schedulers: Dict[str, OutboundScheduler] = {}
+        self._api_caches: Dict[str, ResultCache] = {}
+        self._coalescers: Dict[str, CallCoalescer] = {}
+        self._outboxes: Dict[str, Outbox] = {}
+        self._outbox_files: Dict[str, Outbox] = {}
+        self._outbox_wakeups: Dict[str, asyncio.Event] = {}
+        self._offloaders: Dict[str, Offloader] = {}
+        self._executors: Dict[tuple, Any] = {}
+        self._loop_lag: Optional[LoopLagMonitor] = None
+        self._captures: Dict[str, Capture] = {}
+        self._capture_files: Dict[str, Capture] = {}
+        self._metrics: Dict[str, AccountMetrics] = {}
+        self._metrics_paths: set = set()
         self.reconnect_tasks: Dict[str, asyncio.Task] = {}
         self._bot_ids: Dict[str, str] = {}
         self._pending_connect_meta: set = set()
         self._running = False
+        self._connected_events: Dict[str, asyncio.Event] = {}
         self.default_timeout = 30
-        self.default_retry_interval = 30
+        self._connect_slots: Optional[asyncio.Semaphore] = None
+        self._startup_phases: Dict[str, float] = {}
+        self._startup_began = 0.0
+        self._startup_waiting: set = set()
+        self._startup_connected_ms: Optional[float] = None
 
     def _get_config_key(self) -> str:
         return "OneBotv12_Adapter"
 
+    def _get_account(self, account_name: str) -> Optional[OneBot12AccountConfig]:
+        account = self._accounts_data.get(account_name) if self._accounts_data else None
+        return account if account is not None else self.accounts.get(account_name)
+
+    def _enabled_accounts(self) -> Dict[str, OneBot12AccountConfig]:
+        return {name: acc for name, acc in (self._accounts_data or {}).items() if acc.enabled}
+
+    def _refresh_accounts(self) -> Dict[str, OneBot12AccountConfig]:
+        accounts = self.accounts
+        for name, account in accounts.items():
+            account.name = name
+        self._accounts_data = accounts
+        return accounts
+
     def _get_bot_id(self, account_name: str) -> str:
         return self._bot_ids.get(account_name, "")
 
     def _bot_id_display(self, account_name: str) -> str:
         return self._bot_ids.get(account_name, "待确认")
 
+    def _get_pool(self, account_name: str) -> ConnectionPool:
+        pool = self._pools.get(account_name)
+        if pool is None:
+            pool = self._pools[account_name] = ConnectionPool()
+        return pool
+
+    def _get_codec(self, account_name: str) -> JsonCodec:
+        codec = self._codecs.get(account_name)
+        if codec is None:
+            account = self._get_account(account_name)
+            name = account.json_codec if account else "auto"
+            try:
+                codec = get_codec(name)
+            except (ImportError, ValueError) as e:
+                self.logger.warning(
+                    f"账户 {account_name} JSON编解码器 {name} 不可用: {str(e)}，改为自动选择"
+                )
+                codec = get_codec("auto")
+            self._codecs[account_name] = codec
+        return codec
+
+    def _init_account(self, account_name: str, account):
+        """启动时为账户准备事件处理流水线的各项配置：raw 模式、消息模型、去重与过滤"""
+        self._init_raw_event(account_name, account)
+        self._init_dedup(account_name, account)
+        self._init_filter(account_name, account)
+        self._initialized_accounts.add(account_name)
+
+    def _init_raw_event(self, account_name: str, account):
+        raw_mode = account.raw_event
+        if raw_mode not in RAW_EVENT_MODES:
+            self.logger.warning(
+                f"账户 {account_name} 未知的 raw_event 模式 {raw_mode}，使用 copy"
+            )
+            raw_mode = "copy"
+        self._raw_event_modes[account_name] = raw_mode
+        if account.message_model:
+            self._message_models.add(account_name)
+        else:
+            self._message_models.discard(account_name)
+
+    def _init_dedup(self, account_name: str, account):
+        if account.dedup_size > 0:
+            self._event_dedup[account_name] = RecentIds(account.dedup_size, account.dedup_window)
+        else:
+            self._event_dedup.pop(account_name, None)
+
+    def _init_filter(self, account_name: str, account):
+        event_filter = EventFilter(
+            account.filter_types,
+            account.filter_groups,
+            account.filter_users,
+            account.filter_self,
+        )
+        if event_filter.active:
+            self._event_filters[account_name] = event_filter
+        else:
+            self._event_filters.pop(account_name, None)
+
+    def _get_dispatcher(self, account_name: str) -> Optional[EventDispatcher]:
+        dispatcher = self._dispatchers.get(account_name)
+        if dispatcher is None:
+            account = self._get_account(account_name)
+            if not account:
+                return None
+            # 未经 start() 的账户（如启动后新增）在首个事件到来时补做初始化
+            if account_name not in self._initialized_accounts:
+                self._init_account(account_name, account)
+            overflow = account.dispatch_overflow
+            if overflow not in OVERFLOW_POLICIES:
+                self.logger.warning(
+                    f"账户 {account_name} 未知的溢出策略 {overflow}，使用 drop_oldest"
+                )
+                overflow = "drop_oldest"
+
+            async def handler(data, name=account_name):
+                await self._process_event(data, name)
+
+            dispatcher = self._dispatchers[account_name] = EventDispatcher(
+                handler,
+                workers=account.dispatch_workers,
+                queue_size=account.dispatch_queue_size,
+                overflow=overflow,
+                logger=self.logger,
+            )
+        return dispatcher
+
+    def get_dispatch_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            dispatcher = self._dispatchers.get(account_name)
+            return dispatcher.stats() if dispatcher else {}
+        return {name: d.stats() for name, d in self._dispatchers.items()}
+
+    def get_dedup_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            dedup = self._event_dedup.get(account_name)
+            return dedup.stats() if dedup else {}
+        return {name: d.stats() for name, d in self._event_dedup.items()}
+
+    def get_filter_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            event_filter = self._event_filters.get(account_name)
+            return event_filter.stats() if event_filter else {}
+        return {name: f.stats() for name, f in self._event_filters.items()}
+
+    def _get_batch_bucket(
+        self, account_name: str, account, rate: Optional[float] = None
+    ) -> Optional[TokenBucket]:
+        if rate is not None:
+            return TokenBucket(rate) if rate > 0 else None
+        if not account.batch_rate or account.batch_rate <= 0:
+            return None
+        bucket = self._batch_buckets.get(account_name)
+        if bucket is None or bucket.rate != account.batch_rate:
+            bucket = self._batch_buckets[account_name] = TokenBucket(account.batch_rate)
+        return bucket
+
+    def _get_scheduler(self, account_name: str, account) -> Optional[OutboundScheduler]:
+        if account.send_rate <= 0 and account.send_target_rate <= 0:
+            return None
+        scheduler = self._schedulers.get(account_name)
+        if scheduler is None:
+            scheduler = self._schedulers[account_name] = OutboundScheduler(
+                account.send_rate,
+                account.send_burst,
+                account.send_target_rate,
+                account.send_target_burst,
+            )
+        return scheduler
+
+    def get_send_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            scheduler = self._schedulers.get(account_name)
+            return scheduler.stats() if scheduler else {}
+        return {name: s.stats() for name, s in self._schedulers.items()}
+
+    def _get_api_cache(self, account_name: str, account) -> Optional[ResultCache]:
+        if not account.api_cache:
+            return None
+        cache = self._api_caches.get(account_name)
+        if cache is None:
+            try:
+                ttls = parse_ttls(account.api_cache_ttl)
+            except ValueError:
+                self.logger.warning(
+                    f"账户 {account_name} api_cache_ttl 格式无效: {account.api_cache_ttl}，使用默认有效期"
+                )
+                ttls = None
+            cache = self._api_caches[account_name] = ResultCache(ttls, account.api_cache_size)
+        return cache
+
+    def get_api_cache_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            cache = self._api_caches.get(account_name)
+            return cache.stats() if cache else {}
+        return {name: c.stats() for name, c in self._api_caches.items()}
+
+    def _get_coalescer(self, account_name: str, account) -> Optional[CallCoalescer]:
+        if not account.coalesce_calls:
+            return None
+        coalescer = self._coalescers.get(account_name)
+        if coalescer is None:
+            coalescer = self._coalescers[account_name] = CallCoalescer(
+                parse_endpoints(account.coalesce_endpoints)
+            )
+        return coalescer
+
+    def get_coalesce_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            coalescer = self._coalescers.get(account_name)
+            return coalescer.stats() if coalescer else {}
+        return {name: c.stats() for name, c in self._coalescers.items()}
+
+    def _get_outbox(self, account_name: str, account) -> Optional[Outbox]:
+        if not account.outbox_file:
+            return None
+        outbox = self._outboxes.get(account_name)
+        if outbox is None:
+            outbox = self._outbox_files.get(account.outbox_file)
+            if outbox is None:
+                outbox = self._outbox_files[account.outbox_file] = Outbox(account.outbox_file)
+            self._outboxes[account_name] = outbox
+            self._outbox_wakeups[account_name] = asyncio.Event()
+        key = f"{account_name}#outbox"
+        if self._running and key not in self.reconnect_tasks:
+            self.reconnect_tasks[key] = asyncio.create_task(
+                self._drain_outbox(account_name, account, outbox)
+            )
+        return outbox
+
+    def get_outbox_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            outbox = self._outboxes.get(account_name)
+            return outbox.stats(account_name) if outbox else {}
+        return {name: o.stats(name) for name, o in self._outboxes.items()}
+
+    async def _enqueue_outbox(
+        self,
+        account_name: str,
+        account,
+        endpoint: str,
+        _priority: Optional[str],
+        key: Optional[str],
+        params: dict,
+    ):
+        outbox = self._get_outbox(account_name, account)
+        payload = encode_action(
+            self._get_codec(account_name), {"action": endpoint, "params": params}
+        )
+        entry_id, key, created = await outbox.enqueue(account_name, payload, key, _priority)
+        if created:
+            self._outbox_wakeups[account_name].set()
+        return self.make_response(
+            status="ok",
+            retcode=0,
+            data={
+                "queued": True,
+                "outbox_id": entry_id,
+                "idempotency_key": key,
+                "duplicate": not created,
+            },
+        )
+
+    async def _deliver_outbox(
+        self, account_name: str, account, entry: OutboxEntry, request: Optional[dict]
+    ) -> Optional[dict]:
+        """发送一条出站队列消息；连接不可用或请求发出后连接断开时返回 None，不计尝试次数"""
+        if request is None:
+            return self.make_error(message=f"出站队列消息 {entry.key} 无法解析")
+        try:
+            return await self._call_api_once(
+                account_name, account, request["action"], entry.priority, request["params"]
+            )
+        except ConnectionError:
+            return None
+        except Exception as e:
+            return self.make_error(message=f"出站队列消息 {entry.key} 发送异常: {str(e)}")
+
+    async def _drain_outbox(self, account_name: str, account, outbox: Outbox):
+        wake = self._outbox_wakeups[account_name]
+        connected = self._get_connected_event(account_name)
+        backoff = Backoff(account.outbox_retry_initial, account.outbox_retry_max)
+        max_attempts = max(1, account.outbox_max_attempts)
+        codec = self._get_codec(account_name)
+        # 队首消息等待重试的目标 -> 重试时间，此前到期的同目标消息一并推迟，避免越过队首先送达
+        held: Dict[Any, float] = {}
+
+        def outcome(entry: OutboxEntry, resp: Optional[dict]) -> str:
+            if resp is None:
+                return "lost"
+            if resp.get("status") == "ok":
+                return "sent"
+            if is_transient(resp) and entry.attempts + 1 < max_attempts:
+                return "retry"
+            return "dead"
+
+        async def deliver(items: List[tuple]) -> List[tuple]:
+            # 同一目标的消息逐条发送，前一条需要重试或连接断开时后面的不再发送，保证送达顺序
+            results = []
+            for entry, request in items:
+                resp = await self._deliver_outbox(account_name, account, entry, request)
+                kind = outcome(entry, resp)
+                results.append((resp, kind))
+                if kind in ("lost", "retry"):
+                    break
+            return results
+
+        while self._running:
+            if not connected.is_set():
+                await connected.wait()
+                continue
+            wake.clear()
+            try:
+                entries = await outbox.due(account_name, account.outbox_batch)
+                if not entries:
+                    next_at = await outbox.next_due(account_name)
+                    timeout = None if next_at is None else max(0.0, next_at - time.time())
+                    try:
+                        await asyncio.wait_for(wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                # 按目标分组，组内按入队顺序发送，不同目标并发；无法确定目标的消息各自成组
+                now = time.time()
+                for target in [t for t, until in held.items() if until <= now]:
+                    del held[target]
+                groups: Dict[Any, List[tuple]] = {}
+                defer: List[tuple] = []
+                for entry in entries:
+                    try:
+                        request = codec.loads(entry.payload)
+                        target = target_key(request["params"])
+                    except Exception:
+                        request, target = None, None
+                    if target in held:
+                        defer.append((entry.id, held[target]))
+                        continue
+                    groups.setdefault(target or ("#", entry.id), []).append((entry, request))
+                results = await asyncio.gather(*(deliver(items) for items in groups.values()))
+
+                now = time.time()
+                sent, retry, dead = [], [], []
+                lost = False
+                for target, items, group_results in zip(groups, groups.values(), results):
+                    for (entry, _), (resp, kind) in zip(items, group_results):
+                        if kind == "sent":
+                            sent.append(entry.id)
+                            continue
+                        if kind == "lost":
+                            # 未计尝试次数，保持待发送，连接恢复后按原顺序重发
+                            lost = True
+                            break
+                        error = f"{resp.get('retcode')} {resp.get('message', '')}".strip()
+                        if kind == "retry":
+                            backoff.attempts = entry.attempts
+                            next_at = now + backoff.next()
+                            retry.append((entry.id, next_at, error))
+                            defer.extend((e.id, next_at) for e, _ in items[len(group_results) :])
+                            if isinstance(target, str):
+                                held[target] = next_at
+                            break
+                        dead.append((entry.id, error))
+                        self.logger.warning(
+                            f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) "
+                            f"出站队列消息 {entry.key} 第 {entry.attempts + 1} 次发送失败，不再重试: {error}"
+                        )
+                await outbox.settle(account_name, sent, retry, dead, defer)
+                if lost:
+                    await asyncio.sleep(backoff.initial)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(
+                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 出站队列处理失败: {str(e)}"
+                )
+                await asyncio.sleep(backoff.initial or 1.0)
+
+    def _get_offloader(self, account_name: str, account) -> Optional[Offloader]:
+        if account.offload_threshold <= 0:
+            return None
+        offloader = self._offloaders.get(account_name)
+        if offloader is None:
+            kind = account.offload_executor
+            if kind not in OFFLOAD_EXECUTORS:
+                self.logger.warning(
+                    f"账户 {account_name} 未知的 offload_executor {kind}，使用 thread"
+                )
+                kind = "thread"
+            key = (kind, max(1, account.offload_workers))
+            executor = self._executors.get(key)
+            if executor is None:
+                executor = self._executors[key] = make_executor(*key)
+            offloader = self._offloaders[account_name] = Offloader(
+                account.offload_threshold, kind, executor
+            )
+        return offloader
+
+    def get_offload_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            offloader = self._offloaders.get(account_name)
+            return offloader.stats() if offloader else {}
+        return {name: o.stats() for name, o in self._offloaders.items()}
+
+    def _get_capture(self, account_name: str, account) -> Optional[Capture]:
+        if not account.capture_file:
+            return None
+        capture = self._captures.get(account_name)
+        if capture is None:
+            capture = self._capture_files.get(account.capture_file)
+            if capture is None:
+                capture = self._capture_files[account.capture_file] = Capture(
+                    account.capture_file, account.capture_max_bytes, account.capture_backups
+                )
+                self.logger.info(
+                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 开始录制流量: {account.capture_file}"
+                )
+            self._captures[account_name] = capture
+        return capture
+
+    def get_capture_stats(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        if account_name is not None:
+            capture = self._captures.get(account_name)
+            return capture.stats() if capture else {}
+        return {name: c.stats() for name, c in self._captures.items()}
+
+    def get_loop_lag(self) -> Dict[str, Any]:
+        return self._loop_lag.stats() if self._loop_lag else {}
+
+    def get_metrics(self, account_name: Optional[str] = None) -> Dict[str, Any]:
+        def snapshot(name: str) -> Dict[str, Any]:
+            pool = self._pools.get(name)
+            outbox = self._outboxes.get(name)
+            return self._metrics[name].snapshot(
+                pool.pending_count() if pool else 0,
+                outbox.depth(name) if outbox else 0,
+            )
+
+        if account_name is not None:
+            return snapshot(account_name) if account_name in self._metrics else {}
+        return {name: snapshot(name) for name in self._metrics}
+
+    async def _metrics_endpoint(self):
+        from fastapi.responses import PlainTextResponse
+
+        return PlainTextResponse(
+            render_prometheus(self.get_metrics()),
+            media_type="text/plain; version=0.0.4",
+        )
+
+    def _setup_metrics(self):
+        for account_name, account in self._enabled_accounts().items():
+            if not account.metrics:
+                continue
+            if account_name not in self._metrics:
+                self._metrics[account_name] = AccountMetrics()
+            path = account.metrics_path
+            if not path or path in self._metrics_paths:
+                continue
+            try:
+                router.register_http_route(
+                    "onebot12", path, self._metrics_endpoint, methods=["GET"]
+                )
+                self._metrics_paths.add(path)
+                self.logger.info(f"已注册指标路由: {path}")
+            except Exception as e:
+                self.logger.error(f"注册指标路由 {path} 失败: {str(e)}")
+
     def _update_bot_id(self, account_name: str, self_id: str):
         old = self._bot_ids.get(account_name)
         if not old:
@@ -287,38 +1380,132 @@ class OneBot12Adapter(BaseAdapter):
         self.logger.info(f"OneBot12适配器初始化完成，共加载 {len(accounts)} 个账户")
         return accounts
 
-    async def call_api(self, endpoint: str, _account_id: str = None, **params):
+    async def call_api(
+        self,
+        endpoint: str,
+        _account_id: str = None,
+        _priority: str = None,
+        _cache: bool = True,
+        _durable: bool = False,
+        _idempotency_key: Optional[str] = None,
+        **params,
+    ):
         account_name, account = self._resolve_account(_account_id)
+        if _durable and account.outbox_file:
+            return await self._enqueue_outbox(
+                account_name, account, endpoint, _priority, _idempotency_key, params
+            )
+        cache = self._get_api_cache(account_name, account) if _cache else None
+        if cache is not None and cache.cacheable(endpoint):
+            return await cache.fetch(
+                endpoint,
+                params,
+                lambda: self._call_api(account_name, account, endpoint, _priority, params),
+            )
+        coalescer = self._get_coalescer(account_name, account)
+        if coalescer is not None and coalescer.coalescable(endpoint):
+            return await coalescer.do(
+                endpoint,
+                params,
+                lambda: self._call_api(account_name, account, endpoint, _priority, params),
+            )
+        return await self._call_api(account_name, account, endpoint, _priority, params)
+
+    async def _call_api(
+        self, account_name: str, account, endpoint: str, _priority: Optional[str], params: dict
+    ):
+        replay_until = (
+            time.monotonic() + account.replay_window
+            if account.replay_idempotent
+            and is_idempotent(endpoint)
+            and account.mode not in HTTP_MODES
+            else 0.0
+        )
 
-        connection = self.connections.get(account_name)
-        if not connection:
-            raise ConnectionError(f"账户 {account_name} 尚未连接")
+        while True:
+            try:
+                return await self._call_api_once(
+                    account_name, account, endpoint, _priority, params
+                )
+            except ConnectionError as e:
+                if await self._wait_connected(account_name, replay_until - time.monotonic()):
+                    self.logger.info(
+                        f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接恢复，重发请求: {endpoint}"
+                    )
+                    continue
+                if not isinstance(e, ConnectionLost):
+                    raise
+                return self.make_error(
+                    retcode=33002,
+                    message=f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接断开，请求未完成: {endpoint}",
+                    raw=None,
+                )
 
-        if hasattr(connection, "closed") and connection.closed:
-            raise ConnectionError(f"账户 {account_name} 的连接已关闭")
+    async def _call_api_once(
+        self, account_name: str, account, endpoint: str, _priority: Optional[str], params: dict
+    ):
+        pool = self._get_pool(account_name)
+        if not pool:
+            raise ConnectionError(f"账户 {account_name} 尚未连接")
 
-        if account_name not in self._api_response_futures:
-            self._api_response_futures[account_name] = {}
+        scheduler = self._get_scheduler(account_name, account)
+        if scheduler is not None:
+            await scheduler.acquire(
+                _priority or action_priority(endpoint),
+                target_key(params) if endpoint == "send_message" else None,
+            )
 
-        echo = str(hash((str(params), account_name, endpoint)))
-        future = asyncio.get_event_loop().create_future()
-        self._api_response_futures[account_name][echo] = future
+        member = pool.pick()
+        if member is None:
+            raise ConnectionError(f"账户 {account_name} 的连接已关闭")
+        connection = member.ws
+        pending = member.pending
+        http = isinstance(connection, HttpConnection)
+        if http:
+            # HTTP 响应随请求返回，不登记到等待表，免得连接关闭时 fail_all 留下无人取用的异常
+            echo, future = pending.next_echo(), None
+        else:
+            echo, future = pending.allocate()
 
         payload = {"action": endpoint, "params": params, "echo": echo}
+        metrics = self._metrics.get(account_name)
+        frame_format = member.frame_format
+
+        offloader = self._offloaders.get(account_name)
 
         try:
-            await connection.send_text(json.dumps(payload))
+            if offloader is not None and exceeds(params, offloader.threshold):
+                frame = await offloader.run(
+                    "encode", encode_frame, self._get_codec(account_name).name, frame_format, payload
+                )
+            elif frame_format is None:
+                frame = encode_action(self._get_codec(account_name), payload)
+            else:
+                frame = encode_binary_action(
+                    frame_format, self._get_codec(account_name), payload
+                )
+            capture = self._captures.get(account_name)
+            if capture is not None:
+                capture.record(CAPTURE_OUT, account_name, frame, frame_format is not None)
+            sent_at = time.perf_counter()
+            if http:
+                future = asyncio.ensure_future(connection.request(frame))
+            elif frame_format is None:
+                await connection.send_text(frame)
+            else:
+                await connection.send_bytes(frame)
+            if metrics is not None:
+                metrics.frame_out(len(frame))
         except Exception as e:
             self.logger.error(
                 f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 发送请求失败: {str(e)}"
             )
-            if echo in self._api_response_futures[account_name]:
-                del self._api_response_futures[account_name][echo]
+            pending.discard(echo)
             raise
 
         try:
             self.logger.debug(
-                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 请求: {payload}"
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 请求: {endpoint} (echo: {echo})"
             )
 
             raw_response = await asyncio.wait_for(future, timeout=self.default_timeout)
@@ -333,6 +1520,8 @@ class OneBot12Adapter(BaseAdapter):
 
             retcode = raw_response.get("retcode", 0)
             status = "ok" if retcode == 0 else "failed"
+            if metrics is not None:
+                metrics.api(endpoint, time.perf_counter() - sent_at, status)
 
             resp = self.make_response(
                 status=status,
@@ -346,12 +1535,19 @@ class OneBot12Adapter(BaseAdapter):
 
             return resp
 
+        except ConnectionLost:
+            if metrics is not None:
+                metrics.api(endpoint, time.perf_counter() - sent_at, "failed")
+            raise
+
         except asyncio.TimeoutError:
             self.logger.error(
                 f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) API调用超时: {endpoint}"
             )
             if not future.done():
                 future.cancel()
+            if metrics is not None:
+                metrics.api(endpoint, time.perf_counter() - sent_at, "timeout")
 
             return self.make_error(
                 retcode=33001,
@@ -360,22 +1556,60 @@ class OneBot12Adapter(BaseAdapter):
             )
 
         finally:
+            pending.discard(echo)
+
+    def _get_upload_cache(self, account_name: str, account) -> Optional[FileIdCache]:
+        if not account.upload_cache:
+            return None
+        cache_key = account.upload_cache_file or account_name
+        cache = self._upload_caches.get(cache_key)
+        if cache is None:
+            cache = self._upload_caches[cache_key] = FileIdCache(
+                account.upload_cache_size,
+                account.upload_cache_ttl,
+                account.upload_cache_file,
+            )
+        return cache
 
-            async def cleanup():
-                await asyncio.sleep(0.1)
-                if (
-                    account_name in self._api_response_futures
-                    and echo in self._api_response_futures[account_name]
-                ):
-                    del self._api_response_futures[account_name][echo]
+    def get_upload_cache_stats(self) -> Dict[str, Any]:
+        return {key: cache.stats() for key, cache in self._upload_caches.items()}
 
-            asyncio.create_task(cleanup())
+    async def upload_file(
+        self, file: MediaSource, name: str, _account_id: Optional[str] = None
+    ) -> dict:
+        account_name, account = self._resolve_account(_account_id)
+        cache = self._get_upload_cache(account_name, account)
+
+        async with spooled(file) as source:
+            digest = cache_key = None
+            if cache is not None:
+                digest = await source_sha256(source)
+                cache_key = f"{account_name}/{account.implementation}/{digest}"
+                file_id = cache.get(cache_key)
+                if file_id:
+                    return self.make_response(data={"file_id": file_id})
+
+            uploader = FileUploader(
+                self.call_api, account.upload_chunk_size, account.upload_inline_limit
+            )
+            resp = await uploader.upload(source, name, account_name, digest)
 
-    async def connect(self, account_name: str):
-        if account_name not in self.accounts:
-            raise ValueError(f"账户 {account_name} 不存在")
+        data = resp.get("data")
+        if resp.get("status") != "ok":
+            return resp
+        if not (isinstance(data, dict) and data.get("file_id")):
+            return self.make_error(
+                message=f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 上传文件未返回 file_id: {name}",
+                raw=resp.get("onebot12_raw"),
+            )
+        if cache is not None:
+            await cache.put(cache_key, str(data["file_id"]))
+        return resp
 
-        account = self.accounts[account_name]
+    async def connect(self, account_name: str, slot: int = 0):
+        account = self._get_account(account_name)
+        if account is None:
+            raise ValueError(f"账户 {account_name} 不存在")
         if account.mode != "client":
             return
 
@@ -384,42 +1618,167 @@ class OneBot12Adapter(BaseAdapter):
             headers["Authorization"] = f"Bearer {account.client_token}"
 
         url = account.client_url
+        label = f"{account_name}#{slot}" if slot else account_name
+        backoff = Backoff(
+            account.reconnect_initial_delay,
+            account.reconnect_max_delay,
+            account.reconnect_multiplier,
+            account.reconnect_jitter,
+        )
+        established = False
 
         while self._running:
             try:
                 self.logger.info(
-                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 正在连接: {url}"
+                    f"账户 {label} (bot_id: {self._bot_id_display(account_name)}) 正在连接: {url}"
                 )
-                ws = await client.ws_connect(url, headers=headers)
-                self.connections[account_name] = ws
+                async with self._connect_slots or contextlib.nullcontext():
+                    ws = await client.ws_connect(
+                        url, headers=headers, heartbeat=account.ws_ping_interval or None
+                    )
+                member = self._on_connected(account_name, ws)
+                # 只有此前建立过的连接断开后再次连上才算重连，连接池其余槽位的首次连接不计入
+                if established and account_name in self._metrics:
+                    self._metrics[account_name].reconnects += 1
+                established = True
+                connected_at = time.monotonic()
                 self.logger.info(
-                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接成功"
+                    f"账户 {label} (bot_id: {self._bot_id_display(account_name)}) 连接成功"
                 )
-                await self.emit_meta("connect", self._get_bot_id(account_name))
-                if not self._get_bot_id(account_name):
-                    self._pending_connect_meta.add(account_name)
-                await self._listen(account_name)
+                if len(self._get_pool(account_name)) == 1:
+                    await self.emit_meta("connect", self._get_bot_id(account_name))
+                    if not self._get_bot_id(account_name):
+                        self._pending_connect_meta.add(account_name)
+                await self._listen(account_name, member)
                 if not self._running:
                     return
-                self.logger.info(
-                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) "
-                    f"{self.default_retry_interval}秒后重连..."
-                )
-                await asyncio.sleep(self.default_retry_interval)
+                if time.monotonic() - connected_at >= backoff.maximum:
+                    backoff.reset()
             except Exception as e:
                 if not self._running:
                     return
                 self.logger.error(
-                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接失败: {str(e)}"
+                    f"账户 {label} (bot_id: {self._bot_id_display(account_name)}) 连接失败: {str(e)}"
+                )
+            delay = backoff.next()
+            self.logger.info(
+                f"账户 {label} (bot_id: {self._bot_id_display(account_name)}) "
+                f"{delay:.1f}秒后重连..."
+            )
+            await asyncio.sleep(delay)
+
+    def _get_connected_event(self, account_name: str) -> asyncio.Event:
+        event = self._connected_events.get(account_name)
+        if event is None:
+            event = self._connected_events[account_name] = asyncio.Event()
+        return event
+
+    def _on_connected(self, account_name: str, connection) -> PooledConnection:
+        account = self._get_account(account_name)
+        tracker = (
+            LivenessTracker(account.heartbeat_miss_limit, account.heartbeat_timeout)
+            if account and account.mode not in HTTP_MODES
+            else None
+        )
+        if account:
+            self._get_offloader(account_name, account)
+            self._get_capture(account_name, account)
+        pool = self._get_pool(account_name)
+        member = pool.add(connection, tracker)
+        frame_format = account.ws_frame_format if account else "auto"
+        if frame_format not in WS_FRAME_FORMATS:
+            self.logger.warning(
+                f"账户 {account_name} 未知的 ws_frame_format {frame_format}，使用 auto"
+            )
+            frame_format = "auto"
+        if isinstance(connection, HttpConnection):
+            # HTTP 请求体按 application/json 发送，ws_frame_format 只作用于 WebSocket
+            if frame_format in BINARY_FORMATS:
+                self.logger.warning(
+                    f"账户 {account_name} 的 ws_frame_format {frame_format} 不适用于 HTTP 连接，使用 text"
+                )
+            frame_format = "text"
+        member.mirror = frame_format == "auto"
+        member.frame_format = frame_format if frame_format in BINARY_FORMATS else None
+        self.connections[account_name] = connection
+        self._get_connected_event(account_name).set()
+        if account_name in self._startup_waiting:
+            self._startup_waiting.discard(account_name)
+            if not self._startup_waiting:
+                self._startup_connected_ms = (time.perf_counter() - self._startup_began) * 1000
+        if account_name in self._metrics:
+            self._metrics[account_name].connects += 1
+
+        if tracker is not None and (tracker.miss_limit or tracker.fallback_timeout):
+            member.watchdog = asyncio.create_task(self._watch_liveness(account_name, member))
+        return member
+
+    async def _watch_liveness(self, account_name: str, member: PooledConnection):
+        pool = self._get_pool(account_name)
+        tracker = member.tracker
+        while member in pool.members:
+            await asyncio.sleep(tracker.check_every())
+            if not tracker.overdue() or member not in pool.members:
+                continue
+            tracker.dead = True
+            member.watchdog = None
+            self.logger.warning(
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) "
+                f"{time.time() - tracker.last_seen:.1f}秒未收到任何数据，判定连接失效，正在断开"
+            )
+            try:
+                await member.ws.close()
+            except Exception as e:
+                self.logger.error(
+                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 关闭失效连接失败: {str(e)}"
                 )
-                await asyncio.sleep(self.default_retry_interval)
-
-    async def _listen(self, account_name: str):
-        connection = self.connections.get(account_name)
-        if not connection:
             return
 
-        account = self.accounts.get(account_name)
+    def get_liveness(
+        self, account_name: Optional[str] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+        def snapshot(pool: ConnectionPool) -> List[Dict[str, Any]]:
+            return [m.tracker.snapshot() for m in pool.members if m.tracker is not None]
+
+        if account_name is not None:
+            pool = self._pools.get(account_name)
+            return snapshot(pool) if pool else []
+        return {name: snapshot(pool) for name, pool in self._pools.items()}
+
+    def _on_disconnected(self, account_name: str, member: PooledConnection):
+        pool = self._get_pool(account_name)
+        pool.remove(member)
+        primary = pool.primary
+        if primary is not None:
+            self.connections[account_name] = primary
+        else:
+            self.connections.pop(account_name, None)
+            self._get_connected_event(account_name).clear()
+
+        if member.watchdog is not None and not member.watchdog.done():
+            member.watchdog.cancel()
+        if member.tracker is not None:
+            member.tracker.dead = True
+        if account_name in self._metrics:
+            self._metrics[account_name].disconnects += 1
+        failed = member.pending.fail_all(ConnectionLost(f"账户 {account_name} 连接已断开"))
+        if failed:
+            self.logger.warning(
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接断开，{failed} 个未完成的请求已失败"
+            )
+
+    async def _wait_connected(self, account_name: str, timeout: float) -> bool:
+        if timeout <= 0:
+            return False
+        try:
+            await asyncio.wait_for(self._get_connected_event(account_name).wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _listen(self, account_name: str, member: PooledConnection):
+        connection = member.ws
+        account = self._get_account(account_name)
 
         try:
             while True:
@@ -428,9 +1787,12 @@ class OneBot12Adapter(BaseAdapter):
                     self.logger.debug(
                         f"账户 {account_name} 收到WS文本: {str(msg.data)[:300]}"
                     )
-                    asyncio.create_task(self._handle_message(msg.data, account_name))
+                    await self._handle_message(msg.data, account_name, member)
                 elif msg.type == WSMessage.BINARY:
-                    self.logger.debug(f"账户 {account_name} 收到WS二进制数据")
+                    self.logger.debug(
+                        f"账户 {account_name} 收到WS二进制帧: {len(msg.data)} 字节"
+                    )
+                    await self._handle_message(msg.data, account_name, member, binary=True)
                 elif msg.type == WSMessage.CLOSE:
                     self.logger.info(
                         f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 收到CLOSE帧"
@@ -451,80 +1813,208 @@ class OneBot12Adapter(BaseAdapter):
                 exc_info=True,
             )
         finally:
-            try:
-                await self.emit_meta(
-                    "disconnect", self._get_bot_id(account_name) if account else ""
-                )
-            except Exception:
-                pass
-            self.connections.pop(account_name, None)
+            await self._close_member(account_name, member, account)
 
-    async def _handle_message(self, raw_msg: str, account_name: str):
+    async def _close_member(self, account_name: str, member: PooledConnection, account):
+        self._on_disconnected(account_name, member)
+        if account_name in self._pools and self._pools[account_name]:
+            return
         try:
-            data = json.loads(raw_msg)
-            account = self.accounts.get(account_name)
-            if not account:
+            await self.emit_meta(
+                "disconnect", self._get_bot_id(account_name) if account else ""
+            )
+        except Exception:
+            pass
+
+    async def _handle_message(
+        self,
+        raw_msg: Union[str, bytes],
+        account_name: str,
+        member: Optional[PooledConnection] = None,
+        binary: bool = False,
+    ):
+        try:
+            tracker = member.tracker if member is not None else None
+            if tracker is not None:
+                tracker.seen()
+            capture = self._captures.get(account_name)
+            if capture is not None:
+                capture.record(CAPTURE_IN, account_name, raw_msg, binary)
+            metrics = self._metrics.get(account_name)
+            offloader = self._offloaders.get(account_name)
+            try:
+                if offloader is not None and len(raw_msg) >= offloader.threshold:
+                    start = time.perf_counter()
+                    kind, data = await self._decode_frame_offloaded(
+                        offloader, raw_msg, account_name, member, binary
+                    )
+                    if metrics is not None:
+                        metrics.frame_in(len(raw_msg), time.perf_counter() - start)
+                elif metrics is None:
+                    kind, data = self._decode_frame(raw_msg, account_name, member, binary)
+                else:
+                    start = time.perf_counter()
+                    kind, data = self._decode_frame(raw_msg, account_name, member, binary)
+                    metrics.frame_in(len(raw_msg), time.perf_counter() - start)
+            except ValueError as e:
+                if binary:
+                    self.logger.error(f"二进制帧解析失败 ({len(raw_msg)} 字节): {str(e)}")
+                else:
+                    self.logger.error(f"JSON解析失败: {str(raw_msg)[:300]}")
+                return
+            if kind is None:
                 return
 
-            if "echo" in data:
-                future = self._api_response_futures.get(account_name, {}).get(
-                    data["echo"]
-                )
-                if future and not future.done():
-                    future.set_result(data)
+            if kind == FRAME_RESPONSE and "echo" in data:
+                pool = self._pools.get(account_name)
+                if pool is not None:
+                    pool.resolve(data["echo"], data, member)
                 return
 
-            from ErisPulse.Core import adapter as adapter_mgr
+            if kind == FRAME_HEARTBEAT and tracker is not None:
+                if data.get("type") == "meta" and data.get("detail_type") == "heartbeat":
+                    tracker.heartbeat(data.get("interval"))
 
-            if data:
-                raw_type = data.get("type", "")
+            await self._submit_event(data, account_name)
 
-                data["onebot12_raw"] = dict(data)
-                if raw_type:
-                    data["onebot12_raw_type"] = raw_type
+        except Exception as e:
+            self.logger.error(f"消息处理异常: {str(e)}")
+
+    def _decode_frame(
+        self,
+        raw_msg: Union[str, bytes],
+        account_name: str,
+        member: Optional[PooledConnection],
+        binary: bool,
+    ):
+        codec = self._get_codec(account_name)
+        if not binary:
+            kind = classify_frame(raw_msg)
+            data = codec.loads(raw_msg)
+            return (kind, data) if isinstance(data, dict) and data else (None, None)
+
+        return self._classify_binary(*decode_binary(raw_msg, codec), account_name, member)
+
+    async def _decode_frame_offloaded(
+        self,
+        offloader: Offloader,
+        raw_msg: Union[str, bytes],
+        account_name: str,
+        member: Optional[PooledConnection],
+        binary: bool,
+    ):
+        fmt, data = await offloader.run(
+            "decode", decode_frame, self._get_codec(account_name).name, raw_msg, binary
+        )
+        if binary:
+            return self._classify_binary(fmt, data, account_name, member)
+        return (classify_data(data), data) if isinstance(data, dict) and data else (None, None)
+
+    def _classify_binary(
+        self, fmt: str, data: Any, account_name: str, member: Optional[PooledConnection]
+    ):
+        if not isinstance(data, dict) or not data:
+            return None, None
+        if member is not None and member.mirror and fmt != "json":
+            member.mirror = False
+            member.frame_format = fmt
+            self.logger.info(
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 收到 {fmt} 二进制帧，动作改用相同格式发送"
+            )
+        return classify_data(data), data
 
-                data["platform"] = self._platform
+    async def _submit_event(self, data: dict, account_name: str):
+        dispatcher = self._get_dispatcher(account_name)
+        if dispatcher is None:
+            return
+        dedup = self._event_dedup.get(account_name)
+        if dedup is not None and dedup.seen(data.get("id")):
+            return
+        cache = self._api_caches.get(account_name)
+        if cache is not None and data.get("type") == "notice":
+            cache.on_notice(data)
+        event_filter = self._event_filters.get(account_name)
+        if event_filter is not None and event_filter.drops(data, self._get_bot_id(account_name)):
+            return
+        metrics = self._metrics.get(account_name)
+        if metrics is not None:
+            metrics.event()
+        await dispatcher.submit(data)
 
-                if "self" not in data:
-                    data["self"] = {}
-                if not data.get("self", {}).get("user_id"):
-                    data["self"]["user_id"] = self._get_bot_id(account_name)
-                data["self"]["platform"] = self._platform
+    async def _process_event(self, data: dict, account_name: str):
+        try:
+            from ErisPulse.Core import adapter as adapter_mgr
 
-                event_self_id = data.get("self", {}).get("user_id", "")
-                if event_self_id:
-                    self._update_bot_id(account_name, str(event_self_id))
-                    if account_name in self._pending_connect_meta:
-                        self._pending_connect_meta.discard(account_name)
-                        await self.emit_meta("connect", str(event_self_id))
+            raw_type = data.get("type", "")
 
-                await adapter_mgr.emit(data)
+            raw_mode = self._raw_event_modes.get(account_name, "copy")
+            if raw_mode == "view":
+                data["onebot12_raw"] = RawEventView(data)
+            elif raw_mode == "copy":
+                data["onebot12_raw"] = dict(data)
+            if raw_type:
+                data["onebot12_raw_type"] = raw_type
+
+            data["platform"] = self._platform
+            if raw_type == "message" and account_name in self._message_models:
+                data["onebot12_message"] = Message(data.get("message") or [])
+
+            event_self = data.get("self")
+            if not isinstance(event_self, dict):
+                event_self = {}
+            elif raw_mode == "view":
+                event_self = dict(event_self)
+            data["self"] = event_self
+            if not event_self.get("user_id"):
+                event_self["user_id"] = self._get_bot_id(account_name)
+            event_self["platform"] = self._platform
+
+            event_self_id = event_self.get("user_id", "")
+            if event_self_id:
+                self._update_bot_id(account_name, str(event_self_id))
+                if account_name in self._pending_connect_meta:
+                    self._pending_connect_meta.discard(account_name)
+                    await self.emit_meta("connect", str(event_self_id))
+
+            await adapter_mgr.emit(data)
 
-        except json.JSONDecodeError:
-            self.logger.error(f"JSON解析失败: {raw_msg}")
         except Exception as e:
             self.logger.error(f"消息处理异常: {str(e)}")
 
     async def _ws_handler(self, websocket, account_name: str = "default"):
-        account = self.accounts.get(account_name)
+        account = self._get_account(account_name)
         if account:
             self.logger.info(
                 f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 客户端已连接"
             )
 
-        self.connections[account_name] = websocket
+        member = self._on_connected(account_name, websocket)
+        pool = self._get_pool(account_name)
 
-        await self.emit_meta(
-            "connect", self._get_bot_id(account_name) if account else ""
-        )
-        if account and not self._get_bot_id(account_name):
-            self._pending_connect_meta.add(account_name)
+        if len(pool) == 1:
+            await self.emit_meta(
+                "connect", self._get_bot_id(account_name) if account else ""
+            )
+            if account and not self._get_bot_id(account_name):
+                self._pending_connect_meta.add(account_name)
+
+        limit = max(1, account.pool_size) if account else 1
+        for old in pool.members[:-limit]:
+            self.logger.info(
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 连接数超过 {limit}，关闭最早的连接"
+            )
+            try:
+                await old.ws.close()
+            except Exception:
+                pass
 
         try:
             while True:
                 msg = await websocket.receive()
                 if msg.type == WSMessage.TEXT:
-                    asyncio.create_task(self._handle_message(msg.data, account_name))
+                    await self._handle_message(msg.data, account_name, member)
+                elif msg.type == WSMessage.BINARY:
+                    await self._handle_message(msg.data, account_name, member, binary=True)
                 elif msg.type in (WSMessage.CLOSE, WSMessage.ERROR):
                     break
         except Exception:
@@ -532,30 +2022,16 @@ class OneBot12Adapter(BaseAdapter):
                 f"账户 {account_name} (bot_id: {self._bot_id_display(account_name) if account else ''}) 客户端断开连接"
             )
         finally:
-            try:
-                await self.emit_meta(
-                    "disconnect", self._get_bot_id(account_name) if account else ""
-                )
-            except Exception:
-                pass
-            if account_name in self.connections:
-                del self.connections[account_name]
+            await self._close_member(account_name, member, account)
 
     async def _auth_handler(self, websocket, account_name: str = "default"):
-        if account_name not in self.accounts:
+        account = self._get_account(account_name)
+        if account is None:
             await websocket.close(code=1008)
             return False
 
-        account = self.accounts[account_name]
         if account.server_token:
-            client_token = websocket.headers.get("Authorization", "").replace(
-                "Bearer ", ""
-            )
-            if not client_token:
-                query = dict(websocket.query_params)
-                client_token = query.get("token", "")
-
-            if client_token != account.server_token:
+            if bearer_token(websocket) != account.server_token:
                 self.logger.warning(
                     f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) Token无效"
                 )
@@ -564,7 +2040,7 @@ class OneBot12Adapter(BaseAdapter):
         return True
 
     async def register_websocket(self):
-        for account_name, account in self.enabled_accounts.items():
+        for account_name, account in self._enabled_accounts().items():
             if account.mode == "server":
                 path = account.server_path
 
@@ -590,30 +2066,177 @@ class OneBot12Adapter(BaseAdapter):
                     f"已注册账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 的Server路由: {path}"
                 )
 
+    async def _webhook_handler(self, request, account_name: str, token: str = ""):
+        from fastapi.responses import Response
+
+        if token and bearer_token(request) != token:
+            self.logger.warning(
+                f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) Webhook Token无效"
+            )
+            return Response(status_code=401)
+
+        pool = self._pools.get(account_name)
+        member = pool.members[0] if pool else None
+        await self._handle_message(await request.body(), account_name, member)
+        return Response(status_code=204)
+
+    def register_webhooks(self):
+        for account_name, account in self._enabled_accounts().items():
+            if account.mode != "webhook":
+                continue
+            self._get_offloader(account_name, account)
+            self._get_capture(account_name, account)
+            path = account.server_path
+
+            def make_handler(name, token):
+                async def handler(request):
+                    return await self._webhook_handler(request, name, token)
+
+                return handler
+
+            router.register_http_route(
+                f"onebot12_{account_name}",
+                path,
+                make_handler(account_name, account.server_token),
+                methods=["POST"],
+            )
+            self.logger.info(
+                f"已注册账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) 的Webhook路由: {path}"
+            )
+
+    async def _start_http(self, account_name: str, account):
+        if account.http_url:
+            connection = HttpConnection(
+                account.http_url,
+                account.client_token,
+                self._get_codec(account_name),
+                offloader=self._get_offloader(account_name, account),
+            )
+            self._on_connected(account_name, connection)
+
+        await self.emit_meta("connect", self._get_bot_id(account_name))
+        if not self._get_bot_id(account_name):
+            self._pending_connect_meta.add(account_name)
+
+        if account.mode == "http" and account.http_url and account.http_poll_timeout > 0:
+            self.reconnect_tasks[f"{account_name}#poll"] = asyncio.create_task(
+                self._poll_events(account_name)
+            )
+
+    async def _poll_events(self, account_name: str):
+        account = self._get_account(account_name)
+        backoff = Backoff(
+            account.reconnect_initial_delay,
+            account.reconnect_max_delay,
+            account.reconnect_multiplier,
+            account.reconnect_jitter,
+        )
+
+        while self._running:
+            try:
+                resp = await self.call_api(
+                    "get_latest_events",
+                    _account_id=account_name,
+                    limit=0,
+                    timeout=account.http_poll_timeout,
+                )
+            except Exception as e:
+                resp = {"status": "failed", "message": str(e)}
+
+            events = resp.get("data") if resp.get("status") == "ok" else None
+            if not isinstance(events, list):
+                if not self._running:
+                    return
+                delay = backoff.next()
+                self.logger.warning(
+                    f"账户 {account_name} (bot_id: {self._bot_id_display(account_name)}) "
+                    f"拉取事件失败: {resp.get('message', '')}，{delay:.1f}秒后重试"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            backoff.reset()
+            for event in events:
+                if isinstance(event, dict) and event:
+                    await self._submit_event(event, account_name)
+
     async def start(self):
         self._running = True
-
-        server_accounts = [
-            name for name, acc in self.enabled_accounts.items() if acc.mode == "server"
-        ]
-        client_accounts = [
-            name for name, acc in self.enabled_accounts.items() if acc.mode == "client"
-        ]
+        began = self._startup_began = time.perf_counter()
+        phases = self._startup_phases = {}
+        mark = began
+
+        def phase(name: str):
+            nonlocal mark
+            now = time.perf_counter()
+            phases[name] = (now - mark) * 1000
+            mark = now
+
+        self._refresh_accounts()
+        accounts = self._enabled_accounts()
+        server_accounts = [name for name, acc in accounts.items() if acc.mode == "server"]
+        client_accounts = [name for name, acc in accounts.items() if acc.mode == "client"]
+        http_accounts = [name for name, acc in accounts.items() if acc.mode in HTTP_MODES]
+        for account_name, account in accounts.items():
+            self._init_account(account_name, account)
+        phase("accounts")
+
+        self._setup_metrics()
+        if self._loop_lag is None and any(
+            acc.metrics or acc.offload_threshold > 0 for acc in accounts.values()
+        ):
+            self._loop_lag = LoopLagMonitor()
+            self.reconnect_tasks["#loop_lag"] = asyncio.create_task(self._loop_lag.run())
+        phase("metrics")
 
         if server_accounts:
             await self.register_websocket()
-
+        if http_accounts:
+            self.register_webhooks()
+        phase("routes")
+
+        limits = [
+            accounts[name].connect_concurrency
+            for name in client_accounts
+            if accounts[name].connect_concurrency > 0
+        ]
+        self._connect_slots = asyncio.Semaphore(min(limits)) if limits else None
+        self._startup_waiting = set(client_accounts)
+        self._startup_connected_ms = None if client_accounts else 0.0
         for account_name in client_accounts:
-            account = self.accounts[account_name]
             self.logger.info(
                 f"启动Client模式账户: {account_name} (bot_id: {self._bot_id_display(account_name)})"
             )
-            self.reconnect_tasks[account_name] = asyncio.create_task(
-                self.connect(account_name)
+            for slot in range(max(1, accounts[account_name].pool_size)):
+                key = f"{account_name}#{slot}" if slot else account_name
+                self.reconnect_tasks[key] = asyncio.create_task(
+                    self.connect(account_name, slot)
+                )
+        phase("clients")
+
+        for account_name in http_accounts:
+            self.logger.info(
+                f"启动{accounts[account_name].mode.upper()}模式账户: {account_name} (bot_id: {self._bot_id_display(account_name)})"
             )
+        await asyncio.gather(*(self._start_http(name, accounts[name]) for name in http_accounts))
+        phase("http")
+
+        for account_name, account in accounts.items():
+            self._get_outbox(account_name, account)
+        phase("outbox")
+
+        enabled_count = len(server_accounts) + len(client_accounts) + len(http_accounts)
+        self.logger.info(
+            f"OneBot12适配器启动完成，共 {enabled_count} 个账户，耗时 {(mark - began) * 1000:.1f}ms"
+        )
 
-        enabled_count = len(server_accounts) + len(client_accounts)
-        self.logger.info(f"OneBot12适配器启动完成，共 {enabled_count} 个账户")
+    def get_startup_stats(self) -> Dict[str, Any]:
+        return {
+            "phases_ms": dict(self._startup_phases),
+            "total_ms": sum(self._startup_phases.values()),
+            "clients_pending": len(self._startup_waiting),
+            "clients_connected_ms": self._startup_connected_ms,
+        }
 
     async def shutdown(self):
         self._running = False
@@ -623,15 +2246,50 @@ class OneBot12Adapter(BaseAdapter):
                 task.cancel()
         self.reconnect_tasks.clear()
 
-        for account_name, connection in list(self.connections.items()):
-            account = self.accounts.get(account_name)
-            try:
-                if hasattr(connection, "closed") and not connection.closed:
-                    await connection.close()
-            except Exception as e:
-                self.logger.error(
-                    f"关闭账户 {account_name} (bot_id: {self._bot_id_display(account_name) if account else ''}) 连接失败: {str(e)}"
-                )
+        for account_name, pool in list(self._pools.items()):
+            account = self._get_account(account_name)
+            for member in list(pool.members):
+                if member.watchdog is not None and not member.watchdog.done():
+                    member.watchdog.cancel()
+                try:
+                    if not member.closed:
+                        await member.ws.close()
+                except Exception as e:
+                    self.logger.error(
+                        f"关闭账户 {account_name} (bot_id: {self._bot_id_display(account_name) if account else ''}) 连接失败: {str(e)}"
+                    )
+                if isinstance(member.ws, HttpConnection):
+                    await self._close_member(account_name, member, account)
         self.connections.clear()
 
+        for dispatcher in self._dispatchers.values():
+            await dispatcher.stop()
+        self._dispatchers.clear()
+        self._event_filters.clear()
+        self._event_dedup.clear()
+        self._initialized_accounts.clear()
+
+        for scheduler in self._schedulers.values():
+            scheduler.close()
+        self._schedulers.clear()
+        self._api_caches.clear()
+        self._coalescers.clear()
+
+        for outbox in self._outbox_files.values():
+            outbox.close()
+        self._outbox_files.clear()
+        self._outboxes.clear()
+        self._outbox_wakeups.clear()
+
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+        self._offloaders.clear()
+        self._loop_lag = None
+
+        for capture in self._capture_files.values():
+            capture.close()
+        self._capture_files.clear()
+        self._captures.clear()
+
         self.logger.info("OneBot12适配器已关闭")
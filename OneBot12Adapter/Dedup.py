@@ -0,0 +1,79 @@
+import time
+from typing import Any, Dict, List, Set
+
+
+class RecentIds:
+    """
+    最近见过的事件 id
+
+    预分配的环形缓冲按到达顺序记录 id 与时间，集合负责 O(1) 查重，内存固定为 capacity 条。
+    window 大于 0 时超过 window 秒的记录过期，不再判为重复；为 0 时只受 capacity 限制。
+    """
+
+    __slots__ = (
+        "capacity",
+        "window",
+        "_ids",
+        "_ring",
+        "_times",
+        "_head",
+        "_size",
+        "checked",
+        "duplicates",
+        "evicted",
+    )
+
+    def __init__(self, capacity: int = 4096, window: float = 0.0):
+        self.capacity = max(1, int(capacity))
+        self.window = max(0.0, float(window))
+        self._ids: Set[Any] = set()
+        self._ring: List[Any] = [None] * self.capacity
+        self._times: List[float] = [0.0] * self.capacity
+        self._head = 0
+        self._size = 0
+        self.checked = 0
+        self.duplicates = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _drop_oldest(self):
+        head = self._head
+        self._ids.discard(self._ring[head])
+        self._ring[head] = None
+        self._head = (head + 1) % self.capacity
+        self._size -= 1
+
+    def seen(self, event_id: Any) -> bool:
+        if not event_id:
+            return False
+        self.checked += 1
+        now = 0.0
+        if self.window:
+            now = time.monotonic()
+            cutoff = now - self.window
+            while self._size and self._times[self._head] <= cutoff:
+                self._drop_oldest()
+        if event_id in self._ids:
+            self.duplicates += 1
+            return True
+        if self._size == self.capacity:
+            self._drop_oldest()
+            self.evicted += 1
+        tail = (self._head + self._size) % self.capacity
+        self._ring[tail] = event_id
+        self._times[tail] = now
+        self._size += 1
+        self._ids.add(event_id)
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self._size,
+            "capacity": self.capacity,
+            "window": self.window,
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "evicted": self.evicted,
+        }
@@ -0,0 +1,210 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Union
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_new", "block")
+
+FRAME_EVENT = 0
+FRAME_RESPONSE = 1
+FRAME_HEARTBEAT = 2
+
+
+def classify_frame(raw: Union[str, bytes]) -> int:
+    if isinstance(raw, str):
+        if '"echo"' in raw and '"retcode"' in raw:
+            return FRAME_RESPONSE
+        if '"heartbeat"' in raw and '"meta"' in raw:
+            return FRAME_HEARTBEAT
+    else:
+        if b'"echo"' in raw and b'"retcode"' in raw:
+            return FRAME_RESPONSE
+        if b'"heartbeat"' in raw and b'"meta"' in raw:
+            return FRAME_HEARTBEAT
+    return FRAME_EVENT
+
+
+def classify_data(data: Dict[str, Any]) -> int:
+    if "echo" in data and "retcode" in data:
+        return FRAME_RESPONSE
+    if data.get("type") == "meta" and data.get("detail_type") == "heartbeat":
+        return FRAME_HEARTBEAT
+    return FRAME_EVENT
+
+
+def conversation_key(data: Dict[str, Any]) -> str:
+    return str(
+        data.get("group_id")
+        or data.get("channel_id")
+        or data.get("guild_id")
+        or data.get("user_id")
+        or data.get("type", "")
+    )
+
+
+class _Shard:
+    __slots__ = ("items", "_getters")
+
+    def __init__(self):
+        self.items: deque = deque()
+        self._getters: deque = deque()
+
+    def push(self, item):
+        self.items.append(item)
+        _wake(self._getters)
+
+    def drop_meta(self) -> bool:
+        for i, item in enumerate(self.items):
+            if item.get("type") == "meta":
+                del self.items[i]
+                return True
+        return False
+
+    def wait_not_empty(self) -> Awaitable[None]:
+        return _wait(self._getters)
+
+
+async def _wait(waiters: deque):
+    future = asyncio.get_running_loop().create_future()
+    waiters.append(future)
+    try:
+        await future
+    finally:
+        if not future.done():
+            future.cancel()
+
+
+def _wake(waiters: deque):
+    while waiters:
+        future = waiters.popleft()
+        if not future.done():
+            future.set_result(None)
+            break
+
+
+class EventDispatcher:
+    """
+    单账户事件分发：按会话分片，同一会话串行、不同会话并行
+
+    queue_size 是所有分片共用的总容量，单个繁忙会话可以占满整个队列。
+    drop_oldest 先丢弃任意分片中的元事件，没有元事件时丢弃积压最多的分片中最早的事件，
+    丢弃非元事件时计入 dropped_events 并记录警告。
+    """
+
+    # 丢弃非元事件的警告最多每隔这么多秒记录一次
+    DROP_LOG_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Awaitable[None]],
+        workers: int = 4,
+        queue_size: int = 1000,
+        overflow: str = "drop_oldest",
+        logger=None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"未知的溢出策略: {overflow}")
+        workers = max(1, int(workers))
+        self._handler = handler
+        self._overflow = overflow
+        self.logger = logger
+        self.maxsize = max(1, int(queue_size))
+        self._shards: List[_Shard] = [_Shard() for _ in range(workers)]
+        self._putters: deque = deque()
+        self._tasks: List[asyncio.Task] = []
+        self._depth = 0
+        self._drop_logged_at = 0.0
+        self._drop_logged_count = 0
+        self.processed = 0
+        self.dropped = 0
+        self.dropped_events = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._shards),
+            "depth": self._depth,
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "dropped_events": self.dropped_events,
+            "overflow": self._overflow,
+        }
+
+    def start(self):
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(shard)) for shard in self._shards
+        ]
+
+    async def stop(self):
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _drop_one(self) -> bool:
+        for shard in self._shards:
+            if shard.drop_meta():
+                self._depth -= 1
+                return True
+        shard = max(self._shards, key=lambda s: len(s.items))
+        if not shard.items:
+            return False
+        shard.items.popleft()
+        self._depth -= 1
+        self._event_dropped()
+        return True
+
+    def _event_dropped(self):
+        self.dropped_events += 1
+        if self.logger is None:
+            return
+        now = time.monotonic()
+        if now - self._drop_logged_at >= self.DROP_LOG_INTERVAL:
+            self.logger.warning(
+                f"事件分发队列已满（{self.maxsize}），丢弃了 "
+                f"{self.dropped_events - self._drop_logged_count} 个非元事件，累计 {self.dropped_events} 个"
+            )
+            self._drop_logged_at = now
+            self._drop_logged_count = self.dropped_events
+
+    async def submit(self, data: Dict[str, Any]):
+        if not self._tasks:
+            self.start()
+
+        while self._depth >= self.maxsize:
+            if self._overflow == "block":
+                await _wait(self._putters)
+                continue
+            if self._overflow == "drop_new" or not self._drop_one():
+                self.dropped += 1
+                if data.get("type") != "meta":
+                    self._event_dropped()
+                return
+            self.dropped += 1
+
+        self._shards[hash(conversation_key(data)) % len(self._shards)].push(data)
+        self._depth += 1
+        if self._depth > self.max_depth:
+            self.max_depth = self._depth
+
+    async def _worker(self, shard: _Shard):
+        while True:
+            while not shard.items:
+                await shard.wait_not_empty()
+            data = shard.items.popleft()
+            self._depth -= 1
+            _wake(self._putters)
+            try:
+                await self._handler(data)
+            except Exception as e:
+                if self.logger is not None:
+                    self.logger.error(f"事件处理异常: {str(e)}", exc_info=True)
+            self.processed += 1
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class FileIdCache:
+    """
+    内容哈希 → file_id 的 LRU + TTL 缓存
+
+    path 非空时从该 JSON 文件恢复，并在每次写入后异步落盘（先写临时文件再替换）。
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 86400, path: str = ""):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = float(ttl)
+        self.path = path
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._save_lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "path": self.path,
+        }
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            file_id, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return file_id
+            del self._entries[key]
+            self.evictions += 1
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, file_id: str):
+        expires_at = time.time() + self.ttl if self.ttl > 0 else float("inf")
+        self._entries[key] = (file_id, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        if self.path:
+            snapshot = {
+                k: [v, None if e == float("inf") else e]
+                for k, (v, e) in self._entries.items()
+            }
+            async with self._save_lock:
+                await asyncio.to_thread(self._save, snapshot)
+
+    def discard(self, key: str):
+        self._entries.pop(key, None)
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        try:
+            entries = self._parse(data)
+        except (TypeError, ValueError):
+            # 结构不符的缓存文件直接丢弃，下次写入时重新生成
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            return
+        self._entries.update(entries)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _parse(data: Any) -> "OrderedDict[str, Tuple[str, float]]":
+        if not isinstance(data, dict):
+            raise ValueError("缓存文件顶层不是对象")
+        now = time.time()
+        entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        for key, entry in data.items():
+            if not isinstance(entry, list) or len(entry) != 2 or not isinstance(entry[0], str):
+                raise ValueError(f"缓存条目 {key} 格式错误")
+            file_id, expires_at = entry
+            expires_at = float("inf") if expires_at is None else float(expires_at)
+            if expires_at > now:
+                entries[key] = (file_id, expires_at)
+        return entries
+
+    def _save(self, snapshot: Dict[str, Any]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
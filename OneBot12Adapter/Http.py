@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from .Codec import JsonCodec, get_codec
+from .Offload import Offloader, decode_frame
+from .Pending import ConnectionLost
+
+HTTP_MODES = ("http", "webhook")
+
+
+def bearer_token(request: Any) -> str:
+    token = request.headers.get("Authorization", "").replace("Bearer ", "")
+    if not token:
+        query = dict(request.query_params)
+        token = query.get("token") or query.get("access_token", "")
+    return token
+
+
+def _failed(retcode: int, message: str) -> Dict[str, Any]:
+    return {"status": "failed", "retcode": retcode, "data": None, "message": message}
+
+
+class HttpConnection:
+    """
+    Http / Webhook 模式的动作通道
+
+    每个动作请求是一次 POST，共用一个带 keep-alive 连接池的 aiohttp 会话；
+    作为连接池成员使用，对 call_api 而言与 WebSocket 连接无异。
+    """
+
+    __slots__ = ("url", "headers", "codec", "limit", "offloader", "closed", "_session", "_lock")
+
+    def __init__(
+        self,
+        url: str,
+        token: str = "",
+        codec: Optional[JsonCodec] = None,
+        limit: int = 100,
+        offloader: Optional[Offloader] = None,
+    ):
+        self.url = url
+        self.headers = {"Content-Type": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.codec = codec or get_codec("auto")
+        self.limit = max(1, int(limit))
+        self.offloader = offloader
+        self.closed = False
+        self._session = None
+        self._lock = asyncio.Lock()
+
+    async def _get_session(self):
+        async with self._lock:
+            # 与 close() 互斥，关闭后不再新建会话，避免进行中的请求在关闭后泄漏一个会话
+            if self.closed:
+                raise ConnectionLost("HTTP 通道已关闭")
+            if self._session is None or self._session.closed:
+                import aiohttp
+
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.limit),
+                    timeout=aiohttp.ClientTimeout(total=None),
+                )
+            return self._session
+
+    async def request(self, frame: str) -> Dict[str, Any]:
+        if self.closed:
+            raise ConnectionLost("HTTP 通道已关闭")
+        import aiohttp
+
+        session = await self._get_session()
+        try:
+            async with session.post(self.url, data=frame, headers=self.headers) as resp:
+                if resp.status != 200:
+                    return _failed(10001 if resp.status < 500 else 20002, f"HTTP {resp.status}")
+                body = await resp.read()
+        except (aiohttp.ClientError, OSError) as e:
+            raise ConnectionLost(f"HTTP 请求失败: {str(e)}") from e
+        try:
+            offloader = self.offloader
+            if offloader is not None and len(body) >= offloader.threshold:
+                _, data = await offloader.run("decode", decode_frame, self.codec.name, body, False)
+            else:
+                data = self.codec.loads(body)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            return _failed(20002, "响应不是有效的 JSON 对象")
+        return data
+
+    async def close(self):
+        self.closed = True
+        async with self._lock:
+            session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
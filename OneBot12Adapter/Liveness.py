@@ -0,0 +1,66 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class LivenessTracker:
+    """
+    单个连接的存活状态
+
+    任意入站帧都会刷新 last_seen；收到 meta.heartbeat 时记录实现端声明的心跳间隔。
+    超过 间隔 × miss_limit 未收到任何帧即判定连接失效；尚未收到心跳时使用 fallback_timeout。
+    """
+
+    __slots__ = (
+        "connected_at",
+        "last_seen",
+        "last_heartbeat",
+        "interval",
+        "miss_limit",
+        "fallback_timeout",
+        "dead",
+    )
+
+    def __init__(self, miss_limit: int = 3, fallback_timeout: float = 0.0):
+        now = time.time()
+        self.connected_at = now
+        self.last_seen = now
+        self.last_heartbeat: Optional[float] = None
+        self.interval: Optional[float] = None
+        self.miss_limit = max(0, int(miss_limit))
+        self.fallback_timeout = max(0.0, float(fallback_timeout))
+        self.dead = False
+
+    def seen(self):
+        self.last_seen = time.time()
+
+    def heartbeat(self, interval_ms: Any):
+        self.last_heartbeat = self.last_seen
+        try:
+            interval = float(interval_ms) / 1000
+        except (TypeError, ValueError):
+            return
+        if interval > 0:
+            self.interval = interval
+
+    def deadline(self) -> float:
+        if self.miss_limit and self.interval:
+            return self.interval * self.miss_limit
+        return self.fallback_timeout
+
+    def check_every(self) -> float:
+        deadline = self.deadline()
+        return max(0.5, deadline / (self.miss_limit * 2 or 2)) if deadline else 1.0
+
+    def overdue(self) -> bool:
+        deadline = self.deadline()
+        return bool(deadline) and time.time() - self.last_seen > deadline
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "connected_at": self.connected_at,
+            "last_seen": self.last_seen,
+            "last_heartbeat": self.last_heartbeat,
+            "heartbeat_interval": self.interval,
+            "idle": time.time() - self.last_seen,
+            "alive": not self.dead,
+        }
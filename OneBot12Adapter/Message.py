@@ -0,0 +1,296 @@
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+
+class Segment:
+    """
+    OneBot12 消息段
+
+    只保存 type 与 data 两个槽位，不再额外包一层 dict；编解码器遇到消息段时按 to_wire() 编码。
+    从事件解析的消息段与原始 data 共享同一个 dict，不做复制。
+    """
+
+    __slots__ = ("type", "data")
+
+    def __init__(self, type: str, data: Optional[Dict[str, Any]] = None):
+        self.type = type
+        self.data = data if data is not None else {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def to_wire(self) -> Dict[str, Any]:
+        return {"type": self.type, "data": self.data}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Segment):
+            return self.type == other.type and self.data == other.data
+        if isinstance(other, dict):
+            return other.get("type") == self.type and other.get("data") == self.data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.type!r}, {self.data!r})"
+
+
+class Text(Segment):
+    __slots__ = ()
+
+    def __init__(self, text: str):
+        super().__init__("text", {"text": text})
+
+    @property
+    def text(self) -> str:
+        return self.data.get("text", "")
+
+
+class Mention(Segment):
+    __slots__ = ()
+
+    def __init__(self, user_id: str):
+        super().__init__("mention", {"user_id": user_id})
+
+    @property
+    def user_id(self) -> str:
+        return str(self.data.get("user_id", ""))
+
+
+class MentionAll(Segment):
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__("mention_all", {})
+
+
+class Reply(Segment):
+    __slots__ = ()
+
+    def __init__(self, message_id: str, user_id: Optional[str] = None):
+        data = {"message_id": message_id}
+        if user_id is not None:
+            data["user_id"] = user_id
+        super().__init__("reply", data)
+
+    @property
+    def message_id(self) -> str:
+        return str(self.data.get("message_id", ""))
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.data.get("user_id")
+
+
+class _File(Segment):
+    __slots__ = ()
+    segment_type = ""
+
+    def __init__(self, file_id: str):
+        super().__init__(self.segment_type, {"file_id": file_id})
+
+    @property
+    def file_id(self) -> str:
+        return self.data.get("file_id", "")
+
+
+class Image(_File):
+    __slots__ = ()
+    segment_type = "image"
+
+
+class Voice(_File):
+    __slots__ = ()
+    segment_type = "voice"
+
+
+class Audio(_File):
+    __slots__ = ()
+    segment_type = "audio"
+
+
+class Video(_File):
+    __slots__ = ()
+    segment_type = "video"
+
+
+class File(_File):
+    __slots__ = ()
+    segment_type = "file"
+
+
+class Location(Segment):
+    __slots__ = ()
+
+    def __init__(self, latitude: float, longitude: float, title: str = "", content: str = ""):
+        data = {"latitude": latitude, "longitude": longitude}
+        if title:
+            data["title"] = title
+        if content:
+            data["content"] = content
+        super().__init__("location", data)
+
+    @property
+    def latitude(self) -> float:
+        return self.data.get("latitude", 0.0)
+
+    @property
+    def longitude(self) -> float:
+        return self.data.get("longitude", 0.0)
+
+
+SEGMENT_TYPES: Dict[str, Type[Segment]] = {
+    "text": Text,
+    "mention": Mention,
+    "mention_all": MentionAll,
+    "reply": Reply,
+    "image": Image,
+    "voice": Voice,
+    "audio": Audio,
+    "video": Video,
+    "file": File,
+    "location": Location,
+}
+
+
+def make_segment(type: str, data: Optional[Dict[str, Any]] = None) -> Segment:
+    """按 type 构造对应的消息段类，data 原样引用；未知类型返回通用 Segment"""
+    cls = SEGMENT_TYPES.get(type, Segment)
+    segment = cls.__new__(cls)
+    segment.type = type
+    segment.data = data if data is not None else {}
+    return segment
+
+
+def _fields(segment: Any) -> Tuple[Any, Dict[str, Any]]:
+    if isinstance(segment, Segment):
+        return segment.type, segment.data
+    if isinstance(segment, dict):
+        data = segment.get("data")
+        return segment.get("type"), data if isinstance(data, dict) else {}
+    return None, {}
+
+
+MessageLike = Union[None, str, Segment, Dict[str, Any], Iterable[Union[Segment, Dict[str, Any]]]]
+
+
+class Message(Sequence):
+    """
+    消息段序列
+
+    包装原始的消息段列表，首次按下标或迭代访问时才构造 Segment；plain_text / mentions /
+    mention_all / reply_id 在首次访问时一次扫描原始列表得出并缓存，不构造消息段。
+    原始列表之后不应再被修改。
+    """
+
+    __slots__ = ("_raw", "_segments", "_plain_text", "_mentions", "_mention_all", "_reply_id")
+
+    def __init__(self, message: MessageLike = None):
+        if type(message) is list:
+            raw: List[Any] = message
+        elif message is None:
+            raw = []
+        elif isinstance(message, str):
+            raw = [Text(message)]
+        elif isinstance(message, (Segment, dict)):
+            raw = [message]
+        elif isinstance(message, Message):
+            raw = message._raw
+        elif isinstance(message, list):
+            raw = message
+        else:
+            raw = list(message)
+        self._raw = raw
+        self._segments: Optional[Tuple[Segment, ...]] = None
+        self._plain_text: Optional[str] = None
+        self._mentions: Tuple[str, ...] = ()
+        self._mention_all = False
+        self._reply_id: Optional[str] = None
+
+    @property
+    def segments(self) -> Tuple[Segment, ...]:
+        if self._segments is None:
+            self._segments = tuple(
+                segment if isinstance(segment, Segment) else make_segment(*_fields(segment))
+                for segment in self._raw
+            )
+        return self._segments
+
+    def __getitem__(self, index):
+        return self.segments[index]
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return iter(self.segments)
+
+    def _scan(self):
+        parts = []
+        mentions = []
+        mention_all = False
+        reply_id = None
+        for segment in self._raw:
+            if type(segment) is dict:
+                seg_type = segment.get("type")
+                data = segment.get("data")
+                if not isinstance(data, dict):
+                    continue
+            else:
+                seg_type, data = _fields(segment)
+            if seg_type == "text":
+                parts.append(str(data.get("text", "")))
+            elif seg_type == "mention":
+                if data.get("user_id") is not None:
+                    mentions.append(str(data["user_id"]))
+            elif seg_type == "mention_all":
+                mention_all = True
+            elif seg_type == "reply" and reply_id is None:
+                reply_id = str(data.get("message_id", ""))
+        self._plain_text = "".join(parts)
+        self._mentions = tuple(mentions)
+        self._mention_all = mention_all
+        self._reply_id = reply_id
+
+    @property
+    def plain_text(self) -> str:
+        if self._plain_text is None:
+            self._scan()
+        return self._plain_text
+
+    @property
+    def mentions(self) -> Tuple[str, ...]:
+        if self._plain_text is None:
+            self._scan()
+        return self._mentions
+
+    @property
+    def mention_all(self) -> bool:
+        if self._plain_text is None:
+            self._scan()
+        return self._mention_all
+
+    @property
+    def reply_id(self) -> Optional[str]:
+        if self._plain_text is None:
+            self._scan()
+        return self._reply_id
+
+    def is_mentioned(self, user_id: Any) -> bool:
+        return self.mention_all or str(user_id) in self.mentions
+
+    def to_wire(self) -> List[Dict[str, Any]]:
+        return [
+            segment.to_wire() if isinstance(segment, Segment) else segment
+            for segment in self._raw
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Message, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Message({self.to_wire()!r})"
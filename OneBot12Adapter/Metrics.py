@@ -0,0 +1,205 @@
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(LATENCY_BUCKETS + (float("inf"),), self.counts)),
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class EndpointMetrics:
+    __slots__ = ("ok", "failed", "timeouts", "latency")
+
+    def __init__(self):
+        self.ok = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.latency = LatencyHistogram()
+
+
+class AccountMetrics:
+    """
+    单账户的连接与 API 计数
+
+    只做整数累加与直方图落桶；未开启 metrics 的账户不会创建本对象，热路径上只多一次 dict 查找。
+    文本帧的字节数按字符数计，避免为统计而重新编码。
+    """
+
+    __slots__ = (
+        "frames_in",
+        "frames_out",
+        "bytes_in",
+        "bytes_out",
+        "decode_seconds",
+        "events",
+        "connects",
+        "reconnects",
+        "disconnects",
+        "endpoints",
+        "_second",
+        "_second_events",
+        "events_per_second",
+    )
+
+    def __init__(self):
+        self.frames_in = 0
+        self.frames_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.decode_seconds = 0.0
+        self.events = 0
+        self.connects = 0
+        self.reconnects = 0
+        self.disconnects = 0
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self._second = 0
+        self._second_events = 0
+        self.events_per_second = 0
+
+    def frame_in(self, size: int, decode_seconds: float):
+        self.frames_in += 1
+        self.bytes_in += size
+        self.decode_seconds += decode_seconds
+
+    def frame_out(self, size: int):
+        self.frames_out += 1
+        self.bytes_out += size
+
+    def event(self):
+        self.events += 1
+        second = int(time.monotonic())
+        if second != self._second:
+            self.events_per_second = self._second_events if second == self._second + 1 else 0
+            self._second = second
+            self._second_events = 0
+        self._second_events += 1
+
+    def api(self, endpoint: str, seconds: float, status: str):
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointMetrics()
+        if status == "ok":
+            stats.ok += 1
+        elif status == "timeout":
+            stats.timeouts += 1
+        else:
+            stats.failed += 1
+        stats.latency.observe(seconds)
+
+    def snapshot(self, pending: int = 0, outbox_depth: int = 0) -> Dict[str, Any]:
+        if int(time.monotonic()) > self._second + 1:
+            self.events_per_second = 0
+        return {
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "decode_seconds": self.decode_seconds,
+            "decode_avg_us": self.decode_seconds / self.frames_in * 1e6 if self.frames_in else 0.0,
+            "events": self.events,
+            "events_per_second": self.events_per_second,
+            "pending": pending,
+            "outbox_depth": outbox_depth,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "disconnects": self.disconnects,
+            "api": {
+                name: {
+                    "ok": s.ok,
+                    "failed": s.failed,
+                    "timeouts": s.timeouts,
+                    "latency": s.latency.snapshot(),
+                }
+                for name, s in self.endpoints.items()
+            },
+        }
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(snapshots: Dict[str, Dict[str, Any]], prefix: str = "onebot12") -> str:
+    lines: List[str] = []
+
+    def family(name: str, kind: str, samples: List[tuple]):
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            text = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{prefix}_{name}{{{text}}} {value}")
+
+    def per_account(key: str) -> List[tuple]:
+        return [({"account": name}, snap[key]) for name, snap in snapshots.items()]
+
+    for key, name in (
+        ("frames_in", "frames_in_total"),
+        ("frames_out", "frames_out_total"),
+        ("bytes_in", "bytes_in_total"),
+        ("bytes_out", "bytes_out_total"),
+        ("decode_seconds", "decode_seconds_total"),
+        ("events", "events_total"),
+        ("connects", "connects_total"),
+        ("reconnects", "reconnects_total"),
+        ("disconnects", "disconnects_total"),
+    ):
+        family(name, "counter", per_account(key))
+    family("events_per_second", "gauge", per_account("events_per_second"))
+    family("pending_requests", "gauge", per_account("pending"))
+    family("outbox_depth", "gauge", per_account("outbox_depth"))
+
+    calls: List[tuple] = []
+    buckets: List[tuple] = []
+    sums: List[tuple] = []
+    counts: List[tuple] = []
+    for account, snap in snapshots.items():
+        for endpoint, stats in snap["api"].items():
+            labels = {"account": account, "endpoint": endpoint}
+            for status, key in (("ok", "ok"), ("failed", "failed"), ("timeout", "timeouts")):
+                calls.append(({**labels, "status": status}, stats[key]))
+            latency = stats["latency"]
+            cumulative = 0
+            for bound, count in latency["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                buckets.append(({**labels, "le": le}, cumulative))
+            sums.append((labels, latency["sum"]))
+            counts.append((labels, latency["count"]))
+    family("api_calls_total", "counter", calls)
+    lines.append(f"# TYPE {prefix}_api_latency_seconds histogram")
+    for suffix, samples in (("bucket", buckets), ("sum", sums), ("count", counts)):
+        for labels, value in samples:
+            text = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{prefix}_api_latency_seconds_{suffix}{{{text}}} {value}")
+    return "\n".join(lines) + "\n"
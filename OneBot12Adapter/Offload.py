@@ -0,0 +1,151 @@
+import asyncio
+import base64
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
+
+from .Binary import decode_binary, encode_binary_action
+from .Codec import PreEncoded, encode_action, get_codec
+
+OFFLOAD_EXECUTORS = ("thread", "process")
+
+# 3 的倍数，分段编码结果可直接拼接；线程模式下段与段之间可以让出 GIL
+_B64_CHUNK = 3 * 65536
+
+
+def make_executor(kind: str, workers: int) -> Executor:
+    workers = max(1, int(workers))
+    if kind == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(workers)
+    return ThreadPoolExecutor(workers, thread_name_prefix="onebot12-offload")
+
+
+def exceeds(obj: Any, limit: int) -> bool:
+    """粗略估计对象编码后的大小是否达到 limit 字节，只累加字符串与字节串长度，达到即停止遍历"""
+    budget = limit
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str or kind is bytes or kind is bytearray:
+            budget -= len(item)
+        elif kind is dict:
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif isinstance(item, PreEncoded):
+            budget -= len(item.text)
+        elif hasattr(item, "to_wire"):
+            stack.append(item.to_wire())
+        if budget <= 0:
+            return True
+    return False
+
+
+def b64encode_text(data: Union[bytes, bytearray, memoryview]) -> str:
+    view = memoryview(data)
+    if len(view) <= _B64_CHUNK:
+        return base64.b64encode(view).decode("ascii")
+    return "".join(
+        base64.b64encode(view[i : i + _B64_CHUNK]).decode("ascii")
+        for i in range(0, len(view), _B64_CHUNK)
+    )
+
+
+def decode_frame(codec_name: str, raw: Union[str, bytes], binary: bool) -> Tuple[str, Any]:
+    codec = get_codec(codec_name)
+    if binary:
+        return decode_binary(raw, codec)
+    return "json", codec.loads(raw)
+
+
+def encode_frame(
+    codec_name: str, frame_format: Optional[str], payload: Dict[str, Any]
+) -> Union[str, bytes]:
+    codec = get_codec(codec_name)
+    if frame_format is None:
+        return encode_action(codec, payload)
+    return encode_binary_action(frame_format, codec, payload)
+
+
+class Offloader:
+    """
+    单账户的大负载卸载策略
+
+    达到 threshold 字节的帧解码、动作编码与 base64 编码交给共享的线程池或进程池执行，事件循环只等待结果。
+    线程模式下 orjson 等 C 扩展在单次调用期间持有 GIL，仍会阻塞循环，此时应使用进程模式；
+    base64 分段编码，线程模式即可让出 GIL。
+    """
+
+    __slots__ = ("threshold", "kind", "executor", "calls", "seconds")
+
+    def __init__(self, threshold: int, kind: str, executor: Executor):
+        self.threshold = max(1, int(threshold))
+        self.kind = kind
+        self.executor = executor
+        self.calls: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+
+    async def run(self, op: str, fn: Callable[..., Any], *args) -> Any:
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.calls[op] = self.calls.get(op, 0) + 1
+            self.seconds[op] = self.seconds.get(op, 0.0) + time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.kind,
+            "threshold": self.threshold,
+            "ops": {
+                op: {"calls": calls, "avg_ms": self.seconds[op] / calls * 1000}
+                for op, calls in self.calls.items()
+            },
+        }
+
+
+class LoopLagMonitor:
+    """
+    事件循环延迟
+
+    每 interval 秒调度一次定时回调，记录实际唤醒时间比预期晚了多少；
+    保留最近 window 个样本计算平均值与 p99，max 为启动以来的最大值。
+    """
+
+    __slots__ = ("interval", "samples", "last", "max", "count")
+
+    def __init__(self, interval: float = 0.05, window: int = 1200):
+        self.interval = max(0.001, float(interval))
+        self.samples: Deque[float] = deque(maxlen=max(1, int(window)))
+        self.last = 0.0
+        self.max = 0.0
+        self.count = 0
+
+    async def run(self):
+        interval = self.interval
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples.append(lag)
+            self.last = lag
+            self.count += 1
+            if lag > self.max:
+                self.max = lag
+
+    def stats(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+        return {
+            "interval_ms": self.interval * 1000,
+            "samples": self.count,
+            "last_ms": self.last * 1000,
+            "avg_ms": sum(ordered) / len(ordered) * 1000 if ordered else 0.0,
+            "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+            if ordered
+            else 0.0,
+            "max_ms": self.max * 1000,
+        }
@@ -0,0 +1,229 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    priority TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT NOT NULL DEFAULT '',
+    UNIQUE (account, key)
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (account, status, next_at);
+"""
+
+
+class OutboxEntry:
+    __slots__ = ("id", "key", "payload", "priority", "attempts")
+
+    def __init__(self, id: int, key: str, payload: str, priority: Optional[str], attempts: int):
+        self.id = id
+        self.key = key
+        self.payload = payload
+        self.priority = priority
+        self.attempts = attempts
+
+
+class Outbox:
+    """
+    SQLite 持久化的出站队列
+
+    入队在事务提交后才返回，进程崩溃或重启后未送达的条目会被重新发送（至少一次）。
+    同一账户内幂等键唯一，重复入队返回已有条目；已送达的条目保留 keep 秒用于幂等判断，
+    失败（dead）的条目保留 keep_dead 秒供排查，过期后与已送达条目一起清理，文件大小不会无限增长。
+    并发的入队请求合并为一个事务提交；数据库操作在线程中串行执行，多个账户可共用同一个文件。
+    """
+
+    def __init__(self, path: str, keep: float = 86400.0, keep_dead: float = 7 * 86400.0):
+        self.path = path
+        self.keep = float(keep)
+        self.keep_dead = float(keep_dead)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+        self._db.executescript(_SCHEMA)
+        self._mutex = threading.Lock()
+        self._queued: List[tuple] = []
+        self._flushing: Optional[asyncio.Future] = None
+        self._depth: Dict[str, int] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._pruned_at = 0.0
+        for account, depth in self._db.execute(
+            "SELECT account, COUNT(*) FROM outbox WHERE status = 'pending' GROUP BY account"
+        ):
+            self._depth[account] = depth
+
+    def _count(self, account: str, name: str, value: int = 1):
+        counters = self._counters.get(account)
+        if counters is None:
+            counters = self._counters[account] = dict.fromkeys(
+                ("enqueued", "duplicates", "delivered", "retried", "dead"), 0
+            )
+        counters[name] += value
+
+    def _locked(self, fn, *args):
+        with self._mutex:
+            return fn(*args)
+
+    async def _run(self, fn, *args):
+        return await asyncio.to_thread(self._locked, fn, *args)
+
+    def depth(self, account: str) -> int:
+        return self._depth.get(account, 0)
+
+    def _insert(self, rows: List[Tuple[str, str, str, Optional[str]]]) -> List[Tuple[int, bool]]:
+        now = time.time()
+        results = []
+        with self._db:
+            self._db.execute("BEGIN")
+            for account, key, payload, priority in rows:
+                cursor = self._db.execute(
+                    "INSERT OR IGNORE INTO outbox"
+                    " (account, key, payload, priority, next_at, created_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (account, key, payload, priority, now, now, now),
+                )
+                if cursor.rowcount:
+                    results.append((cursor.lastrowid, True))
+                    continue
+                row = self._db.execute(
+                    "SELECT id FROM outbox WHERE account = ? AND key = ?", (account, key)
+                ).fetchone()
+                results.append((row[0], False))
+        return results
+
+    async def _flush(self):
+        try:
+            while self._queued:
+                batch, self._queued = self._queued, []
+                try:
+                    results = await self._run(self._insert, [item[:4] for item in batch])
+                except Exception as e:
+                    for item in batch:
+                        if not item[4].done():
+                            item[4].set_exception(e)
+                    continue
+                for (account, key, _, _, future), (entry_id, created) in zip(batch, results):
+                    if created:
+                        self._depth[account] = self._depth.get(account, 0) + 1
+                        self._count(account, "enqueued")
+                    else:
+                        self._count(account, "duplicates")
+                    if not future.done():
+                        future.set_result((entry_id, key, created))
+        finally:
+            self._flushing = None
+
+    async def enqueue(
+        self, account: str, payload: str, key: Optional[str] = None, priority: Optional[str] = None
+    ) -> Tuple[int, str, bool]:
+        """返回 (条目 id, 幂等键, 是否新入队)"""
+        future = asyncio.get_running_loop().create_future()
+        self._queued.append((account, key or uuid.uuid4().hex, payload, priority, future))
+        if self._flushing is None:
+            self._flushing = asyncio.ensure_future(self._flush())
+        return await future
+
+    def _due(self, account: str, limit: int) -> List[OutboxEntry]:
+        rows = self._db.execute(
+            "SELECT id, key, payload, priority, attempts FROM outbox"
+            " WHERE account = ? AND status = 'pending' AND next_at <= ? ORDER BY id LIMIT ?",
+            (account, time.time(), limit),
+        ).fetchall()
+        return [OutboxEntry(*row) for row in rows]
+
+    async def due(self, account: str, limit: int = 32) -> List[OutboxEntry]:
+        return await self._run(self._due, account, max(1, int(limit)))
+
+    def _next_due(self, account: str) -> Optional[float]:
+        row = self._db.execute(
+            "SELECT MIN(next_at) FROM outbox WHERE account = ? AND status = 'pending'", (account,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def next_due(self, account: str) -> Optional[float]:
+        return await self._run(self._next_due, account)
+
+    def _settle(
+        self,
+        sent: List[int],
+        retry: List[Tuple[int, float, str]],
+        dead: List[Tuple[int, str]],
+        defer: List[Tuple[int, float]],
+    ):
+        now = time.time()
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "UPDATE outbox SET status = 'sent', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(now, entry_id) for entry_id in sent],
+            )
+            self._db.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, next_at = ?, last_error = ?, updated_at = ?"
+                " WHERE id = ?",
+                [(next_at, error, now, entry_id) for entry_id, next_at, error in retry],
+            )
+            self._db.executemany(
+                "UPDATE outbox SET status = 'dead', attempts = attempts + 1, last_error = ?, updated_at = ?"
+                " WHERE id = ?",
+                [(error, now, entry_id) for entry_id, error in dead],
+            )
+            self._db.executemany(
+                "UPDATE outbox SET next_at = ?, updated_at = ? WHERE id = ?",
+                [(next_at, now, entry_id) for entry_id, next_at in defer],
+            )
+            if now - self._pruned_at > 60:
+                self._pruned_at = now
+                self._db.execute(
+                    "DELETE FROM outbox WHERE (status = 'sent' AND updated_at < ?)"
+                    " OR (status = 'dead' AND updated_at < ?)",
+                    (now - self.keep, now - self.keep_dead),
+                )
+
+    async def settle(
+        self,
+        account: str,
+        sent: List[int],
+        retry: List[Tuple[int, float, str]],
+        dead: List[Tuple[int, str]],
+        defer: Optional[List[Tuple[int, float]]] = None,
+    ):
+        """
+        一个事务内记录一批发送结果：sent 为已送达，retry 为 (id, 下次时间, 错误)，dead 为 (id, 错误)，
+        defer 为 (id, 下次时间)，只推迟发送、不计尝试次数
+        """
+        await self._run(self._settle, sent, retry, dead, defer or [])
+        self._depth[account] = max(0, self._depth.get(account, 0) - len(sent) - len(dead))
+        self._count(account, "delivered", len(sent))
+        self._count(account, "retried", len(retry))
+        self._count(account, "dead", len(dead))
+
+    def stats(self, account: str) -> Dict[str, Any]:
+        counters = self._counters.get(account) or {}
+        return {
+            "depth": self.depth(account),
+            "enqueued": counters.get("enqueued", 0),
+            "duplicates": counters.get("duplicates", 0),
+            "delivered": counters.get("delivered", 0),
+            "retried": counters.get("retried", 0),
+            "dead": counters.get("dead", 0),
+            "path": self.path,
+        }
+
+    def close(self):
+        with self._mutex:
+            self._db.close()
@@ -0,0 +1,54 @@
+import asyncio
+from itertools import count
+from typing import Any, Dict, Optional, Tuple
+
+
+class ConnectionLost(ConnectionError):
+    """请求已发出但连接在收到响应前断开"""
+
+
+class PendingRequests:
+    """单账户的 API 请求等待表，echo 由 连接代数 + 自增序号 构成，保证唯一"""
+
+    __slots__ = ("_epoch", "_seq", "_futures")
+
+    def __init__(self, epoch: int = 0):
+        self._epoch = epoch
+        self._seq = count(1)
+        self._futures: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def next_echo(self) -> str:
+        """只生成 echo 而不登记等待，用于响应随请求直接返回的通道（HTTP）"""
+        return f"{self._epoch}-{next(self._seq)}"
+
+    def allocate(self) -> Tuple[str, asyncio.Future]:
+        echo = self.next_echo()
+        future = asyncio.get_running_loop().create_future()
+        self._futures[echo] = future
+        return echo, future
+
+    def resolve(self, echo: Any, data: Any) -> bool:
+        future = self._futures.pop(str(echo), None)
+        if future is None or future.done():
+            return False
+        future.set_result(data)
+        return True
+
+    def discard(self, echo: str) -> Optional[asyncio.Future]:
+        return self._futures.pop(echo, None)
+
+    def fail_all(self, exc: BaseException) -> int:
+        futures, self._futures = self._futures, {}
+        failed = 0
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(exc)
+                failed += 1
+        return failed
@@ -0,0 +1,82 @@
+from itertools import count
+from typing import Any, List, Optional
+
+from .Liveness import LivenessTracker
+from .Pending import PendingRequests
+
+
+class PooledConnection:
+    """
+    连接池中的单个 WebSocket 连接，持有各自的请求等待表与存活状态
+
+    frame_format 为发送动作使用的二进制格式（None 为文本 JSON）；
+    mirror 为真时收到首个二进制帧后改用与之相同的格式。
+    """
+
+    __slots__ = ("ws", "pending", "tracker", "watchdog", "frame_format", "mirror")
+
+    def __init__(self, ws: Any, pending: PendingRequests, tracker: Optional[LivenessTracker] = None):
+        self.ws = ws
+        self.pending = pending
+        self.tracker = tracker
+        self.watchdog = None
+        self.frame_format: Optional[str] = None
+        self.mirror = False
+
+    @property
+    def closed(self) -> bool:
+        return bool(getattr(self.ws, "closed", False))
+
+
+class ConnectionPool:
+    """
+    单账户的连接池
+
+    每个连接使用账户内唯一的代数作为 echo 前缀，响应优先在收到它的连接上匹配，
+    API 调用选择未完成请求最少的连接发送。
+    """
+
+    __slots__ = ("members", "_epochs")
+
+    def __init__(self):
+        self.members: List[PooledConnection] = []
+        self._epochs = count(1)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def add(self, ws: Any, tracker: Optional[LivenessTracker] = None) -> PooledConnection:
+        member = PooledConnection(ws, PendingRequests(next(self._epochs)), tracker)
+        self.members.append(member)
+        return member
+
+    def remove(self, member: PooledConnection) -> bool:
+        try:
+            self.members.remove(member)
+            return True
+        except ValueError:
+            return False
+
+    def pick(self) -> Optional[PooledConnection]:
+        best = None
+        for member in self.members:
+            if member.closed:
+                continue
+            if best is None or len(member.pending) < len(best.pending):
+                best = member
+        return best
+
+    def resolve(self, echo: Any, data: Any, member: Optional[PooledConnection] = None) -> bool:
+        if member is not None and member.pending.resolve(echo, data):
+            return True
+        return any(m.pending.resolve(echo, data) for m in self.members if m is not member)
+
+    @property
+    def primary(self) -> Optional[Any]:
+        for member in reversed(self.members):
+            if not member.closed:
+                return member.ws
+        return None
+
+    def pending_count(self) -> int:
+        return sum(len(member.pending) for member in self.members)
@@ -0,0 +1,70 @@
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+RAW_EVENT_MODES = ("view", "copy", "off")
+
+MISSING = object()
+_HIDDEN = frozenset(("onebot12_raw", "onebot12_raw_type", "onebot12_message"))
+
+
+class RawEventView(Mapping):
+    """
+    原始事件的只读视图
+
+    与标准化后的事件共享数据，只保留被标准化覆盖的 platform / self 原值，
+    需要独立 dict 时调用 to_dict() 按需生成快照。
+    """
+
+    __slots__ = ("_event", "_platform", "_self")
+
+    def __init__(self, event: Dict[str, Any]):
+        self._event = event
+        self._platform = event.get("platform", MISSING)
+        self._self = event.get("self", MISSING)
+
+    def _override(self, key: str) -> Any:
+        if key == "platform":
+            return self._platform
+        if key == "self":
+            return self._self
+        return MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "platform" or key == "self" or key in _HIDDEN:
+            value = self._override(key)
+            if value is MISSING:
+                raise KeyError(key)
+            return value
+        return self._event[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key == "platform" or key == "self" or key in _HIDDEN:
+            return self._override(key) is not MISSING
+        return key in self._event
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._event:
+            if key in self:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    def copy(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __deepcopy__(self, memo) -> Dict[str, Any]:
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"RawEventView({self.to_dict()!r})"
@@ -0,0 +1,39 @@
+import random
+
+IDEMPOTENT_PREFIXES = ("get_",)
+
+
+def is_idempotent(endpoint: str) -> bool:
+    return endpoint.startswith(IDEMPOTENT_PREFIXES)
+
+
+class Backoff:
+    """指数退避：首次等待 initial 秒，每次乘以 multiplier，不超过 maximum，并加入 ±jitter 比例的随机抖动"""
+
+    __slots__ = ("initial", "maximum", "multiplier", "jitter", "attempts")
+
+    def __init__(
+        self,
+        initial: float = 0.5,
+        maximum: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+    ):
+        self.initial = max(0.0, float(initial))
+        self.maximum = max(self.initial, float(maximum))
+        self.multiplier = max(1.0, float(multiplier))
+        self.jitter = min(1.0, max(0.0, float(jitter)))
+        self.attempts = 0
+
+    def next(self) -> float:
+        delay = self.initial * self.multiplier ** self.attempts
+        if delay < self.maximum:
+            self.attempts += 1
+        else:
+            delay = self.maximum
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return min(self.maximum, delay)
+
+    def reset(self):
+        self.attempts = 0
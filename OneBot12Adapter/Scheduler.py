@@ -0,0 +1,148 @@
+import asyncio
+import heapq
+import time
+from collections import OrderedDict, deque
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+from .RateLimit import TokenBucket
+
+PRIORITIES = ("interactive", "management", "bulk")
+
+INTERACTIVE_ACTIONS = frozenset(("send_message", "delete_message", "edit_message"))
+
+
+def action_priority(endpoint: str) -> str:
+    return "interactive" if endpoint in INTERACTIVE_ACTIONS else "management"
+
+
+def target_key(params: Dict[str, Any]) -> Optional[str]:
+    target = (
+        params.get("group_id")
+        or params.get("channel_id")
+        or params.get("guild_id")
+        or params.get("user_id")
+    )
+    if not target:
+        return None
+    return f"{params.get('detail_type', '')}:{target}"
+
+
+class _WaitStats:
+    __slots__ = ("count", "queued", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.queued = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque = deque(maxlen=1024)
+
+    def record(self, wait: float):
+        self.count += 1
+        self.total += wait
+        if wait > self.max:
+            self.max = wait
+        self.samples.append(wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def pct(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))] if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "queued": self.queued,
+            "avg_wait": self.total / self.count if self.count else 0.0,
+            "max_wait": self.max,
+            "p50_wait": pct(0.5),
+            "p99_wait": pct(0.99),
+        }
+
+
+class OutboundScheduler:
+    """
+    单账户的出站调度器
+
+    先按目标（群/用户）令牌桶限速，再进入账户全局令牌桶；全局令牌不足时按
+    interactive > management > bulk 的优先级、同级先到先得的顺序放行。
+    """
+
+    def __init__(
+        self,
+        rate: float = 0,
+        burst: float = 0,
+        target_rate: float = 0,
+        target_burst: float = 0,
+        max_targets: int = 4096,
+    ):
+        self.bucket = TokenBucket(rate, burst or None)
+        self.target_rate = float(target_rate)
+        self.target_burst = target_burst or None
+        self.max_targets = max(1, int(max_targets))
+        self._targets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = count()
+        self._pump: Optional[asyncio.Task] = None
+        self._stats = {name: _WaitStats() for name in PRIORITIES}
+
+    def _target_bucket(self, key: str) -> TokenBucket:
+        bucket = self._targets.get(key)
+        if bucket is None:
+            bucket = self._targets[key] = TokenBucket(self.target_rate, self.target_burst)
+            while len(self._targets) > self.max_targets:
+                self._targets.popitem(last=False)
+        else:
+            self._targets.move_to_end(key)
+        return bucket
+
+    async def acquire(self, priority: str = "management", target: Optional[str] = None) -> float:
+        stats = self._stats.get(priority)
+        if stats is None:
+            priority, stats = "management", self._stats["management"]
+        start = time.monotonic()
+        stats.queued += 1
+        try:
+            if target is not None and self.target_rate > 0:
+                await self._target_bucket(target).acquire()
+            if self.bucket.rate > 0 and (self._waiters or not self.bucket.try_acquire()):
+                future = asyncio.get_running_loop().create_future()
+                heapq.heappush(
+                    self._waiters, (PRIORITIES.index(priority), next(self._seq), future)
+                )
+                if self._pump is None or self._pump.done():
+                    self._pump = asyncio.create_task(self._run_pump())
+                await future
+        finally:
+            stats.queued -= 1
+        wait = time.monotonic() - start
+        stats.record(wait)
+        return wait
+
+    async def _run_pump(self):
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.bucket.try_acquire():
+                heapq.heappop(self._waiters)[2].set_result(None)
+                continue
+            await asyncio.sleep(self.bucket.delay())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.bucket.rate,
+            "target_rate": self.target_rate,
+            "targets": len(self._targets),
+            "waiting": len(self._waiters),
+            "priorities": {name: s.snapshot() for name, s in self._stats.items()},
+        }
+
+    def close(self):
+        if self._pump is not None and not self._pump.done():
+            self._pump.cancel()
+        for _, _, future in self._waiters:
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
@@ -0,0 +1,116 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Iterable, Tuple
+
+COALESCE_ENDPOINTS = frozenset(
+    (
+        "get_self_info",
+        "get_user_info",
+        "get_friend_list",
+        "get_group_info",
+        "get_group_list",
+        "get_group_member_info",
+        "get_group_member_list",
+        "get_guild_info",
+        "get_guild_list",
+        "get_guild_member_info",
+        "get_guild_member_list",
+        "get_channel_info",
+        "get_channel_list",
+        "get_channel_member_info",
+        "get_channel_member_list",
+        "get_status",
+        "get_version",
+        "get_supported_actions",
+    )
+)
+
+CallKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def call_key(endpoint: str, params: Dict[str, Any]) -> CallKey:
+    return endpoint, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+def parse_endpoints(spec: str, base: Iterable[str] = COALESCE_ENDPOINTS) -> FrozenSet[str]:
+    """解析 "get_file,-get_status" 形式的白名单调整：加入接口，以 - 开头的从白名单移除"""
+    endpoints = set(base)
+    for item in (spec or "").split(","):
+        name = item.strip()
+        if name.startswith("-"):
+            endpoints.discard(name[1:].strip())
+        elif name:
+            endpoints.add(name)
+    return frozenset(endpoints)
+
+
+class SingleFlight:
+    """
+    相同 key 的并发调用只执行一次，其余调用等待并共享同一结果
+
+    实际调用在独立的 Task 中执行，发起者被取消不会影响其他等待者。
+    """
+
+    __slots__ = ("_calls", "calls", "collapsed")
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def _done(self, key: Hashable, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+            self.calls += 1
+        else:
+            self.collapsed += 1
+        return await asyncio.shield(task)
+
+
+class CallCoalescer:
+    """
+    单账户的请求合并
+
+    白名单内接口参数相同的并发请求共享一次发送与同一个响应对象，调用方不应修改返回值。
+    get_latest_events 等会改变实现端状态的接口不应加入白名单。
+    """
+
+    __slots__ = ("endpoints", "_flight", "by_endpoint")
+
+    def __init__(self, endpoints: Iterable[str] = COALESCE_ENDPOINTS):
+        self.endpoints = frozenset(endpoints)
+        self._flight = SingleFlight()
+        self.by_endpoint: Dict[str, int] = {}
+
+    def coalescable(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    async def do(
+        self, endpoint: str, params: Dict[str, Any], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        key = call_key(endpoint, params)
+        if key in self._flight:
+            self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+        return await self._flight.do(key, call)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self._flight.calls,
+            "collapsed": self._flight.collapsed,
+            "in_flight": len(self._flight),
+            "by_endpoint": dict(self.by_endpoint),
+        }
@@ -0,0 +1,215 @@
+import asyncio
+import base64
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterable, Awaitable, Callable, Optional, Tuple, Union
+
+MediaSource = Union[str, bytes, bytearray, memoryview, os.PathLike, AsyncIterable[bytes]]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_INLINE_LIMIT = 1024 * 1024
+
+
+def is_upload_source(file: Any) -> bool:
+    return isinstance(file, (bytes, bytearray, memoryview, os.PathLike)) or hasattr(
+        file, "__aiter__"
+    )
+
+
+def _read_chunk(path: str, offset: int, size: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def _digest_and_encode(hasher, chunk: bytes) -> str:
+    hasher.update(chunk)
+    return base64.b64encode(chunk).decode("ascii")
+
+
+async def _spool(source: AsyncIterable[bytes]) -> str:
+    fd, path = tempfile.mkstemp(prefix="onebot12-upload-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            async for chunk in source:
+                await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+class FileUploader:
+    """
+    上传文件：不超过 single_shot_limit 时走 upload_file，否则走 upload_file_fragmented 分片上传
+
+    bytes / 文件路径 / 异步字节迭代器均可作为来源；异步迭代器会先落盘到临时文件以获得总大小。
+    sha256 计算与 base64 编码在线程中完成，分片上传时读取下一片与发送当前片并行。
+    """
+
+    def __init__(
+        self,
+        call_api: Callable[..., Awaitable[dict]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        single_shot_limit: int = 0,
+    ):
+        self._call_api = call_api
+        self.chunk_size = max(1, int(chunk_size))
+        self.single_shot_limit = int(single_shot_limit)
+
+    async def upload(
+        self,
+        source: MediaSource,
+        name: str,
+        account_id: Optional[str],
+        sha256: Optional[str] = None,
+    ) -> dict:
+        async with spooled(source) as source:
+            size = await source_size(source)
+            if size <= self.single_shot_limit:
+                return await self._upload_single(source, name, account_id, sha256)
+            return await self._upload_fragmented(source, size, name, account_id, sha256)
+
+    async def _upload_single(
+        self, source: Any, name: str, account_id: Optional[str], sha256: Optional[str]
+    ) -> dict:
+        content = await read_source(source)
+
+        def encode() -> Tuple[str, str]:
+            digest = sha256 or hashlib.sha256(content).hexdigest()
+            return base64.b64encode(content).decode("ascii"), digest
+
+        data, digest = await asyncio.to_thread(encode)
+        return await self._call_api(
+            "upload_file",
+            _account_id=account_id,
+            type="data",
+            name=name,
+            data=data,
+            sha256=digest,
+        )
+
+    async def _upload_fragmented(
+        self,
+        source: Any,
+        total_size: int,
+        name: str,
+        account_id: Optional[str],
+        sha256: Optional[str],
+    ) -> dict:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+
+            async def read(offset: int) -> bytes:
+                return view[offset : offset + self.chunk_size]
+
+        else:
+            path = os.fspath(source)
+
+            async def read(offset: int) -> bytes:
+                return await asyncio.to_thread(_read_chunk, path, offset, self.chunk_size)
+
+        resp = await self._call_api(
+            "upload_file_fragmented",
+            _account_id=account_id,
+            stage="prepare",
+            name=name,
+            total_size=total_size,
+        )
+        file_id, failed = self._file_id(resp)
+        if failed:
+            return resp
+
+        hasher = hashlib.sha256()
+
+        async def encode(offset: int) -> str:
+            chunk = await read(offset)
+            return await asyncio.to_thread(_digest_and_encode, hasher, chunk)
+
+        offsets = range(0, total_size, self.chunk_size)
+        next_chunk = asyncio.ensure_future(encode(0)) if total_size else None
+        try:
+            for index, offset in enumerate(offsets):
+                data = await next_chunk
+                next_chunk = (
+                    asyncio.ensure_future(encode(offsets[index + 1]))
+                    if index + 1 < len(offsets)
+                    else None
+                )
+                resp = await self._call_api(
+                    "upload_file_fragmented",
+                    _account_id=account_id,
+                    stage="transfer",
+                    file_id=file_id,
+                    offset=offset,
+                    data=data,
+                )
+                if resp.get("status") != "ok":
+                    return resp
+        finally:
+            if next_chunk is not None and not next_chunk.done():
+                next_chunk.cancel()
+
+        return await self._call_api(
+            "upload_file_fragmented",
+            _account_id=account_id,
+            stage="finish",
+            file_id=file_id,
+            sha256=sha256 or hasher.hexdigest(),
+        )
+
+    @staticmethod
+    def _file_id(resp: dict) -> Tuple[str, bool]:
+        data = resp.get("data")
+        if resp.get("status") != "ok" or not isinstance(data, dict) or not data.get("file_id"):
+            return "", True
+        return str(data["file_id"]), False
+
+
+@asynccontextmanager
+async def spooled(source: MediaSource):
+    if not hasattr(source, "__aiter__"):
+        yield source
+        return
+    path = await _spool(source)
+    try:
+        yield path
+    finally:
+        await asyncio.to_thread(os.unlink, path)
+
+
+async def source_size(source: MediaSource) -> Optional[int]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return await asyncio.to_thread(os.path.getsize, os.fspath(source))
+    return None
+
+
+async def source_sha256(source: MediaSource) -> str:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return await asyncio.to_thread(lambda: hashlib.sha256(source).hexdigest())
+    path = os.fspath(source)
+
+    def _digest() -> str:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    return await asyncio.to_thread(_digest)
+
+
+async def read_source(source: MediaSource) -> bytes:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    path = os.fspath(source)
+
+    def _read() -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    return await asyncio.to_thread(_read)
@@ -0,0 +1,57 @@
+"""
+对比各 JSON 编解码器在 OneBot12 典型负载上的编解码耗时
+
+运行: python -m benchmarks.bench_codec [--rounds 20000]
+"""
+
+import argparse
+import time
+
+from . import support  # noqa: F401  必须先于 OneBot12Adapter 导入
+from OneBot12Adapter.Codec import CODEC_NAMES, get_codec
+
+from .payloads import heartbeat_event, message_event, notice_event, send_message_action
+
+
+def _measure(fn, arg, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(arg)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    samples = {
+        "message(8 seg)": message_event(1, segments=8),
+        "notice": notice_event(1),
+        "heartbeat": heartbeat_event(1),
+        "send_message": send_message_action(1),
+    }
+
+    codecs = []
+    for name in CODEC_NAMES[1:]:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name:<8} 未安装，跳过")
+
+    reference = get_codec("json")
+    print(f"{'codec':<8} {'payload':<15} {'loads(str)':>11} {'loads(bytes)':>13} {'dumps':>9}  (us/op)")
+    for codec in codecs:
+        for label, sample in samples.items():
+            text = reference.dumps(sample)
+            raw = text.encode("utf-8")
+            print(
+                f"{codec.name:<8} {label:<15} "
+                f"{_measure(codec.loads, text, args.rounds):>11.2f} "
+                f"{_measure(codec.loads, raw, args.rounds):>13.2f} "
+                f"{_measure(codec.dumps, sample, args.rounds):>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
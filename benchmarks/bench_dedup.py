@@ -0,0 +1,46 @@
+"""
+事件去重窗口（RecentIds）的单次查重开销
+
+模拟重连后重放最近事件：事件流中按比例混入窗口内已出现过的 id。
+
+运行: python -m benchmarks.bench_dedup [--events 200000] [--dup-ratio 0.1] [--size 4096] [--window 300]
+"""
+
+import argparse
+import random
+import time
+
+from . import support  # noqa: F401
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--dup-ratio", type=float, default=0.1)
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--window", type=float, default=300.0)
+    args = parser.parse_args()
+
+    from OneBot12Adapter.Dedup import RecentIds
+
+    rng = random.Random(0)
+    ids = []
+    for seq in range(args.events):
+        if ids and rng.random() < args.dup_ratio:
+            ids.append(ids[-rng.randrange(1, min(len(ids), args.size // 2) + 1)])
+        else:
+            ids.append(f"evt-{seq}")
+
+    print(f"{'window s':>9} {'ns/event':>9} {'duplicates':>11} {'evicted':>9}")
+    for window in (0.0, args.window):
+        dedup = RecentIds(args.size, window)
+        seen = dedup.seen
+        start = time.perf_counter()
+        for event_id in ids:
+            seen(event_id)
+        elapsed = (time.perf_counter() - start) / len(ids) * 1e9
+        print(f"{window:>9g} {elapsed:>9.0f} {dedup.duplicates:>11} {dedup.evicted:>9}")
+
+
+if __name__ == "__main__":
+    main()
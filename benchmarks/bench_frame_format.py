@@ -0,0 +1,73 @@
+"""
+文本 JSON 与二进制帧（MessagePack / zlib / gzip 压缩 JSON）的体积、解码与入站处理耗时对比
+
+运行: python -m benchmarks.bench_frame_format [--frames 20000]
+"""
+
+import argparse
+import asyncio
+import gzip
+import time
+import zlib
+
+from . import support
+from .payloads import event_mix
+
+
+def _encoders(codec):
+    encoders = {
+        "text": lambda event: codec.dumps(event),
+        "zlib": lambda event: zlib.compress(codec.dumps(event).encode("utf-8")),
+        "gzip": lambda event: gzip.compress(codec.dumps(event).encode("utf-8"), mtime=0),
+    }
+    try:
+        import msgpack
+
+        encoders["msgpack"] = lambda event: msgpack.packb(event, use_bin_type=True)
+    except ImportError:
+        print("msgpack 未安装，跳过")
+    return encoders
+
+
+async def _handle(frames, binary: bool) -> float:
+    sink = support.EventSink()
+    adapter = support.make_adapter({"bench": {"mode": "server", "enabled": True}}, sink)
+    adapter._running = True
+    start = time.perf_counter()
+    for frame in frames:
+        await adapter._handle_message(frame, "bench", binary=binary)
+    elapsed = (time.perf_counter() - start) / len(frames) * 1e6
+    await adapter.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    from OneBot12Adapter.Binary import decode_binary
+    from OneBot12Adapter.Codec import get_codec
+
+    codec = get_codec("auto")
+    events = event_mix(args.frames)
+
+    print(f"JSON 编解码器: {codec.name}")
+    print(f"{'format':<8} {'avg bytes':>10} {'decode us':>10} {'handle us':>10}")
+    for name, encode in _encoders(codec).items():
+        frames = [encode(event) for event in events]
+        size = sum(len(frame) for frame in frames) / len(frames)
+
+        binary = name != "text"
+        decode = (lambda frame: decode_binary(frame, codec)) if binary else codec.loads
+        start = time.perf_counter()
+        for frame in frames:
+            decode(frame)
+        decode_us = (time.perf_counter() - start) / len(frames) * 1e6
+
+        handle_us = asyncio.run(_handle(frames, binary))
+        print(f"{name:<8} {size:>10.0f} {decode_us:>10.2f} {handle_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+OneBot12Adapter 入口的导入耗时
+
+在全新的解释器中以 -X importtime 导入 OneBot12Adapter，取 --runs 次的中位数；
+分别列出 ErisPulse 与适配器自身各模块的累计耗时，以及自身耗时最高的模块。
+
+运行: python -m benchmarks.bench_import [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from . import support
+
+
+def _import_once() -> Tuple[Dict[str, int], Dict[str, int]]:
+    env = dict(os.environ, PYTHONPATH=support.ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import OneBot12Adapter"],
+        cwd=support.WORKDIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_us: Dict[str, int] = {}
+    cumulative_us: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, total, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        self_us[module] = int(own)
+        cumulative_us[module] = int(total)
+    return self_us, cumulative_us
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [_import_once() for _ in range(args.runs)]
+
+    def median(table: int, module: str) -> float:
+        return statistics.median(run[table].get(module, 0) for run in runs) / 1000
+
+    modules: List[str] = sorted(set().union(*(run[1] for run in runs)))
+    print(f"{'module':<36} {'cumulative ms':>14}")
+    for module in ("OneBot12Adapter", "ErisPulse"):
+        print(f"{module:<36} {median(1, module):>14.1f}")
+    for module in modules:
+        if module.startswith("OneBot12Adapter."):
+            print(f"{module:<36} {median(1, module):>14.1f}")
+
+    print(f"\n{'module (top self time)':<36} {'self ms':>14}")
+    ranked = sorted(modules, key=lambda m: median(0, m), reverse=True)
+    for module in ranked[: args.top]:
+        print(f"{module:<36} {median(0, module):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
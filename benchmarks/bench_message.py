@@ -0,0 +1,106 @@
+"""
+消息段模型（Message / Segment）与 dict 表示的对比
+
+- 入站: 每个处理器各取一次纯文本与 @ 列表（模拟多个处理器），dict 每次重新扫描，Message 首次计算后缓存
+- 出站: 构造消息段并编码为动作帧的耗时，以及保留 1 万条消息段的内存
+
+运行: python -m benchmarks.bench_message [--events 20000] [--handlers 3]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from . import support  # noqa: F401
+from .payloads import message_event
+
+
+def _dict_text(message) -> str:
+    return "".join(seg["data"].get("text", "") for seg in message if seg.get("type") == "text")
+
+
+def _dict_mentions(message):
+    return [str(seg["data"]["user_id"]) for seg in message if seg.get("type") == "mention"]
+
+
+def _timed(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def _retained_kib(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [build(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--handlers", type=int, default=3)
+    args = parser.parse_args()
+
+    from OneBot12Adapter.Codec import encode_action, get_codec
+    from OneBot12Adapter.Message import Message, Reply, Text
+
+    codec = get_codec("auto")
+    messages = [message_event(i, segments=2 + i % 7)["message"] for i in range(args.events)]
+
+    def inbound_dict():
+        for message in messages:
+            for _ in range(args.handlers):
+                _dict_text(message)
+                _dict_mentions(message)
+
+    def inbound_model():
+        for message in messages:
+            wrapped = Message(message)
+            for _ in range(args.handlers):
+                wrapped.plain_text
+                wrapped.mentions
+
+    print(f"JSON 编解码器: {codec.name}，{args.handlers} 个处理器")
+    print(f"{'inbound':<10} {'us/event':>10}")
+    print(f"{'dict':<10} {_timed(inbound_dict, args.events):>10.2f}")
+    print(f"{'Message':<10} {_timed(inbound_model, args.events):>10.2f}")
+    wrapper = _retained_kib(lambda i: Message(messages[i]), 10000)
+    print(f"Message 包装额外内存: {wrapper:,.0f} KiB / 1万条")
+
+    def outbound_dict(i):
+        return [
+            {"type": "reply", "data": {"message_id": f"m{i}"}},
+            {"type": "text", "data": {"text": f"收到第{i}条消息"}},
+        ]
+
+    def outbound_model(i):
+        return [Reply(f"m{i}"), Text(f"收到第{i}条消息")]
+
+    print(f"\n{'outbound':<10} {'build+encode us':>16} {'KiB/10k':>10}")
+    for name, build in (("dict", outbound_dict), ("Segment", outbound_model)):
+
+        def encode():
+            for i in range(args.events):
+                encode_action(
+                    codec,
+                    {
+                        "action": "send_message",
+                        "params": {"detail_type": "group", "group_id": "1", "content": build(i)},
+                        "echo": i,
+                    },
+                )
+
+        print(
+            f"{name:<10} {_timed(encode, args.events):>16.2f} "
+            f"{_retained_kib(build, 10000):>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
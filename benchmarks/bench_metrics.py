@@ -0,0 +1,66 @@
+"""
+开启 / 关闭 metrics 时入站帧处理与 call_api 往返的单次耗时对比
+
+运行: python -m benchmarks.bench_metrics [--frames 20000] [--calls 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from . import support
+from .payloads import event_mix
+
+
+async def _run(metrics: bool, frames, calls: int):
+    sink = support.EventSink()
+    adapter = support.make_adapter(
+        {"bench": {"mode": "server", "enabled": True, "metrics": metrics}}, sink
+    )
+    adapter._setup_metrics()
+    impl = support.LoopbackImplementation()
+    adapter._running = True
+    reader = asyncio.create_task(adapter._ws_handler(impl.connection, "bench"))
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for frame in frames:
+        await adapter._handle_message(frame, "bench")
+    frame_us = (time.perf_counter() - start) / len(frames) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        await adapter.call_api("get_self_info", _account_id="bench")
+    call_us = (time.perf_counter() - start) / calls * 1e6
+
+    snapshot = adapter.get_metrics("bench")
+    await impl.connection.close()
+    await reader
+    await adapter.shutdown()
+    return frame_us, call_us, snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    from OneBot12Adapter.Codec import get_codec
+
+    codec = get_codec("auto")
+    frames = [codec.dumps(event) for event in event_mix(args.frames)]
+
+    print(f"{'metrics':<8} {'us/frame':>9} {'us/call':>9}")
+    for enabled in (False, True):
+        frame_us, call_us, snapshot = asyncio.run(_run(enabled, frames, args.calls))
+        print(f"{'on' if enabled else 'off':<8} {frame_us:>9.2f} {call_us:>9.2f}")
+    print(
+        f"\n快照: frames_in={snapshot['frames_in']} events={snapshot['events']} "
+        f"decode_avg={snapshot['decode_avg_us']:.2f}us "
+        f"get_self_info p99<={snapshot['api']['get_self_info']['latency']['p99']}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
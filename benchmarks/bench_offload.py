@@ -0,0 +1,118 @@
+"""
+大负载卸载（Offloader）对事件循环延迟的影响
+
+一个协程按固定间隔测量循环延迟，同时依次解码大帧（群成员列表响应）与 base64 编码大文件，
+分别在事件循环内直接执行、交给线程池、交给进程池，报告吞吐与循环延迟 p99 / max。
+
+运行: python -m benchmarks.bench_offload [--members 20000] [--frames 20] [--file-mib 8] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import time
+
+from . import support  # noqa: F401
+
+
+def member_list_frame(members: int, echo: int) -> str:
+    import json
+
+    return json.dumps(
+        {
+            "status": "ok",
+            "retcode": 0,
+            "data": [
+                {"user_id": str(100000 + i), "user_name": f"member{i}", "user_displayname": f"群名片{i}"}
+                for i in range(members)
+            ],
+            "message": "",
+            "echo": echo,
+        }
+    )
+
+
+async def measure(label: str, work, count: int, size: int):
+    from OneBot12Adapter.Offload import LoopLagMonitor
+
+    monitor = LoopLagMonitor(interval=0.002, window=100000)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)
+    task.cancel()
+    stats = monitor.stats()
+    print(
+        f"{label:<18} {count / elapsed:>10,.1f} {size * count / elapsed / 2**20:>8,.0f} "
+        f"{stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}"
+    )
+
+
+async def run(args):
+    from OneBot12Adapter.Codec import get_codec
+    from OneBot12Adapter.Offload import Offloader, b64encode_text, decode_frame, make_executor
+
+    codec = get_codec("auto")
+    frame = member_list_frame(args.members, 1)
+    blob = os.urandom(args.file_mib * 2**20)
+    offloaders = {
+        kind: Offloader(1, kind, make_executor(kind, args.workers)) for kind in ("thread", "process")
+    }
+    # 预热进程池
+    await offloaders["process"].run("decode", decode_frame, codec.name, "{}", False)
+
+    print(f"JSON 编解码器: {codec.name}，帧 {len(frame) / 2**20:.1f} MiB，文件 {args.file_mib} MiB")
+    print(f"{'case':<18} {'ops/s':>10} {'MiB/s':>8} {'lag p99':>9} {'lag max':>9}")
+
+    async def decode_inline():
+        for _ in range(args.frames):
+            codec.loads(frame)
+            await asyncio.sleep(0)
+
+    def decode_offloaded(offloader):
+        async def work():
+            for _ in range(args.frames):
+                await offloader.run("decode", decode_frame, codec.name, frame, False)
+
+        return work
+
+    await measure("decode inline", decode_inline, args.frames, len(frame))
+    for kind, offloader in offloaders.items():
+        await measure(f"decode {kind}", decode_offloaded(offloader), args.frames, len(frame))
+
+    async def base64_inline():
+        for _ in range(args.files):
+            base64.b64encode(blob).decode("ascii")
+            await asyncio.sleep(0)
+
+    def base64_offloaded(offloader):
+        async def work():
+            for _ in range(args.files):
+                await offloader.run("base64", b64encode_text, blob)
+
+        return work
+
+    await measure("base64 inline", base64_inline, args.files, len(blob))
+    for kind, offloader in offloaders.items():
+        await measure(f"base64 {kind}", base64_offloaded(offloader), args.files, len(blob))
+
+    for offloader in offloaders.values():
+        offloader.executor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--file-mib", type=int, default=8)
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
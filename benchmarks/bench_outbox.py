@@ -0,0 +1,73 @@
+"""
+持久化出站队列（Outbox）的入队与出队吞吐
+
+- 入队: 逐条等待（每条一个事务）与并发入队（合并为一个事务提交）的对比
+- 出队: 按批取出并在一个事务内标记送达，不含网络发送
+
+运行: python -m benchmarks.bench_outbox [--messages 2000] [--batch 32]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from . import support
+from .payloads import message_event
+
+
+async def run(args):
+    from OneBot12Adapter.Codec import encode_action, get_codec
+    from OneBot12Adapter.Outbox import Outbox
+
+    codec = get_codec("auto")
+    payloads = [
+        encode_action(
+            codec,
+            {
+                "action": "send_message",
+                "params": {
+                    "detail_type": "group",
+                    "group_id": str(i % 50),
+                    "content": message_event(i)["message"],
+                },
+            },
+        )
+        for i in range(args.messages)
+    ]
+
+    outbox = Outbox(os.path.join(support.WORKDIR, "outbox.db"))
+    print(f"{'phase':<22} {'msg/s':>10} {'us/msg':>10}")
+
+    def report(name: str, elapsed: float):
+        print(f"{name:<22} {args.messages / elapsed:>10,.0f} {elapsed / args.messages * 1e6:>10.1f}")
+
+    start = time.perf_counter()
+    for payload in payloads:
+        await outbox.enqueue("seq", payload)
+    report("enqueue sequential", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(outbox.enqueue("con", payload) for payload in payloads))
+    report("enqueue concurrent", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    while True:
+        entries = await outbox.due("con", args.batch)
+        if not entries:
+            break
+        await outbox.settle("con", [entry.id for entry in entries], [], [])
+    report(f"drain batch={args.batch}", time.perf_counter() - start)
+    outbox.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
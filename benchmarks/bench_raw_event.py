@@ -0,0 +1,59 @@
+"""
+事件标准化的单事件内存分配对比（onebot12_raw 的 copy / view / off 模式）
+
+运行: python -m benchmarks.bench_raw_event [--events 10000]
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from . import support
+from .payloads import event_mix
+
+
+async def _measure(adapter, codec, frames, mode: str):
+    retained = []
+    sink = support.EventSink(retained.append)
+    from ErisPulse.Core import adapter as adapter_mgr
+
+    adapter_mgr.emit = sink.emit
+    adapter._raw_event_modes["bench"] = mode
+
+    events = [codec.loads(frame) for frame in frames]
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    for event in events:
+        await adapter._process_event(event, "bench")
+    elapsed = time.perf_counter() - start
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if mode != "off":
+        sample = retained[0]["onebot12_raw"]
+        assert "onebot12_raw" not in sample and sample["type"] == retained[0]["type"]
+    return (after - before) / len(events), elapsed / len(events) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=10000)
+    args = parser.parse_args()
+
+    adapter = support.make_adapter({"bench": {"mode": "server", "enabled": True}})
+    adapter._bot_ids["bench"] = "10001"
+    codec = adapter._get_codec("bench")
+    frames = [codec.dumps(event) for event in event_mix(args.events)]
+
+    print(f"{'mode':<6} {'bytes/event':>12} {'us/event':>9}   (事件保持存活，模拟分发期间)")
+    for mode in ("copy", "view", "off"):
+        per_event, per_event_us = asyncio.run(_measure(adapter, codec, frames, mode))
+        print(f"{mode:<6} {per_event:>12.0f} {per_event_us:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+入站事件风暴下 API 响应解析延迟直方图
+
+在进程内替身实现端上持续推送事件，同时周期性调用 call_api，
+统计从发出请求到 Future 被解析的耗时分布。
+
+运行: python -m benchmarks.bench_response_latency [--rate 20000] [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+from . import support
+from .payloads import event_mix
+
+BOUNDS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100]
+
+
+async def _storm(impl, events, rate: int, stop: asyncio.Event):
+    batch = max(1, rate // 1000)
+    index = 0
+    while not stop.is_set():
+        for _ in range(batch):
+            impl.push_event(events[index % len(events)])
+            index += 1
+        await asyncio.sleep(0.001)
+
+
+async def _probe(adapter, interval: float, seconds: float):
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await adapter.call_api("get_self_info", _account_id="bench")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def _run(rate: int, seconds: float, handler_cost: float):
+    def on_event(_data):
+        end = time.perf_counter() + handler_cost
+        while time.perf_counter() < end:
+            pass
+
+    sink = support.EventSink(on_event if handler_cost > 0 else None)
+    # 风暴循环推送同一批事件，关闭去重，否则第一轮之后的事件都会在分发前被丢弃
+    adapter = support.make_adapter(
+        {"bench": {"mode": "server", "enabled": True, "dedup_size": 0}}, sink
+    )
+    impl = support.LoopbackImplementation()
+    adapter._running = True
+    reader = asyncio.create_task(adapter._ws_handler(impl.connection, "bench"))
+    await asyncio.sleep(0)
+
+    idle = await _probe(adapter, 0.002, min(1.0, seconds))
+
+    stop = asyncio.Event()
+    storm = asyncio.create_task(_storm(impl, event_mix(5000), rate, stop))
+    loaded = await _probe(adapter, 0.002, seconds)
+    stop.set()
+    await storm
+
+    stats = adapter.get_dispatch_stats("bench")
+    await impl.connection.close()
+    await reader
+    await adapter.shutdown()
+    return idle, loaded, sink.count, stats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=20000, help="入站事件速率 (events/s)")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--handler-cost", type=float, default=0.00002, help="单个事件处理耗时 (s)")
+    args = parser.parse_args()
+
+    idle, loaded, emitted, stats = asyncio.run(
+        _run(args.rate, args.seconds, args.handler_cost)
+    )
+
+    for label, samples in (("空闲", idle), (f"事件风暴 {args.rate}/s", loaded)):
+        print(
+            f"\n{label}: n={len(samples)} p50={support.percentile(samples, 50):.3f}ms "
+            f"p99={support.percentile(samples, 99):.3f}ms max={max(samples):.3f}ms"
+        )
+        for line in support.histogram(samples, BOUNDS):
+            print(line)
+    print(f"\n已分发事件 {emitted}，分发统计 {stats}")
+
+
+if __name__ == "__main__":
+    main()
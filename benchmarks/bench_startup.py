@@ -0,0 +1,66 @@
+"""
+多账户冷启动耗时
+
+构造 --clients 个 client 模式账户（连接同一个本机实现端替身）与 --servers 个 server 模式账户，
+统计适配器构造、start() 返回、全部 client 账户连接成功的耗时，以及 get_startup_stats() 的分阶段耗时。
+
+运行: python -m benchmarks.bench_startup [--clients 100] [--servers 50] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import time
+
+from . import support
+from .fake_impl import FakeImplementation
+
+
+async def run(args):
+    fake = FakeImplementation()
+    url = await fake.serve()
+    client = {"mode": "client", "enabled": True, "client_url": url}
+    if args.concurrency is not None:
+        client["connect_concurrency"] = args.concurrency
+    accounts = {f"client{i}": dict(client) for i in range(args.clients)}
+    accounts.update(
+        {
+            f"server{i}": {"mode": "server", "enabled": True, "server_path": f"/onebot12/{i}"}
+            for i in range(args.servers)
+        }
+    )
+
+    start = time.perf_counter()
+    adapter = support.make_adapter(accounts, support.EventSink())
+    constructed = time.perf_counter()
+    await adapter.start()
+    started = time.perf_counter()
+    while adapter.get_startup_stats()["clients_pending"]:
+        await asyncio.sleep(0.001)
+    connected = time.perf_counter()
+
+    print(f"{args.clients} 个 client 账户，{args.servers} 个 server 账户")
+    print(f"{'construct':<20} {(constructed - start) * 1000:>10.1f} ms")
+    print(f"{'start()':<20} {(started - constructed) * 1000:>10.1f} ms")
+    print(f"{'all connected':<20} {(connected - constructed) * 1000:>10.1f} ms")
+    stats = adapter.get_startup_stats()
+    print("\nget_startup_stats():")
+    for phase, ms in stats["phases_ms"].items():
+        print(f"  {phase:<18} {ms:>10.1f} ms")
+    print(f"  {'clients connected':<18} {stats['clients_connected_ms']:>10.1f} ms")
+
+    adapter._running = False
+    await fake.stop()
+    await adapter.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--servers", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
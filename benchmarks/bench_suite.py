@@ -0,0 +1,162 @@
+"""
+端到端负载基准：分别以 server / client 账户模式连接本机的实现端替身（fake_impl），统计
+事件吞吐、call_api 与 Send.Text 往返延迟、每万条事件的内存峰值增量及断线重连耗时
+
+内存统计基于 tracemalloc，替身与适配器同进程运行，结果包含替身收发的开销，适合做前后对比而非绝对值。
+
+运行: python -m benchmarks.bench_suite [--modes server,client] [--events 20000] [--rate 0]
+      [--calls 2000] [--delay 0] [--reconnects 5] [--message-ratio 0.85] [--notice-ratio 0.10]
+"""
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from . import support
+from .fake_impl import FakeImplementation, serve_adapter
+
+ACCOUNT = "bench"
+
+
+async def _wait_events(sink, target: int):
+    while sink.count < target:
+        await asyncio.sleep(0.001)
+
+
+async def _open(mode: str, fake: FakeImplementation, sink, reconnect_delay: float):
+    account = {"mode": mode, "enabled": True, "reconnect_initial_delay": reconnect_delay}
+    runner = None
+    if mode == "client":
+        account["client_url"] = await fake.serve()
+    adapter = support.make_adapter({ACCOUNT: account}, sink)
+    adapter._running = True
+    if mode == "client":
+        task = asyncio.create_task(adapter.connect(ACCOUNT))
+        await fake.wait_connected()
+    else:
+        runner, url = await serve_adapter(adapter, ACCOUNT)
+        await fake.connect(url)
+        task = None
+    await adapter._wait_connected(ACCOUNT, 5)
+    return adapter, runner, task
+
+
+async def _round_trips(calls: int, call):
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def _reconnect_times(adapter, fake: FakeImplementation, times: int):
+    connected = adapter._get_connected_event(ACCOUNT)
+    samples = []
+    for _ in range(times):
+        start = time.perf_counter()
+        await fake.drop()
+        while connected.is_set():
+            await asyncio.sleep(0.0005)
+        await asyncio.wait_for(connected.wait(), 30)
+        await fake.wait_connected()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def _run_mode(mode: str, args) -> dict:
+    sink = support.EventSink()
+    fake = FakeImplementation(response_delay=args.delay / 1000)
+    adapter, runner, task = await _open(mode, fake, sink, args.reconnect_delay)
+    mix = {"message_ratio": args.message_ratio, "notice_ratio": args.notice_ratio}
+    result = {}
+
+    frames = fake.frames(args.events, **mix)
+    baseline = sink.count
+    start = time.perf_counter()
+    await fake.push(frames, args.rate)
+    await _wait_events(sink, baseline + args.events)
+    result["events/s"] = args.events / (time.perf_counter() - start)
+
+    result["call_api"] = await _round_trips(
+        args.calls,
+        lambda: adapter.call_api(
+            "send_message",
+            _account_id=ACCOUNT,
+            detail_type="group",
+            group_id="20001",
+            message=[{"type": "text", "data": {"text": "ping"}}],
+        ),
+    )
+    sender = adapter.Send.Using(ACCOUNT).To("group", "20001")
+    result["Send.Text"] = await _round_trips(args.calls, lambda: sender.Text("ping"))
+
+    frames = fake.frames(10000, seed=1, **mix)
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    baseline = sink.count
+    await fake.push(frames)
+    await _wait_events(sink, baseline + len(frames))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["KiB/10k"] = (peak - before) / 1024
+
+    result["reconnect"] = await _reconnect_times(adapter, fake, args.reconnects)
+
+    adapter._running = False
+    await fake.stop()
+    await adapter.shutdown()
+    if task is not None:
+        task.cancel()
+    if runner is not None:
+        await runner.cleanup()
+    return result
+
+
+async def _run(args):
+    results = {}
+    for mode in args.modes.split(","):
+        results[mode] = await _run_mode(mode.strip(), args)
+    from ErisPulse.Core import client
+
+    await client.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", default="server,client")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=0.0, help="事件推送速率（条/秒），0 为不限速")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--delay", type=float, default=0.0, help="替身应答延迟（毫秒）")
+    parser.add_argument("--reconnects", type=int, default=5)
+    parser.add_argument("--reconnect-delay", type=float, default=0.1, help="client 模式的首次重连等待（秒）")
+    parser.add_argument("--message-ratio", type=float, default=0.85)
+    parser.add_argument("--notice-ratio", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+
+    print(
+        f"{'mode':<8} {'events/s':>10} {'api p50':>8} {'api p99':>8} {'send p50':>9} "
+        f"{'send p99':>9} {'KiB/10k':>9} {'reconn ms':>10}"
+    )
+    for mode, r in results.items():
+        reconnect = sum(r["reconnect"]) / len(r["reconnect"]) if r["reconnect"] else 0.0
+        print(
+            f"{mode:<8} {r['events/s']:>10,.0f} "
+            f"{support.percentile(r['call_api'], 50):>8.3f} "
+            f"{support.percentile(r['call_api'], 99):>8.3f} "
+            f"{support.percentile(r['Send.Text'], 50):>9.3f} "
+            f"{support.percentile(r['Send.Text'], 99):>9.3f} "
+            f"{r['KiB/10k']:>9,.0f} {reconnect:>10.1f}"
+        )
+    print("\n延迟单位为毫秒；reconn ms 为从替身断开到适配器重新就绪的平均耗时")
+
+
+if __name__ == "__main__":
+    main()
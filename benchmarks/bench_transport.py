@@ -0,0 +1,197 @@
+"""
+WebSocket 与 HTTP / Webhook 传输的对比
+
+在本机回环地址上启动一个 aiohttp 实现端替身，同时提供 WebSocket 与 HTTP 动作接口，
+并把事件通过 WebSocket 推送或以 Webhook POST 到适配器侧的替身路由；
+分别统计 call_api 串行延迟、并发吞吐与事件吞吐。
+
+运行: python -m benchmarks.bench_transport [--calls 2000] [--concurrency 32] [--events 5000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiohttp import ClientSession, WSMsgType, web
+
+from . import support
+from .payloads import action_response, event_mix
+
+
+class StandIn:
+    """回环地址上的 OneBot12 实现端替身"""
+
+    def __init__(self):
+        from OneBot12Adapter.Codec import get_codec
+
+        self.codec = get_codec("auto")
+        self.sockets = []
+        self.runner = None
+        self.port = 0
+
+    async def _ws(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        async for msg in ws:
+            if msg.type == WSMsgType.TEXT:
+                action = self.codec.loads(msg.data)
+                await ws.send_str(self.codec.dumps(action_response(action.get("echo"))))
+        return ws
+
+    async def _action(self, request):
+        action = self.codec.loads(await request.read())
+        return web.Response(
+            text=self.codec.dumps(action_response(action.get("echo"))),
+            content_type="application/json",
+        )
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/ws", self._ws)
+        app.router.add_post("/", self._action)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def push_ws(self, frames):
+        ws = self.sockets[-1]
+        for frame in frames:
+            await ws.send_str(frame)
+
+    async def push_webhook(self, url: str, frames, concurrency: int):
+        async with ClientSession() as session:
+            queue = iter(frames)
+
+            async def worker():
+                for frame in queue:
+                    async with session.post(url, data=frame) as resp:
+                        await resp.read()
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    async def stop(self):
+        for ws in self.sockets:
+            await ws.close()
+        await self.runner.cleanup()
+
+
+class _WebhookRequest:
+    """把 aiohttp 请求包装成适配器 webhook 处理器所需的接口"""
+
+    def __init__(self, request):
+        self.headers = request.headers
+        self.query_params = request.query
+        self._request = request
+
+    async def body(self) -> bytes:
+        return await self._request.read()
+
+
+async def _serve_webhook(adapter, account_name: str):
+    async def handler(request):
+        resp = await adapter._webhook_handler(_WebhookRequest(request), account_name)
+        return web.Response(status=resp.status_code)
+
+    app = web.Application()
+    app.router.add_post("/webhook", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+async def _calls(adapter, account_name: str, calls: int, concurrency: int):
+    latencies = []
+    for _ in range(min(calls, 500)):
+        start = time.perf_counter()
+        await adapter.call_api("get_self_info", _account_id=account_name)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    remaining = iter(range(calls))
+
+    async def worker():
+        for _ in remaining:
+            await adapter.call_api("get_self_info", _account_id=account_name)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, calls / (time.perf_counter() - start)
+
+
+async def _wait_events(sink, target: int, start: float) -> float:
+    while sink.count < target:
+        await asyncio.sleep(0.001)
+    return time.perf_counter() - start
+
+
+async def _run(calls: int, concurrency: int, events: int):
+    sink = support.EventSink()
+    stand_in = StandIn()
+    await stand_in.start()
+    base = f"127.0.0.1:{stand_in.port}"
+    adapter = support.make_adapter(
+        {
+            "ws": {"mode": "client", "enabled": True, "client_url": f"ws://{base}/ws"},
+            "http": {"mode": "http", "enabled": True, "http_url": f"http://{base}/"},
+            "hook": {"mode": "webhook", "enabled": True, "http_url": ""},
+        },
+        sink,
+    )
+    adapter._running = True
+    accounts = adapter._refresh_accounts()
+    connect = asyncio.create_task(adapter.connect("ws"))
+    await adapter._wait_connected("ws", 5)
+    await adapter._start_http("http", accounts["http"])
+    await adapter._start_http("hook", accounts["hook"])
+    hook_runner, hook_port = await _serve_webhook(adapter, "hook")
+
+    results = {}
+    for name in ("ws", "http"):
+        results[name] = await _calls(adapter, name, calls, concurrency)
+
+    codec = adapter._get_codec("ws")
+    frames = [codec.dumps(event) for event in event_mix(events)]
+    baseline = sink.count
+    start = time.perf_counter()
+    await stand_in.push_ws(frames)
+    ws_seconds = await _wait_events(sink, baseline + events, start)
+
+    baseline = sink.count
+    start = time.perf_counter()
+    await stand_in.push_webhook(f"http://127.0.0.1:{hook_port}/webhook", frames, concurrency)
+    hook_seconds = await _wait_events(sink, baseline + events, start)
+
+    await hook_runner.cleanup()
+    await adapter.shutdown()
+    connect.cancel()
+    await stand_in.stop()
+    from ErisPulse.Core import client
+
+    await client.close()
+    return results, events / ws_seconds, events / hook_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--events", type=int, default=5000)
+    args = parser.parse_args()
+
+    results, ws_eps, hook_eps = asyncio.run(_run(args.calls, args.concurrency, args.events))
+
+    print(f"{'transport':<10} {'p50 ms':>8} {'p99 ms':>8} {'calls/s':>10}  (并发 {args.concurrency})")
+    for name, (latencies, rate) in results.items():
+        print(
+            f"{name:<10} {support.percentile(latencies, 50):>8.3f} "
+            f"{support.percentile(latencies, 99):>8.3f} {rate:>10.0f}"
+        )
+    print(f"\n事件吞吐: websocket {ws_eps:,.0f} events/s, webhook {hook_eps:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+回环地址上的 OneBot12 实现端替身，可离线压测 server / client 两种账户模式
+
+- server 角色: 在本机启动 WebSocket 服务，供 client 模式账户连接
+- client 角色: 主动连接适配器侧的 WebSocket 入口（见 serve_adapter），对应 server 模式账户
+
+动作应答延迟、事件推送速率与事件构成（消息 / 通知 / 心跳比例、消息段数）均可配置；
+drop() 主动断开所有连接，用于测量重连耗时。
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from aiohttp import ClientSession, WSMsgType, web
+
+from .payloads import SELF, action_response, event_mix
+
+
+class FakeImplementation:
+    """OneBot12 实现端替身"""
+
+    def __init__(self, response_delay: float = 0.0, token: str = ""):
+        from OneBot12Adapter.Codec import get_codec
+
+        self.codec = get_codec("auto")
+        self.response_delay = response_delay
+        self.token = token
+        self.sockets: List[Any] = []
+        self.actions = 0
+        self.connections = 0
+        self._connected = asyncio.Event()
+        self._running = True
+        self._runner = None
+        self._session: Optional[ClientSession] = None
+        self._client_task: Optional[asyncio.Task] = None
+
+    def _respond(self, action: Dict[str, Any]) -> str:
+        echo = action.get("echo")
+        if action.get("action") == "get_self_info":
+            return self.codec.dumps(
+                action_response(echo, {"user_id": SELF["user_id"], "user_name": "fake"})
+            )
+        return self.codec.dumps(action_response(echo))
+
+    async def _reply_later(self, ws, frame: str):
+        await asyncio.sleep(self.response_delay)
+        if not ws.closed:
+            await ws.send_str(frame)
+
+    async def _session_loop(self, ws):
+        self.sockets.append(ws)
+        self.connections += 1
+        self._connected.set()
+        try:
+            async for msg in ws:
+                if msg.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    continue
+                self.actions += 1
+                if msg.type == WSMsgType.BINARY:
+                    from OneBot12Adapter.Binary import decode_binary
+
+                    action = decode_binary(msg.data, self.codec)[1]
+                else:
+                    action = self.codec.loads(msg.data)
+                frame = self._respond(action)
+                if self.response_delay > 0:
+                    asyncio.create_task(self._reply_later(ws, frame))
+                else:
+                    await ws.send_str(frame)
+        finally:
+            if ws in self.sockets:
+                self.sockets.remove(ws)
+
+    async def wait_connected(self, timeout: float = 5.0):
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    # server 角色
+    async def _ws_route(self, request):
+        if self.token and request.headers.get("Authorization") != f"Bearer {self.token}":
+            return web.Response(status=401)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await self._session_loop(ws)
+        return ws
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        app = web.Application()
+        app.router.add_get("/", self._ws_route)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"ws://{host}:{port}/"
+
+    # client 角色
+    async def _client_loop(self, url: str, reconnect: bool):
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        while self._running:
+            try:
+                async with self._session.ws_connect(url, headers=headers) as ws:
+                    await self._session_loop(ws)
+            except Exception:
+                await asyncio.sleep(0.05)
+            if not reconnect:
+                return
+
+    async def connect(self, url: str, reconnect: bool = True):
+        self._session = ClientSession()
+        self._client_task = asyncio.create_task(self._client_loop(url, reconnect))
+        await self.wait_connected()
+
+    def frames(self, count: int, **mix) -> List[str]:
+        return [self.codec.dumps(event) for event in event_mix(count, **mix)]
+
+    async def push(self, frames: List[str], rate: float = 0.0) -> float:
+        """按 rate（条/秒，0 为不限速）向最近建立的连接推送事件帧，返回耗时"""
+        ws = self.sockets[-1]
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            await ws.send_str(frame)
+            if rate > 0:
+                ahead = start + (i + 1) / rate - time.perf_counter()
+                if ahead > 0:
+                    await asyncio.sleep(ahead)
+        return time.perf_counter() - start
+
+    async def drop(self):
+        self._connected.clear()
+        for ws in list(self.sockets):
+            await ws.close()
+
+    async def stop(self):
+        self._running = False
+        await self.drop()
+        if self._client_task is not None:
+            self._client_task.cancel()
+        if self._session is not None:
+            await self._session.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class _HostedWebSocket:
+    """把 aiohttp 服务端 WebSocket 包装成适配器 _ws_handler 所需的连接接口"""
+
+    def __init__(self, ws, request):
+        from ErisPulse.Core.Bases.websocket import WSMessage
+
+        self._WSMessage = WSMessage
+        self._ws = ws
+        self.headers = request.headers
+        self.query_params = request.query
+
+    @property
+    def closed(self) -> bool:
+        return self._ws.closed
+
+    async def receive(self):
+        msg = await self._ws.receive()
+        if msg.type == WSMsgType.TEXT:
+            return self._WSMessage(self._WSMessage.TEXT, msg.data)
+        if msg.type == WSMsgType.BINARY:
+            return self._WSMessage(self._WSMessage.BINARY, msg.data)
+        if msg.type == WSMsgType.ERROR:
+            return self._WSMessage(self._WSMessage.ERROR)
+        return self._WSMessage(self._WSMessage.CLOSE)
+
+    async def send_text(self, data: str):
+        await self._ws.send_str(data)
+
+    async def send_bytes(self, data: bytes):
+        await self._ws.send_bytes(data)
+
+    async def close(self, code: int = 1000, *args, **kwargs):
+        await self._ws.close(code=code)
+
+
+async def serve_adapter(adapter, account_name: str, host: str = "127.0.0.1"):
+    """在本机为 server 模式账户提供 WebSocket 入口（代替 ErisPulse 路由），返回 (runner, url)"""
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        conn = _HostedWebSocket(ws, request)
+        if await adapter._auth_handler(conn, account_name):
+            await adapter._ws_handler(conn, account_name)
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, 0)
+    await site.start()
+    return runner, f"ws://{host}:{site._server.sockets[0].getsockname()[1]}/"
@@ -0,0 +1,121 @@
+import itertools
+import random
+import time
+from typing import Any, Dict, List
+
+SELF = {"platform": "qq", "user_id": "10001"}
+
+# 每次生成事件流使用新的批次号，同一适配器多次推送时事件 id 不重复，不会被去重丢弃
+_batches = itertools.count()
+
+
+def message_event(
+    seq: int, group_id: str = "20001", user_id: str = "30001", segments: int = 4
+) -> Dict[str, Any]:
+    message: List[Dict[str, Any]] = [
+        {"type": "reply", "data": {"message_id": f"m{seq - 1}", "user_id": user_id}},
+        {"type": "mention", "data": {"user_id": "10001"}},
+    ]
+    for i in range(max(0, segments - 2)):
+        if i % 3 == 2:
+            message.append(
+                {"type": "image", "data": {"file_id": f"img-{seq}-{i}-abcdef0123456789"}}
+            )
+        else:
+            message.append(
+                {"type": "text", "data": {"text": f"第{seq}条消息，测试文本 segment {i} " * 3}}
+            )
+    return {
+        "id": f"evt-{seq}",
+        "time": time.time(),
+        "type": "message",
+        "detail_type": "group",
+        "sub_type": "",
+        "message_id": f"m{seq}",
+        "message": message,
+        "alt_message": "".join(
+            seg["data"].get("text", "[图片]") for seg in message if seg["type"] != "reply"
+        ),
+        "group_id": group_id,
+        "user_id": user_id,
+        "self": SELF,
+    }
+
+
+def notice_event(seq: int, group_id: str = "20001") -> Dict[str, Any]:
+    return {
+        "id": f"evt-{seq}",
+        "time": time.time(),
+        "type": "notice",
+        "detail_type": "group_member_increase",
+        "sub_type": "join",
+        "group_id": group_id,
+        "user_id": str(40000 + seq),
+        "operator_id": "30001",
+        "self": SELF,
+    }
+
+
+def heartbeat_event(seq: int, interval: int = 5000) -> Dict[str, Any]:
+    return {
+        "id": f"evt-{seq}",
+        "time": time.time(),
+        "type": "meta",
+        "detail_type": "heartbeat",
+        "sub_type": "",
+        "interval": interval,
+    }
+
+
+def send_message_action(seq: int, group_id: str = "20001") -> Dict[str, Any]:
+    return {
+        "action": "send_message",
+        "params": {
+            "detail_type": "group",
+            "group_id": group_id,
+            "user_id": None,
+            "content": [
+                {"type": "reply", "data": {"message_id": f"m{seq}"}},
+                {"type": "text", "data": {"text": f"收到第{seq}条消息"}},
+            ],
+        },
+        "echo": f"1-{seq}",
+    }
+
+
+def action_response(echo: Any, data: Any = None) -> Dict[str, Any]:
+    return {
+        "status": "ok",
+        "retcode": 0,
+        "data": data if data is not None else {"message_id": f"r-{echo}", "time": time.time()},
+        "message": "",
+        "echo": echo,
+    }
+
+
+def event_mix(
+    count: int,
+    groups: int = 50,
+    seed: int = 0,
+    message_ratio: float = 0.85,
+    notice_ratio: float = 0.10,
+    max_segments: int = 8,
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    batch = next(_batches)
+    events = []
+    for seq in range(count):
+        roll = rng.random()
+        group_id = str(20000 + rng.randrange(groups))
+        if roll < message_ratio:
+            events.append(
+                message_event(
+                    seq, group_id, str(30000 + rng.randrange(500)), rng.randint(1, max_segments)
+                )
+            )
+        elif roll < message_ratio + notice_ratio:
+            events.append(notice_event(seq, group_id))
+        else:
+            events.append(heartbeat_event(seq))
+        events[-1]["id"] = f"evt-{batch}-{seq}"
+    return events
@@ -0,0 +1,196 @@
+"""
+回放流量录制（capture_file）
+
+读取录制文件及其轮转文件，为一个 client 模式账户在本机实现端替身上重放：
+录制中的入站事件帧由替身按原始间隔原样推送（文本/二进制不变），出站动作按原始间隔通过 call_api 发出并由替身应答；
+录制中的动作响应帧不回放。--speed 1 为原速，N 为 N 倍速，0 为不等待、尽快回放。
+报告吞吐、事件从替身推送到分发的延迟、API 往返延迟，以及回放调度本身落后于计划的时间（过大说明本机跟不上该倍速）。
+
+--config 以 key=value 覆盖回放账户的配置（值按 JSON 解析，失败则作为字符串），用于对比不同配置在同一份流量下的表现。
+
+运行: python -m benchmarks.replay CAPTURE [--speed 1] [--account NAME] [--config dispatch_workers=8 ...]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import support
+from .fake_impl import FakeImplementation
+
+REPLAY_ACCOUNT = "replay"
+
+
+def load(path: str, account: Optional[str]) -> Tuple[List[Tuple[Any, ...]], Dict[str, int]]:
+    """解码录制文件，返回按时间排列的回放步骤 (offset, kind, ...) 与各类帧计数"""
+    from OneBot12Adapter.Binary import decode_binary
+    from OneBot12Adapter.Capture import read_capture
+    from OneBot12Adapter.Codec import get_codec
+
+    codec = get_codec("auto")
+    steps: List[Tuple[Any, ...]] = []
+    counts = {"events": 0, "actions": 0, "responses": 0, "skipped": 0}
+    first = None
+    for record in read_capture(path):
+        if account is not None and record.account != account:
+            continue
+        try:
+            data = (
+                decode_binary(record.frame, codec)[1]
+                if record.binary
+                else codec.loads(record.frame)
+            )
+        except ValueError:
+            counts["skipped"] += 1
+            continue
+        if not isinstance(data, dict):
+            counts["skipped"] += 1
+            continue
+        if first is None:
+            first = record.time
+        offset = record.time - first
+        if record.direction == "out":
+            if not data.get("action"):
+                counts["skipped"] += 1
+                continue
+            counts["actions"] += 1
+            steps.append((offset, "action", data["action"], data.get("params") or {}))
+        elif "echo" in data and "type" not in data:
+            counts["responses"] += 1
+        else:
+            counts["events"] += 1
+            steps.append((offset, "event", record.frame, record.binary, data.get("id")))
+    return steps, counts
+
+
+def parse_overrides(items: List[str]) -> Dict[str, Any]:
+    overrides = {}
+    for item in items:
+        key, _, value = item.partition("=")
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+    return overrides
+
+
+def report(name: str, samples: List[float]):
+    print(
+        f"{name:<18} {len(samples):>8} {support.percentile(samples, 50):>9.2f} "
+        f"{support.percentile(samples, 99):>9.2f} {max(samples, default=0.0):>9.2f}"
+    )
+
+
+async def run(args):
+    steps, counts = load(args.capture, args.account)
+    if not steps:
+        print("录制中没有可回放的事件或动作")
+        return
+
+    sent_at: Dict[Any, float] = {}
+    event_latency: List[float] = []
+
+    def on_event(data):
+        start = sent_at.pop(data.get("id"), None)
+        if start is not None:
+            event_latency.append((time.perf_counter() - start) * 1000)
+
+    fake = FakeImplementation()
+    url = await fake.serve()
+    account = {"mode": "client", "enabled": True, "client_url": url}
+    account.update(parse_overrides(args.config))
+    sink = support.EventSink(on_event)
+    adapter = support.make_adapter({REPLAY_ACCOUNT: account}, sink)
+    await adapter.start()
+    await fake.wait_connected()
+    await adapter._wait_connected(REPLAY_ACCOUNT, 5.0)
+    await asyncio.sleep(0.1)
+    ws = fake.sockets[-1]
+
+    api_latency: List[float] = []
+    api_failed = 0
+
+    async def call(action: str, params: Dict[str, Any]):
+        nonlocal api_failed
+        start = time.perf_counter()
+        try:
+            resp = await adapter.call_api(action, _account_id=REPLAY_ACCOUNT, **params)
+            if resp.get("status") != "ok":
+                api_failed += 1
+        except Exception:
+            api_failed += 1
+        api_latency.append((time.perf_counter() - start) * 1000)
+
+    speed = args.speed
+    schedule_lag: List[float] = []
+    untracked = 0
+    calls = []
+    start = time.perf_counter()
+    for step in steps:
+        now = time.perf_counter()
+        if speed > 0:
+            due = start + step[0] / speed
+            if due > now:
+                await asyncio.sleep(due - now)
+                now = time.perf_counter()
+            schedule_lag.append(max(0.0, now - due) * 1000)
+        if step[1] == "event":
+            _, _, frame, binary, event_id = step
+            if event_id is None:
+                untracked += 1
+            else:
+                sent_at.setdefault(event_id, now)
+            if binary:
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_str(frame)
+        else:
+            calls.append(asyncio.create_task(call(step[2], step[3])))
+    await asyncio.gather(*calls)
+
+    # 等待排队中的事件分发完毕：计数在 200ms 内不再变化即视为结束
+    settled, last = time.perf_counter(), sink.count
+    while time.perf_counter() - settled < 0.2:
+        await asyncio.sleep(0.01)
+        if sink.count != last:
+            settled, last = time.perf_counter(), sink.count
+    elapsed = settled - start
+
+    duration = steps[-1][0]
+    # 没有 id 的事件无法与推送时间对应，不计入分发数与延迟
+    delivered = len(event_latency)
+    print(
+        f"录制: 事件 {counts['events']}，动作 {counts['actions']}，"
+        f"未回放的响应 {counts['responses']}，无法解析 {counts['skipped']}，原始时长 {duration:.1f}s"
+    )
+    print(f"回放速度: {'max' if speed <= 0 else f'{speed:g}x'}，耗时 {elapsed:.2f}s")
+    print(
+        f"事件: 分发 {delivered}/{counts['events'] - untracked}，{delivered / elapsed:,.0f} 条/s"
+        + (f"（另有 {untracked} 条无 id 事件未统计）" if untracked else "")
+    )
+    print(f"动作: {len(api_latency)} 次，失败 {api_failed}，{len(api_latency) / elapsed:,.0f} 次/s")
+    print(f"\n{'latency (ms)':<18} {'samples':>8} {'p50':>9} {'p99':>9} {'max':>9}")
+    report("event dispatch", event_latency)
+    report("api round trip", api_latency)
+    if schedule_lag:
+        report("schedule lag", schedule_lag)
+
+    adapter._running = False
+    await fake.stop()
+    await adapter.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("capture")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--account", default=None)
+    parser.add_argument("--config", action="append", default=[])
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+基准测试公共设施
+
+导入本模块会把工作目录切换到临时目录（ErisPulse 导入时会在当前目录生成 config/），
+因此各基准脚本须在导入 OneBot12Adapter 之前先导入本模块。
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+WORKDIR = tempfile.mkdtemp(prefix="ob12-bench-")
+os.chdir(WORKDIR)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def histogram(samples: List[float], bounds: List[float]) -> List[str]:
+    counts = [0] * (len(bounds) + 1)
+    for value in samples:
+        for i, bound in enumerate(bounds):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    total = max(1, len(samples))
+    lines = []
+    for i, count in enumerate(counts):
+        label = f"<= {bounds[i]:g}" if i < len(bounds) else f">  {bounds[-1]:g}"
+        bar = "#" * round(count / total * 50)
+        lines.append(f"{label:>10} ms {count:>7} {bar}")
+    return lines
+
+
+class EventSink:
+    """替换 adapter_mgr.emit，只计数不分发，使基准只衡量适配器自身开销"""
+
+    def __init__(self, on_event: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.count = 0
+        self.on_event = on_event
+
+    async def emit(self, data: Dict[str, Any]):
+        self.count += 1
+        if self.on_event is not None:
+            self.on_event(data)
+
+
+def make_adapter(accounts: Dict[str, Dict[str, Any]], sink: Optional[EventSink] = None):
+    from ErisPulse import sdk
+    from ErisPulse.Core import adapter as adapter_mgr
+    from ErisPulse.Core.config import config as config_mgr
+
+    sdk.logger.set_level("WARNING")
+    config_mgr.setConfig("OneBotv12_Adapter.accounts", accounts, immediate=True)
+
+    from OneBot12Adapter import OneBot12Adapter
+
+    adapter = OneBot12Adapter(sdk)
+    adapter._platform = "onebot12"
+    if sink is not None:
+        adapter_mgr.emit = sink.emit
+    return adapter
+
+
+class LoopbackConnection:
+    """适配器侧的 WebSocket 替身，由 LoopbackImplementation 驱动收发"""
+
+    def __init__(self, implementation: "LoopbackImplementation"):
+        from ErisPulse.Core.Bases.websocket import WSMessage
+
+        self._WSMessage = WSMessage
+        self.implementation = implementation
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+
+    async def send_text(self, data: str):
+        self.implementation.on_action(data)
+
+    async def send_bytes(self, data: bytes):
+        self.implementation.on_action(data)
+
+    async def receive(self):
+        return await self.inbox.get()
+
+    def push(self, frame):
+        kind = self._WSMessage.BINARY if isinstance(frame, bytes) else self._WSMessage.TEXT
+        self.inbox.put_nowait(self._WSMessage(kind, frame))
+
+    async def close(self, *args, **kwargs):
+        if not self.closed:
+            self.closed = True
+            self.inbox.put_nowait(self._WSMessage(self._WSMessage.CLOSE))
+
+
+class LoopbackImplementation:
+    """进程内的 OneBot12 实现端替身：按固定延迟应答动作，并可推送事件"""
+
+    def __init__(self, response_delay: float = 0.0):
+        from OneBot12Adapter.Codec import get_codec
+
+        from .payloads import action_response
+
+        self._codec = get_codec("auto")
+        self._action_response = action_response
+        self.response_delay = response_delay
+        self.connection = LoopbackConnection(self)
+        self.actions = 0
+
+    def on_action(self, raw):
+        self.actions += 1
+        action = self._codec.loads(raw)
+        frame = self._codec.dumps(self._action_response(action.get("echo")))
+        if self.response_delay > 0:
+            asyncio.get_running_loop().call_later(
+                self.response_delay, self.connection.push, frame
+            )
+        else:
+            self.connection.push(frame)
+
+    def push_event(self, event: Dict[str, Any]):
+        self.connection.push(self._codec.dumps(event))
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+# ErisPulse 导入时会在当前目录生成 config/，切到临时目录，避免污染仓库
+os.chdir(tempfile.mkdtemp(prefix="ob12-test-"))
@@ -0,0 +1,77 @@
+import gzip
+import zlib
+
+import pytest
+
+from OneBot12Adapter.Binary import decode_binary, encode_binary_action, sniff_format
+from OneBot12Adapter.Codec import get_codec
+
+EVENT = {"id": "1", "type": "message", "detail_type": "group", "group_id": "10"}
+EVENT_JSON = b'{"id": "1", "type": "message", "detail_type": "group", "group_id": "10"}'
+
+
+@pytest.fixture
+def codec():
+    return get_codec("json")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        EVENT_JSON,
+        b"[1, 2]",
+        b" \r\n\t" + EVENT_JSON,
+        b"\xef\xbb\xbf" + EVENT_JSON,
+        b"\xef\xbb\xbf\n" + EVENT_JSON,
+    ],
+)
+def test_sniff_json(data):
+    assert sniff_format(data) == "json"
+
+
+def test_sniff_compressed():
+    assert sniff_format(gzip.compress(EVENT_JSON)) == "gzip"
+    assert sniff_format(zlib.compress(EVENT_JSON)) == "zlib"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        EVENT_JSON,
+        b"\xef\xbb\xbf  " + EVENT_JSON,
+        gzip.compress(EVENT_JSON),
+        zlib.compress(EVENT_JSON),
+    ],
+)
+def test_decode_json_frames(codec, data):
+    assert decode_binary(data, codec)[1] == EVENT
+
+
+def test_decode_compressed_json_with_bom(codec):
+    assert decode_binary(zlib.compress(b"\xef\xbb\xbf" + EVENT_JSON), codec) == ("zlib", EVENT)
+
+
+def test_decode_invalid_frames(codec):
+    with pytest.raises(ValueError):
+        decode_binary(b"\x1f\x8b not gzip", codec)
+    with pytest.raises(ValueError):
+        decode_binary(b"\x78 not zlib", codec)
+    with pytest.raises(ValueError):
+        decode_binary(b"{not json", codec)
+
+
+def test_msgpack_round_trip(codec):
+    msgpack = pytest.importorskip("msgpack")
+    packed = msgpack.packb(EVENT)
+    assert sniff_format(packed) == "msgpack"
+    assert decode_binary(packed, codec) == ("msgpack", EVENT)
+    payload = {"action": "send_message", "params": {"group_id": "10"}, "echo": "0-1"}
+    frame = encode_binary_action("msgpack", codec, payload)
+    assert msgpack.unpackb(frame, raw=False) == payload
+
+
+@pytest.mark.parametrize("fmt", ["zlib", "gzip"])
+def test_compressed_action_round_trip(codec, fmt):
+    payload = {"action": "send_message", "params": {"group_id": "10"}, "echo": "0-1"}
+    frame = encode_binary_action(fmt, codec, payload)
+    assert decode_binary(frame, codec) == (fmt, payload)
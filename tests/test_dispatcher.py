@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from OneBot12Adapter.Dispatcher import EventDispatcher
+
+
+class _Logger:
+    def __init__(self):
+        self.warnings = []
+        self.errors = []
+
+    def warning(self, message, *args, **kwargs):
+        self.warnings.append(message)
+
+    def error(self, message, *args, **kwargs):
+        self.errors.append(message)
+
+
+def _message(seq, group="1"):
+    return {"type": "message", "id": str(seq), "group_id": group}
+
+
+def _meta(seq):
+    return {"type": "meta", "detail_type": "heartbeat", "id": f"meta-{seq}"}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_single_conversation_uses_whole_queue():
+    async def run():
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(data):
+            await gate.wait()
+            handled.append(data["id"])
+
+        dispatcher = EventDispatcher(handler, workers=4, queue_size=8)
+        # 第一条被 worker 取出后阻塞在 gate 上，其余 8 条占满共用的队列容量
+        for seq in range(9):
+            await dispatcher.submit(_message(seq))
+            await _settle()
+        assert dispatcher.depth == 8
+        assert dispatcher.dropped == 0
+        gate.set()
+        while dispatcher.processed < 9:
+            await asyncio.sleep(0.001)
+        await dispatcher.stop()
+        return handled
+
+    assert asyncio.run(run()) == [str(seq) for seq in range(9)]
+
+
+def test_drop_oldest_prefers_meta_then_largest_shard():
+    async def run():
+        gate = asyncio.Event()
+        handled = []
+
+        async def handler(data):
+            await gate.wait()
+            handled.append(data["id"])
+
+        logger = _Logger()
+        dispatcher = EventDispatcher(handler, workers=1, queue_size=3, logger=logger)
+        await dispatcher.submit(_message("busy"))
+        await _settle()
+        for item in (_message(1), _meta(1), _message(2)):
+            await dispatcher.submit(item)
+        # 队列已满：先丢元事件，再丢最早的普通事件
+        await dispatcher.submit(_message(3))
+        assert dispatcher.dropped == 1
+        assert dispatcher.dropped_events == 0
+        await dispatcher.submit(_message(4))
+        assert dispatcher.dropped == 2
+        assert dispatcher.dropped_events == 1
+        assert len(logger.warnings) == 1
+        gate.set()
+        while dispatcher.depth:
+            await asyncio.sleep(0.001)
+        await _settle()
+        await dispatcher.stop()
+        return handled
+
+    assert asyncio.run(run()) == ["busy", "2", "3", "4"]
+
+
+def test_drop_new_counts_dropped_events():
+    async def run():
+        gate = asyncio.Event()
+
+        async def handler(data):
+            await gate.wait()
+
+        dispatcher = EventDispatcher(handler, workers=1, queue_size=2, overflow="drop_new")
+        for seq in range(5):
+            await dispatcher.submit(_message(seq, group=str(seq)))
+            await _settle()
+        await dispatcher.submit(_meta(0))
+        stats = dispatcher.stats()
+        gate.set()
+        await dispatcher.stop()
+        return stats
+
+    stats = asyncio.run(run())
+    # worker 取走一条，队列再容纳两条，其余两条消息与元事件被丢弃，元事件不计入 dropped_events
+    assert stats["depth"] == 2
+    assert stats["dropped"] == 3
+    assert stats["dropped_events"] == 2
+
+
+def test_block_waits_for_capacity():
+    async def run():
+        gate = asyncio.Event()
+
+        async def handler(data):
+            await gate.wait()
+
+        dispatcher = EventDispatcher(handler, workers=1, queue_size=1, overflow="block")
+        await dispatcher.submit(_message(0))
+        await _settle()
+        await dispatcher.submit(_message(1))
+        blocked = asyncio.ensure_future(dispatcher.submit(_message(2)))
+        await _settle()
+        assert not blocked.done()
+        gate.set()
+        await asyncio.wait_for(blocked, 1)
+        stats = dispatcher.stats()
+        await dispatcher.stop()
+        return stats
+
+    assert asyncio.run(run())["dropped"] == 0
+
+
+def test_handler_error_is_logged_and_worker_continues():
+    async def run():
+        handled = []
+
+        async def handler(data):
+            if data["id"] == "0":
+                raise RuntimeError("boom")
+            handled.append(data["id"])
+
+        logger = _Logger()
+        dispatcher = EventDispatcher(handler, workers=1, logger=logger)
+        await dispatcher.submit(_message(0))
+        await dispatcher.submit(_message(1))
+        while dispatcher.processed < 2:
+            await asyncio.sleep(0.001)
+        await dispatcher.stop()
+        return handled, logger.errors
+
+    handled, errors = asyncio.run(run())
+    assert handled == ["1"]
+    assert errors and "boom" in errors[0]
+
+
+def test_unknown_overflow_policy():
+    async def handler(data):
+        pass
+
+    with pytest.raises(ValueError):
+        EventDispatcher(handler, overflow="spill")
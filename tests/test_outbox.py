@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from OneBot12Adapter.Outbox import Outbox
+
+
+def _rows(outbox):
+    return {
+        row[0]: row[1:]
+        for row in outbox._db.execute("SELECT id, status, attempts, next_at, last_error FROM outbox")
+    }
+
+
+def test_enqueue_deduplicates_by_key(tmp_path):
+    async def run():
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        first = await outbox.enqueue("main", "{}", key="k1")
+        again, other = await asyncio.gather(
+            outbox.enqueue("main", "{}", key="k1"), outbox.enqueue("other", "{}", key="k1")
+        )
+        stats = outbox.stats("main")
+        outbox.close()
+        return first, again, other, stats
+
+    first, again, other, stats = asyncio.run(run())
+    assert first[2] and not again[2] and other[2]
+    assert again[0] == first[0] and other[0] != first[0]
+    assert stats["depth"] == 1 and stats["duplicates"] == 1
+
+
+def test_retry_dead_and_defer(tmp_path):
+    async def run():
+        outbox = Outbox(str(tmp_path / "outbox.db"))
+        ids = [(await outbox.enqueue("main", f'{{"n": {n}}}'))[0] for n in range(4)]
+        due = await outbox.due("main")
+        later = time.time() + 60
+        await outbox.settle(
+            "main",
+            sent=[ids[0]],
+            retry=[(ids[1], later, "33000 busy")],
+            dead=[(ids[2], "10003 bad")],
+            defer=[(ids[3], later)],
+        )
+        rows = _rows(outbox)
+        remaining = await outbox.due("main")
+        next_due = await outbox.next_due("main")
+        stats = outbox.stats("main")
+        outbox.close()
+        return ids, due, rows, remaining, next_due, stats, later
+
+    ids, due, rows, remaining, next_due, stats, later = asyncio.run(run())
+    assert [entry.id for entry in due] == ids
+    assert rows[ids[0]][:2] == ("sent", 1)
+    assert rows[ids[1]] == ("pending", 1, later, "33000 busy")
+    assert rows[ids[2]][:2] == ("dead", 1) and rows[ids[2]][3] == "10003 bad"
+    # 推迟只改下次发送时间，不计尝试次数
+    assert rows[ids[3]][:3] == ("pending", 0, later)
+    assert remaining == []
+    assert next_due == later
+    assert stats["depth"] == 2
+    assert (stats["delivered"], stats["retried"], stats["dead"]) == (1, 1, 1)
+
+
+def test_pending_entries_survive_reopen(tmp_path):
+    path = str(tmp_path / "outbox.db")
+
+    async def enqueue():
+        outbox = Outbox(path)
+        await outbox.enqueue("main", '{"n": 1}', key="k1")
+        outbox.close()
+
+    async def reopen():
+        outbox = Outbox(path)
+        depth = outbox.depth("main")
+        due = await outbox.due("main")
+        outbox.close()
+        return depth, due
+
+    asyncio.run(enqueue())
+    depth, due = asyncio.run(reopen())
+    assert depth == 1
+    assert [(entry.key, entry.payload, entry.attempts) for entry in due] == [("k1", '{"n": 1}', 0)]
+
+
+def test_prune_removes_expired_sent_and_dead_rows(tmp_path):
+    async def run():
+        outbox = Outbox(str(tmp_path / "outbox.db"), keep=100, keep_dead=1000)
+        ids = [(await outbox.enqueue("main", "{}"))[0] for _ in range(5)]
+        await outbox.settle("main", [ids[0], ids[1]], [], [(ids[2], "x"), (ids[3], "x")])
+        now = time.time()
+        for entry_id, age in ((ids[0], 200), (ids[1], 50), (ids[2], 500), (ids[3], 2000)):
+            outbox._db.execute(
+                "UPDATE outbox SET updated_at = ? WHERE id = ?", (now - age, entry_id)
+            )
+        outbox._pruned_at = 0.0
+        await outbox.settle("main", [], [], [])
+        remaining = sorted(_rows(outbox))
+        outbox.close()
+        return ids, remaining
+
+    ids, remaining = asyncio.run(run())
+    # 过期的已送达行（keep）与过期的失败行（keep_dead）被清理，待发送行不受影响
+    assert remaining == [ids[1], ids[2], ids[4]]